@@ -1,14 +1,191 @@
 # ExtendedSelenium.py
 from RPA.Browser.Selenium import Selenium
-from selenium.webdriver.chrome.service import Service as ChromeService
-from webdriver_manager.chrome import ChromeDriverManager
 from SeleniumLibrary.base import keyword
-from RPA.Excel.Files import Files
-import re
+from SeleniumLibrary.errors import NoOpenBrowser
 import os
+import base64
+import json
 import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from urllib.parse import urlencode, urljoin
+from selenium.webdriver.chrome.options import Options as ChromeOptions
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from category_cache import CategoryCache
+from dates import DateNormalizer, as_utc
+from driver_resolver import get_chrome_service
+from image_cache import ImageCache
+from image_downloader import ImageDownloader
+from profiler import RunProfiler
+from resources import process_tree_rss
+from seen_index import SeenArticleIndex
+from sinks import open_sink, sink_type_of
+from text_analytics import MONEY_PATTERN, TextAnalyzer
+
+# Pulls every article on the results page in a single WebDriver round trip.
+# The image element itself is returned as well so callers can still capture it.
+BULK_EXTRACT_ARTICLES_JS = """
+var container = document.querySelector('.SearchResultsModule-results .PageList-items');
+if (!container) { return null; }
+var items = container.querySelectorAll('.PageList-items-item');
+return Array.prototype.map.call(items, function (item) {
+    function text(selector) {
+        var el = item.querySelector(selector);
+        return el ? el.innerText.trim() : null;
+    }
+    // Lazy-loaded images carry a data: placeholder until they scroll into view
+    function realSource(img) {
+        var sources = [img.currentSrc, img.getAttribute('src'), img.getAttribute('data-src')];
+        for (var i = 0; i < sources.length; i++) {
+            if (sources[i] && sources[i].indexOf('data:') !== 0) { return sources[i]; }
+        }
+        return null;
+    }
+    var img = item.querySelector('.PagePromo-media img');
+    var link = item.querySelector('.PagePromo-title a');
+    return {
+        title: text('.PagePromo-title span'),
+        date: text('.PagePromo-date span'),
+        description: text('.PagePromo-description span'),
+        url: link ? link.href : null,
+        image_src: img ? realSource(img) : null,
+        image_srcset: img ? img.getAttribute('srcset') : null,
+        image_element: img,
+        base_url: document.baseURI
+    };
+});
+"""
+
+NEXT_PAGE_URL_JS = """
+var link = document.querySelector('.Pagination-nextPage a, a.Pagination-nextPage');
+return link ? link.href : null;
+"""
+
+# Reads the result count and filter state of a results page in one round trip.
+# arguments[0] is the value of the category checkbox that should be checked.
+SEARCH_STATE_JS = """
+var select = document.querySelector('select[name="s"]');
+var checkbox = arguments[0]
+    ? document.querySelector('input[value="' + arguments[0] + '"]') : null;
+return {
+    results: document.querySelectorAll(
+        '.SearchResultsModule-results .PageList-items-item').length,
+    category_checked: checkbox ? checkbox.checked : false,
+    sort: select ? select.value : null
+};
+"""
+
+# Reads the value and label of every category checkbox of the search filter, hidden
+# ones included, so the filter does not need to be opened.
+CATEGORY_DISCOVERY_JS = """
+var categories = {};
+document.querySelectorAll('.SearchFilter input[value]').forEach(function (input) {
+    var label = input.closest('label')
+        || (input.id && document.querySelector('label[for="' + CSS.escape(input.id) + '"]'));
+    var name = (label ? label.textContent : input.getAttribute('aria-label') || '')
+        .replace(/\\s+/g, ' ').trim();
+    if (name) { categories[name] = input.value; }
+});
+return categories;
+"""
+
+# Known overlays, as the selector of the overlay and the locator of its close button
+POPUP_CLOSERS = [
+    ("#Close", "id:Close"),
+    ('a[onclick="closeLightbox()"]', 'xpath://a[@onclick="closeLightbox()"]'),
+    ("div.fancybox-overlay-fixed", "css:a.fancybox-close"),
+    ('button[aria-label="Close"]', 'css:button[aria-label="Close"]'),
+]
+
+# Installs a MutationObserver that marks the popup state as stale whenever the DOM
+# changes and records when a known overlay appears. Installing twice is a no-op, so
+# the same script is registered for every new document and prepended to the check.
+POPUP_WATCHER_JS = """
+(function () {
+    if (window.__popupWatcher) { return; }
+    var selectors = %s;
+    var watcher = window.__popupWatcher = {open: [], stale: true, appeared: []};
+    function visible(element) {
+        return !!(element && (element.offsetWidth || element.offsetHeight
+                              || element.getClientRects().length));
+    }
+    watcher.scan = function () {
+        var open = [];
+        for (var i = 0; i < selectors.length; i++) {
+            if (visible(document.querySelector(selectors[i]))) {
+                if (watcher.open.indexOf(i) < 0) { watcher.appeared.push([i, Date.now()]); }
+                open.push(i);
+            }
+        }
+        watcher.open = open;
+        watcher.stale = false;
+        return open;
+    };
+    var timer = null;
+    new MutationObserver(function () {
+        watcher.stale = true;
+        if (timer === null) {
+            timer = setTimeout(function () { timer = null; watcher.scan(); }, 100);
+        }
+    }).observe(document, {childList: true, subtree: true, attributes: true,
+                          attributeFilter: ['style', 'class', 'hidden', 'open']});
+})();
+""" % json.dumps([selector for selector, _ in POPUP_CLOSERS])
+
+# Returns the indexes in ``POPUP_CLOSERS`` of the overlays currently shown
+POPUP_CHECK_JS = POPUP_WATCHER_JS + """
+var watcher = window.__popupWatcher;
+return watcher.stale ? watcher.scan() : watcher.open;
+"""
+
+# Query string parameter of the search page's category filter
+SEARCH_CATEGORY_PARAM = "f2"
+
+# Value of the sort dropdown for "Newest"
+SORT_NEWEST = "3"
+
+NAVIGATION_MODES = ("direct", "click")
+
+NEWS_DATA_HEADER = ["Title", "Date", "Description", "Image Filename",
+                    "Search Phrases Count", "Contains Money"]
+
+# Third-party requests the automation never needs: ads, analytics, web fonts and media
+DEFAULT_BLOCKED_URL_PATTERNS = [
+    "*doubleclick.net*", "*googlesyndication.com*", "*googletagmanager.com*",
+    "*google-analytics.com*", "*amazon-adsystem.com*", "*scorecardresearch.com*",
+    "*chartbeat.com*", "*taboola.com*", "*outbrain.com*", "*connatix.com*",
+    "*fonts.googleapis.com*", "*fonts.gstatic.com*", "*.woff", "*.woff2",
+    "*.mp4", "*.m3u8", "*.webm",
+]
+
+# Chrome features a headless scraping session has no use for
+FAST_PROFILE_ARGUMENTS = [
+    "--disable-extensions", "--disable-background-networking", "--disable-sync",
+    "--disable-default-apps", "--disable-notifications", "--disable-component-update",
+    "--mute-audio", "--no-first-run",
+    "--disable-features=Translate,MediaRouter,OptimizationHints,AutofillServerCommunication",
+]
+
+SCREENSHOT_POLICIES = ("off", "on-failure", "key-steps", "all")
+
+# Number of result elements the per-element extraction holds handles to at a time
+ELEMENT_CHUNK_SIZE = 10
+
+COUNT_ARTICLES_JS = "return arguments[0].querySelectorAll('.PageList-items-item').length;"
+
+# arguments: the results list element, and the start and end of the chunk
+ARTICLE_CHUNK_JS = """
+return Array.prototype.slice.call(
+    arguments[0].querySelectorAll('.PageList-items-item'), arguments[1], arguments[2]);
+"""
+
+# Waiting keywords whose time is recorded by the run profiler
+PROFILED_WAITS = ("wait_until_element_is_visible", "wait_until_page_contains_element",
+                  "wait_until_element_is_interactable")
 
 class ExtendedSelenium(Selenium):
     """
@@ -18,36 +195,336 @@ class ExtendedSelenium(Selenium):
     additional methods to handle work items and custom interactions.
     """
 
-    def __init__(self, work_item, *args, **kwargs):
+    def __init__(self, work_item, *args, output_dir="output", attachment_flush_threshold=None,
+                 screenshot_policy=None, async_screenshots=None, fast_profile=None,
+                 blocked_url_patterns=None, skip_images=None, output_format=None,
+                 phrase_whole_words=None, seen_index_path=None, seen_stop_after=None,
+                 popup_watcher=None, memory_limit_mb=None, category_cache_path=None,
+                 **kwargs):
         """
         Initialize the ExtendedSelenium instance.
 
         Args:
             work_item (WorkItems): The work item object for handling RPA tasks.
+            output_dir (str): The directory where screenshots, images and the Excel
+                file are written.
+            attachment_flush_threshold (int): Number of staged attachments that triggers
+                a flush. Defaults to the ``ATTACHMENT_FLUSH_THRESHOLD`` env variable;
+                0 means attachments are only flushed explicitly.
+            screenshot_policy (str): Which screenshots to take, one of
+                ``SCREENSHOT_POLICIES``. Defaults to the ``SCREENSHOT_POLICY`` env
+                variable, or "all".
+            async_screenshots (bool): Decode, write and stage screenshots on a
+                background thread. Defaults to the ``SCREENSHOT_ASYNC`` env variable.
+            fast_profile (bool): Open the browser with the lightweight profile, see
+                ``open_fast_browser``. Defaults to the ``FAST_BROWSER_PROFILE`` env
+                variable.
+            blocked_url_patterns (list): URL patterns blocked by the fast profile.
+                Defaults to the comma separated ``BLOCKED_URL_PATTERNS`` env variable,
+                or ``DEFAULT_BLOCKED_URL_PATTERNS``.
+            skip_images (bool): Do not load images with the fast profile. Defaults to
+                the ``FAST_PROFILE_SKIP_IMAGES`` env variable.
+            output_format (str): The format of the extracted data file, "xlsx", "csv"
+                or "parquet". Defaults to the ``OUTPUT_FORMAT`` env variable, or "xlsx".
+            phrase_whole_words (bool): Only count search phrases that are not part of
+                a longer word. Defaults to the ``PHRASE_WHOLE_WORDS`` env variable.
+            seen_index_path (str): The SQLite file of the seen-article index, which
+                enables incremental extraction, see ``filter_unseen_records``. Defaults
+                to the ``SEEN_INDEX_PATH`` env variable; incremental extraction is off
+                when neither is set. Entries expire after ``SEEN_INDEX_TTL_DAYS`` days.
+            seen_stop_after (int): Number of consecutive already seen articles after
+                which paging stops. Defaults to the ``SEEN_STOP_AFTER`` env variable,
+                or 10.
+            popup_watcher (bool): Let an in-page watcher report popups instead of
+                polling for each of them, see ``close_all_popups``. Defaults to the
+                ``POPUP_WATCHER`` env variable, or True.
+            memory_limit_mb (int): Browser memory use, in MB, above which the next
+                results page is loaded in a fresh tab or browser, see
+                ``relieve_memory_pressure``. Defaults to the ``BROWSER_MEMORY_LIMIT_MB``
+                env variable; 0 means no limit. The memory of the process tree is also
+                sampled every ``MEMORY_SAMPLE_INTERVAL`` seconds (0 turns it off) to
+                log the peak memory of each step.
+            category_cache_path (str): The JSON file caching the discovered category
+                values, see ``discover_categories``. Defaults to the
+                ``CATEGORY_CACHE_PATH`` env variable, or
+                ``~/.cache/news-categories/categories.json``, which all fan-out workers
+                and runs share. Entries are rediscovered after
+                ``CATEGORY_CACHE_TTL_HOURS`` hours.
         """
         super().__init__(*args, **kwargs)
-        self.service = ChromeService(ChromeDriverManager().install())
+        self.service = get_chrome_service()
         self.work_item = work_item
+        self.output_dir = output_dir
+        if attachment_flush_threshold is None:
+            attachment_flush_threshold = int(os.getenv("ATTACHMENT_FLUSH_THRESHOLD", "0"))
+        self.attachment_flush_threshold = attachment_flush_threshold
+        self.pending_attachments = []
+        self._attachments_lock = threading.Lock()
+        self.set_screenshot_policy(
+            screenshot_policy or os.getenv("SCREENSHOT_POLICY", "all"))
+        if async_screenshots is None:
+            async_screenshots = os.getenv("SCREENSHOT_ASYNC", "false").lower() == "true"
+        self.async_screenshots = async_screenshots
+        self._screenshot_writer = ThreadPoolExecutor(max_workers=1)
+        self._pending_screenshots = []
+        # The browser thread queues screenshots while another thread may be flushing
+        self._screenshots_lock = threading.Lock()
+        image_cache = ImageCache(
+            cache_dir=os.path.expanduser(
+                os.getenv("IMAGE_CACHE_DIR", "~/.cache/news-images")),
+            max_bytes=int(os.getenv("IMAGE_CACHE_MAX_MB", "200")) * 1024 * 1024)
+        self.image_downloader = ImageDownloader(output_dir=output_dir, cache=image_cache)
+        if fast_profile is None:
+            fast_profile = os.getenv("FAST_BROWSER_PROFILE", "false").lower() == "true"
+        self.fast_profile = fast_profile
+        if blocked_url_patterns is None:
+            blocked_url_patterns = [
+                pattern.strip() for pattern in os.getenv("BLOCKED_URL_PATTERNS", "").split(",")
+                if pattern.strip()
+            ] or DEFAULT_BLOCKED_URL_PATTERNS
+        self.blocked_url_patterns = blocked_url_patterns
+        if skip_images is None:
+            skip_images = os.getenv("FAST_PROFILE_SKIP_IMAGES", "false").lower() == "true"
+        self.skip_images = skip_images
+        self.output_format = output_format or os.getenv("OUTPUT_FORMAT", "xlsx")
+        if phrase_whole_words is None:
+            phrase_whole_words = os.getenv("PHRASE_WHOLE_WORDS", "false").lower() == "true"
+        self.phrase_whole_words = phrase_whole_words
+        seen_index_path = seen_index_path or os.getenv("SEEN_INDEX_PATH")
+        self.seen_index = SeenArticleIndex(
+            os.path.expanduser(seen_index_path),
+            ttl_days=float(os.getenv("SEEN_INDEX_TTL_DAYS", "30"))) if seen_index_path else None
+        if seen_stop_after is None:
+            seen_stop_after = int(os.getenv("SEEN_STOP_AFTER", "10"))
+        self.seen_stop_after = seen_stop_after
+        # Relative dates are resolved against the start of the run, see ``start_run``
+        self.date_normalizer = DateNormalizer()
+        # Progress of the current run for a retry to resume from, see ``use_checkpoint``
+        self.checkpoint = None
+        if popup_watcher is None:
+            popup_watcher = os.getenv("POPUP_WATCHER", "true").lower() == "true"
+        self.popup_watcher = popup_watcher
+        self.popup_stats = {"checks": 0, "dismissed": 0, "commands": 0}
+        self.category_cache = CategoryCache(
+            os.path.expanduser(category_cache_path or os.getenv(
+                "CATEGORY_CACHE_PATH", "~/.cache/news-categories/categories.json")),
+            ttl_hours=float(os.getenv("CATEGORY_CACHE_TTL_HOURS", "24")))
+        self.categories = None
+        # Time the known categories were discovered, to apply the cache TTL to them
+        self.categories_discovered = None
+        if memory_limit_mb is None:
+            memory_limit_mb = int(os.getenv("BROWSER_MEMORY_LIMIT_MB", "0"))
+        self.memory_limit_bytes = memory_limit_mb * 1024 * 1024
+        sample_interval = float(os.getenv("MEMORY_SAMPLE_INTERVAL", "0.5"))
+        self.profiler = RunProfiler(
+            memory_sampler=(lambda: process_tree_rss(os.getpid())) if sample_interval else None,
+            sample_interval=sample_interval)
+        self._instrument_keywords()
+
+    def _instrument_keywords(self):
+        """
+        Record every keyword of this class as a step, and the waiting keywords as
+        waits, in ``profiler``.
+        """
+        for name, member in vars(ExtendedSelenium).items():
+            if callable(member) and hasattr(member, "robot_name"):
+                setattr(self, name, self.profiler.profiled(name, getattr(self, name)))
+        for name in PROFILED_WAITS:
+            setattr(self, name, self.profiler.profiled_wait(name, getattr(self, name)))
+
+    def set_output_dir(self, output_dir):
+        """
+        Change the directory where screenshots, images and the Excel file are written.
+
+        Args:
+            output_dir (str): The new output directory.
+        """
+        self.output_dir = output_dir
+        self.image_downloader.output_dir = output_dir
+
+    def output_path(self, filename):
+        """
+        Build the path of an output file.
+
+        Args:
+            filename (str): The name of the file.
+
+        Returns:
+            str: The path of the file inside the output directory.
+        """
+        return os.path.join(self.output_dir, filename)
+
+    @keyword
+    def set_screenshot_policy(self, policy):
+        """
+        Set which screenshots are taken.
+
+        Args:
+            policy (str): "off", "on-failure" (only when a step fails), "key-steps"
+                (the main steps and failures) or "all" (every debugging step).
+
+        Raises:
+            ValueError: If the policy is unknown.
+        """
+        policy = policy.strip().lower()
+        if policy not in SCREENSHOT_POLICIES:
+            raise ValueError(
+                f"Unknown screenshot policy '{policy}', expected one of {SCREENSHOT_POLICIES}")
+        self.screenshot_policy = policy
+
+    def should_take_screenshot(self, key_step=False, failure=False):
+        """
+        Check the screenshot policy for a screenshot.
+
+        Args:
+            key_step (bool): Whether the screenshot documents a main step of the flow.
+            failure (bool): Whether the screenshot documents a failure.
+
+        Returns:
+            bool: True if the screenshot should be taken.
+        """
+        if self.screenshot_policy == "all":
+            return True
+        if self.screenshot_policy == "key-steps":
+            return key_step or failure
+        if self.screenshot_policy == "on-failure":
+            return failure
+        return False
 
     @keyword
-    def save_screenshot_to_work_item(self, filename):
+    def save_screenshot_to_work_item(self, filename, key_step=False, failure=False):
         """
         Capture a screenshot and save it to the work item.
 
+        The screenshot is skipped if the screenshot policy does not ask for it. With
+        asynchronous screenshots, only the capture itself blocks the browser; decoding,
+        writing and staging the file happen on a background thread.
+
         Args:
             filename (str): The path where the screenshot will be saved.
+            key_step (bool): Whether the screenshot documents a main step of the flow.
+            failure (bool): Whether the screenshot documents a failure.
 
         Raises:
             Exception: If there is an error capturing the screenshot.
         """
+        if not self.should_take_screenshot(key_step=key_step, failure=failure):
+            return
         try:
+            if self.async_screenshots:
+                encoded_png = self.driver.get_screenshot_as_base64()
+                with self._screenshots_lock:
+                    self._pending_screenshots.append(self._screenshot_writer.submit(
+                        self._write_screenshot, filename, encoded_png))
+                return
             self.screenshot(filename=filename)
-            self.work_item.add_work_item_file(path=filename)
-            self.work_item.save_work_item()
-            logging.info(f"Screenshot saved and added to work item: {filename}")
+            self.stage_work_item_file(filename)
+            logging.info(f"Screenshot saved and staged for the work item: {filename}")
         except Exception as e:
             logging.error(f"Failed to save screenshot to work item: {e}")
 
+    def _write_screenshot(self, filename, encoded_png):
+        """
+        Decode, write and stage a captured screenshot.
+
+        Args:
+            filename (str): The path where the screenshot will be saved.
+            encoded_png (str): The base64 encoded PNG returned by the driver.
+        """
+        try:
+            os.makedirs(os.path.dirname(filename) or ".", exist_ok=True)
+            with open(filename, "wb") as screenshot_file:
+                screenshot_file.write(base64.b64decode(encoded_png))
+            # A flush waits for this thread, so leave flushing to the browser thread
+            self.stage_work_item_file(filename, auto_flush=False)
+            logging.info(f"Screenshot saved and staged for the work item: {filename}")
+        except Exception as e:
+            logging.error(f"Failed to save screenshot to work item: {e}")
+
+    def wait_for_screenshots(self):
+        """
+        Wait until the screenshots handed to the background thread so far are written.
+
+        Screenshots queued while waiting, e.g. by the browser thread of a
+        ``SearchPipeline``, are left for the next call.
+        """
+        with self._screenshots_lock:
+            pending, self._pending_screenshots = self._pending_screenshots, []
+        for future in pending:
+            future.result()
+
+    def stage_work_item_file(self, path, auto_flush=True):
+        """
+        Stage a file to be attached to the work item on the next flush.
+
+        Staging the same path twice only attaches it once. When the number of staged
+        files reaches ``attachment_flush_threshold``, they are flushed right away.
+
+        Args:
+            path (str): The path of the file to attach.
+            auto_flush (bool): Whether reaching the threshold triggers a flush.
+        """
+        with self._attachments_lock:
+            if path not in self.pending_attachments:
+                self.pending_attachments.append(path)
+            if self.checkpoint is not None and path != self.checkpoint.path:
+                self.checkpoint.record_file(path)
+            should_flush = (auto_flush and self.work_item is not None
+                            and self.attachment_flush_threshold
+                            and len(self.pending_attachments) >= self.attachment_flush_threshold)
+        if should_flush:
+            self.flush_work_item_files()
+
+    @keyword
+    def flush_work_item_files(self):
+        """
+        Attach all staged files to the work item and save it once.
+
+        Screenshots still being written in the background are waited for first. The
+        staged files are taken off the list under the lock and uploaded outside it, so
+        threads staging new files are not blocked by the upload. Files that no longer
+        exist are skipped.
+
+        Returns:
+            int: The number of files attached.
+
+        Raises:
+            Exception: If the work item cannot be saved; the files are staged again,
+                see ``discard_work_item_files``.
+        """
+        self.wait_for_screenshots()
+        with self._attachments_lock:
+            staged, self.pending_attachments = self.pending_attachments, []
+        if not staged:
+            return 0
+        paths = [path for path in staged if os.path.exists(path)]
+        try:
+            for path in paths:
+                self.work_item.add_work_item_file(path=path)
+            self.work_item.save_work_item()
+        except Exception:
+            with self._attachments_lock:
+                self.pending_attachments = staged + [
+                    path for path in self.pending_attachments if path not in staged]
+            raise
+        logging.info(f"Flushed {len(paths)} files to the work item in one save")
+        return len(paths)
+
+    def discard_work_item_files(self):
+        """
+        Drop the staged files without attaching them, e.g. once their work item is
+        released, so they are not attached to the next one.
+
+        Returns:
+            int: The number of files dropped.
+        """
+        self.wait_for_screenshots()
+        with self._attachments_lock:
+            staged, self.pending_attachments = self.pending_attachments, []
+        if staged:
+            logging.warning(f"Dropped {len(staged)} staged files that were not attached")
+        return len(staged)
+
     @keyword
     def accept_cookies(self):
         """
@@ -67,25 +544,162 @@ class ExtendedSelenium(Selenium):
             logging.warning(f"Failed to accept cookies: {e}")
 
 
+    def has_open_browser(self):
+        """
+        Check whether a browser is currently open.
+
+        Returns:
+            bool: True if there is an active browser.
+        """
+        try:
+            return self.driver is not None
+        except NoOpenBrowser:
+            return False
+
     @keyword
     def open_site(self, url):
         """
         Open a website using a headless Chrome browser and save a screenshot.
 
+        A browser that is already open (a warm session from the pool) is reused and
+        only navigated to the URL if it is not there yet.
+
         Args:
             url (str): The URL of the website to be opened.
         """
         logging.info(f"Opening URL: {url}")
         try:
-            self.open_chrome_browser(url=url, headless=True)
-            self.go_to(url=url)
+            if not self.has_open_browser():
+                self.open_browser_for(url)
+                self.go_to(url=url)
+            elif self.driver.current_url != url:
+                self.go_to(url=url)
             # Wait until the page is loaded by checking for a common element or condition
             self.wait_until_page_contains_element('css:body', timeout=10)
             self.save_screenshot_to_work_item(
-                filename="output/step_0-1_opened_site.png")
+                filename=self.output_path("step_0-1_opened_site.png"), key_step=True)
         except Exception as e:
             logging.error(f"Failed to open site {url}: {e}")
+            self.save_screenshot_to_work_item(
+                filename=self.output_path("failure_open_site.png"), failure=True)
+
+
+    def open_browser_for(self, url):
+        """
+        Open the headless browser, with the fast profile if it is enabled.
+
+        Args:
+            url (str): The URL the browser is being opened for.
+        """
+        if self.fast_profile:
+            self.open_fast_browser()
+        else:
+            self.open_chrome_browser(url=url, headless=True)
+        self.profiler.instrument_driver(self.driver)
+        if self.popup_watcher:
+            self.install_popup_watcher()
+
+    def install_popup_watcher(self):
+        """
+        Register the popup watcher for every document the browser loads.
+
+        The watcher is added through CDP ``Page.addScriptToEvaluateOnNewDocument``, so it
+        observes the page from the start of its load. Without CDP the first popup check
+        on each page installs it instead.
+        """
+        try:
+            self.driver.execute_cdp_cmd(
+                "Page.addScriptToEvaluateOnNewDocument", {"source": POPUP_WATCHER_JS})
+            self.driver.execute_script(POPUP_WATCHER_JS)
+        except Exception as e:
+            logging.warning(f"Failed to register the popup watcher, installing it lazily: {e}")
+
+    def open_fast_browser(self):
+        """
+        Open a headless Chrome with a lightweight profile.
+
+        The page load strategy is "eager", so navigation returns once the DOM is ready
+        instead of waiting for every subresource. Unneeded Chrome features are turned
+        off, requests matching ``blocked_url_patterns`` are blocked through CDP
+        ``Network.setBlockedURLs`` and, with ``skip_images``, images are not loaded at
+        all (the image stage downloads them from their URLs anyway).
+
+        The browser is opened on a blank page so the blocking is in place before the
+        first real navigation.
+        """
+        options = ChromeOptions()
+        options.page_load_strategy = "eager"
+        for argument in FAST_PROFILE_ARGUMENTS:
+            options.add_argument(argument)
+        preferences = {}
+        if self.skip_images:
+            preferences["profile.managed_default_content_settings.images"] = 2
+        self.open_available_browser(
+            browser_selection="Chrome", headless=True, options=options,
+            preferences=preferences)
+        self.apply_url_blocking()
+        logging.info(
+            f"Opened browser with the fast profile, blocking {len(self.blocked_url_patterns)} "
+            f"URL patterns{' and images' if self.skip_images else ''}.")
+
+    def apply_url_blocking(self):
+        """
+        Block the requests matching ``blocked_url_patterns`` in the current tab.
+        """
+        if self.blocked_url_patterns:
+            self.driver.execute_cdp_cmd("Network.enable", {})
+            self.driver.execute_cdp_cmd(
+                "Network.setBlockedURLs", {"urls": self.blocked_url_patterns})
+
+    def relieve_memory_pressure(self, next_url):
+        """
+        Load the next page in a fresh tab, or a fresh browser, if the browser uses more
+        memory than the limit.
 
+        Closing the old tab ends its renderer process with all the media and element
+        handles it accumulated. If the browser is still above the limit after that, it
+        is restarted. Either way the next page is loaded from its URL, so the search
+        state (query, category, sort and page) is kept.
+
+        Args:
+            next_url (str): The page to load next.
+
+        Returns:
+            bool: True if the page was loaded, False if the browser is within the limit
+            and the caller should load it.
+        """
+        if not self.memory_limit_bytes or not self.has_open_browser():
+            return False
+        memory_used = self.browser_rss()
+        if memory_used <= self.memory_limit_bytes:
+            return False
+        logging.warning(f"Browser uses {memory_used / 2 ** 20:.0f} MB, above the "
+                        f"{self.memory_limit_bytes / 2 ** 20:.0f} MB limit, "
+                        f"opening a fresh tab.")
+        try:
+            old_tab = self.driver.current_window_handle
+            self.driver.switch_to.new_window("tab")
+            new_tab = self.driver.current_window_handle
+            self.driver.switch_to.window(old_tab)
+            self.driver.close()
+            self.driver.switch_to.window(new_tab)
+            memory_used = self.browser_rss()
+        except Exception as e:
+            logging.warning(f"Failed to open a fresh tab: {e}")
+        if memory_used > self.memory_limit_bytes:
+            logging.warning(
+                f"Browser still uses {memory_used / 2 ** 20:.0f} MB, restarting it.")
+            self.close_all_browsers()
+            self.open_browser_for(next_url)
+        else:
+            # The CDP settings belong to the closed tab
+            if self.fast_profile:
+                self.apply_url_blocking()
+            if self.popup_watcher:
+                self.install_popup_watcher()
+        self.go_to(next_url)
+        logging.info(f"Browser memory after recovery: {self.browser_rss() / 2 ** 20:.0f} MB")
+        return True
 
     def click_element_with_retry(self, selector, retries=3):
         """
@@ -96,13 +710,18 @@ class ExtendedSelenium(Selenium):
             retries (int): Number of retry attempts if the click fails.
         """
         for attempt in range(retries):
+            attempt_started = time.perf_counter()
             try:
                 element = self.find_element(selector)
                 self.wait_until_element_is_interactable(element, timeout=10)
-                self.click_element(selector)
+                # Click the element found above instead of looking it up again
+                element.click()
                 logging.info(f"Clicked element: {selector}")
                 return
             except Exception as e:
+                self.profiler.record_wait(
+                    "click_element_with_retry", time.perf_counter() - attempt_started,
+                    retry=True)
                 logging.warning(f"Attempt {attempt + 1} failed to click element {selector}: {e}")
         logging.error(f"Failed to click element {selector} after {retries} attempts")
 
@@ -110,6 +729,45 @@ class ExtendedSelenium(Selenium):
 
 
     def close_all_popups(self):
+        """
+        Close the popups reported by the popup watcher.
+
+        A single script call asks the in-page watcher (see ``POPUP_WATCHER_JS``) which
+        of the ``POPUP_CLOSERS`` overlays are shown, and only those are dismissed. The
+        checks and the WebDriver commands they used are counted in ``popup_stats``.
+        Without the watcher, each overlay is looked for in turn.
+        """
+        if not self.popup_watcher:
+            self.close_all_popups_by_polling()
+            return
+        try:
+            with self.count_webdriver_commands() as commands:
+                open_popups = self.driver.execute_script(POPUP_CHECK_JS) or []
+            self.popup_stats["checks"] += 1
+            self.popup_stats["commands"] += commands["count"]
+            for index in open_popups:
+                self.click_element_with_retry(POPUP_CLOSERS[index][1])
+                self.popup_stats["dismissed"] += 1
+            if open_popups:
+                logging.info(f"Closed {len(open_popups)} popups reported by the watcher.")
+        except Exception as e:
+            logging.error(f"Failed to close popups reported by the watcher: {e}")
+
+    def log_popup_stats(self):
+        """
+        Log the popup checks of the run and the WebDriver commands the watcher saved.
+
+        Polling for every overlay costs at least one command per overlay and check, the
+        watcher one command per check. The counters are reset afterwards.
+        """
+        stats = self.popup_stats
+        saved = stats["checks"] * len(POPUP_CLOSERS) - stats["commands"]
+        logging.info(
+            f"Popup watcher: {stats['checks']} checks, {stats['dismissed']} popups "
+            f"dismissed, {saved} WebDriver commands saved")
+        self.popup_stats = {"checks": 0, "dismissed": 0, "commands": 0}
+
+    def close_all_popups_by_polling(self):
         """
         Close all detected popups using various strategies.
         """
@@ -144,14 +802,16 @@ class ExtendedSelenium(Selenium):
                 EC.element_to_be_clickable(('css selector', '.SearchOverlay-search-button'))
             )
             self.close_all_popups()
-            self.save_screenshot_to_work_item(filename="output/step_1-1_search-pre_click_search_button.png")
+            self.save_screenshot_to_work_item(filename=self.output_path("step_1-1_search-pre_click_search_button.png"))
             search_button.click()
             logging.info("Search button clicked")
         except Exception as e:
             logging.error("Search button not found or couldn't be clicked: %s", e)
+            self.save_screenshot_to_work_item(
+                filename=self.output_path("failure_click_search_button.png"), failure=True)
         finally:
             self.close_all_popups()
-            self.save_screenshot_to_work_item(filename="output/step_1-2_search-click_button.png")
+            self.save_screenshot_to_work_item(filename=self.output_path("step_1-2_search-click_button.png"))
 
     @keyword
     def type_and_submit_search_query(self, query):
@@ -171,28 +831,37 @@ class ExtendedSelenium(Selenium):
             self.input_text('css:input.SearchOverlay-search-input', query)
             logging.info(f"Typed '{query}' into the search input.")
             self.save_screenshot_to_work_item(
-                filename="output/step_2-1_search-typed_query.png")
+                filename=self.output_path("step_2-1_search-typed_query.png"))
             self.press_keys('css:input.SearchOverlay-search-input', 'ENTER')
             logging.info(f"Submitted '{query}' to the search input.")
             self.wait_until_element_is_visible(
                 'css:.SearchResultsModule', timeout=10)
             self.save_screenshot_to_work_item(
-                filename="output/step_2-2_search-after_submit.png")
+                filename=self.output_path("step_2-2_search-after_submit.png"), key_step=True)
         except Exception as e:
             logging.error(
                 f"Failed to type and submit search query '{query}': {e}")
+            self.save_screenshot_to_work_item(
+                filename=self.output_path("failure_search_query.png"), failure=True)
 
     @keyword
     def click_and_select_category(self, category_name):
         """
         Click the category filter dropdown and select a specific category.
 
+        The category values are discovered from the results page first, unless they
+        are cached, see ``discover_categories``.
+
         Args:
             category_name (str): The name of the category to be selected.
 
         Raises:
+            ValueError: If the category is not offered by the search filter.
             Exception: If the category dropdown cannot be clicked or the category cannot be selected.
         """
+        if not self.knows_category(category_name):
+            self.discover_categories()
+        category_value = self.get_category_value(category_name)
         try:
             self.wait_until_element_is_visible('css:.SearchFilter-heading', timeout=10)
             self.scroll_element_into_view('css:.SearchFilter-heading')
@@ -203,7 +872,7 @@ class ExtendedSelenium(Selenium):
                 try:
                     self.click_element_with_retry('css:.SearchFilter-heading')
                     logging.info("Category dropdown clicked")
-                    self.save_screenshot_to_work_item(filename="output/step_3-1_category-clicked.png")
+                    self.save_screenshot_to_work_item(filename=self.output_path("step_3-1_category-clicked.png"))
                 except Exception as e:
                     logging.error(f"Failed to click category: {e}")
                     return
@@ -218,7 +887,7 @@ class ExtendedSelenium(Selenium):
                     self.close_all_popups()
                     self.click_element_with_retry(see_all_button)
                     logging.info('"See All" button clicked')
-                    self.save_screenshot_to_work_item(filename="output/step_3-2_see_all_clicked.png")
+                    self.save_screenshot_to_work_item(filename=self.output_path("step_3-2_see_all_clicked.png"))
                 except Exception as e:
                     logging.error(f"Failed to click 'See All': {e}")
                     return
@@ -229,7 +898,6 @@ class ExtendedSelenium(Selenium):
             for attempt in range(3):  # Retry up to 3 times to handle potential staleness
                 try:
                     # Re-fetch the element each time to avoid stale element issues
-                    category_value = self.get_category_value(category_name)
                     category_checkbox = self.get_webelement(f'css:input[value="{category_value}"]')
                     self.scroll_element_into_view(category_checkbox)
                     self.wait_until_element_is_visible(category_checkbox, timeout=10)
@@ -244,7 +912,8 @@ class ExtendedSelenium(Selenium):
                     self.close_all_popups()
                     self.scroll_element_into_view(heading_element)
                     logging.info("Scrolled to dropdown")
-                    self.save_screenshot_to_work_item(filename=f"output/step_3-3_{category_name}_selected.png")
+                    self.save_screenshot_to_work_item(
+                        filename=self.output_path(f"step_3-3_{category_name}_selected.png"), key_step=True)
                     break  # Exit the loop if successful
                 except Exception as e:
                     logging.error(f"Failed to select category on attempt {attempt + 1}: {e}")
@@ -252,6 +921,8 @@ class ExtendedSelenium(Selenium):
                         raise
         except Exception as e:
             logging.error(f"Failed to interact with category filter: {e}")
+            self.save_screenshot_to_work_item(
+                filename=self.output_path("failure_select_category.png"), failure=True)
 
 
 
@@ -281,109 +952,857 @@ class ExtendedSelenium(Selenium):
             if "s=3" in current_url:
                 logging.info("Successfully sorted by 'Newest'")
                 self.close_all_popups()
-                self.save_screenshot_to_work_item(filename="output/step_4_sort_by_newest.png")
+                self.save_screenshot_to_work_item(
+                    filename=self.output_path("step_4_sort_by_newest.png"), key_step=True)
             else:
                 logging.warning("Failed to change sorting to 'Newest', refreshing the page...")
                 self.driver.refresh()
                 self.select_sort_by_newest()  # Recursion with refetched elements
         except Exception as e:
             logging.error(f"Failed to select 'Newest' in Sort by dropdown: {e}")
+            self.save_screenshot_to_work_item(
+                filename=self.output_path("failure_sort_by_newest.png"), failure=True)
 
 
     @keyword
-    def extract_news_data_and_store(self):
+    def run_news_search(self, home_url, search_phrase, news_category, max_pages=1,
+                        since=None, navigation=None, keep_rows=False):
+        """
+        Run the whole search flow, from opening the site to extracting the results.
+
+        Args:
+            home_url (str): The home page of the news website.
+            search_phrase (str): The phrase to search for.
+            news_category (str): The category to filter the results by.
+            max_pages (int): Maximum number of result pages to crawl.
+            since (datetime): Skip articles older than this.
+            navigation (str): "direct" to load the results URL at once, falling back to
+                the UI when the page does not match, or "click" to always go through
+                the UI. Defaults to the ``SEARCH_NAVIGATION`` env variable, or "direct".
+            keep_rows (bool): Return the extracted rows.
+
+        Returns:
+            list: The extracted rows, see ``extract_news_data_and_store``.
+
+        Raises:
+            ValueError: If the navigation mode is unknown.
+        """
+        first_page = self.reach_search_results(home_url, search_phrase, news_category, navigation)
+        rows = self.extract_news_data_and_store(
+            max_pages=max_pages, since=since, keep_rows=keep_rows,
+            search_phrases=[search_phrase], first_page=first_page)
+        if self.popup_watcher:
+            self.log_popup_stats()
+        return rows
+
+    def reach_search_results(self, home_url, search_phrase, news_category, navigation=None):
         """
-        Extract news data from the page and store it in an Excel file.
+        Load the sorted and filtered results page of a search.
+
+        With a resumable checkpoint, the results page the checkpoint stopped at is
+        loaded instead, see ``resume_search_results``.
+
+        Args:
+            home_url (str): The home page of the news website.
+            search_phrase (str): The phrase to search for.
+            news_category (str): The category to filter the results by.
+            navigation (str): "direct" or "click", see ``run_news_search``.
+
+        Returns:
+            int: The number of the loaded results page.
+
+        Raises:
+            ValueError: If the navigation mode is unknown.
+        """
+        navigation = navigation or os.getenv("SEARCH_NAVIGATION", "direct")
+        if navigation not in NAVIGATION_MODES:
+            raise ValueError(
+                f"Unknown navigation mode '{navigation}', expected one of {NAVIGATION_MODES}")
+        if self.checkpoint is not None and self.checkpoint.resumable:
+            return self.resume_search_results()
+        if navigation == "click" or not self.open_search_results(
+                home_url, search_phrase, news_category):
+            started = time.monotonic()
+            self.navigate_to_search_results(home_url, search_phrase, news_category)
+            logging.info(
+                f"Reached the results through the UI in {time.monotonic() - started:.1f}s")
+        return 1
+
+    def resume_search_results(self):
+        """
+        Load the last results page written by the run the checkpoint was saved for.
+
+        The page is read again, its articles already written are skipped by their
+        keys, see ``filter_checkpointed_records``, so articles pushed onto it since
+        are not lost.
+
+        Returns:
+            int: The number of the loaded results page.
+        """
+        checkpoint = self.checkpoint
+        logging.info(
+            f"Resuming at page {checkpoint.page} after {checkpoint.article} of its articles "
+            f"and {checkpoint.rows_written} rows in total: {checkpoint.page_url}")
+        if not self.has_open_browser():
+            self.open_browser_for(checkpoint.page_url)
+        self.go_to(checkpoint.page_url)
+        self.wait_until_page_contains_element('css:.SearchResultsModule', timeout=10)
+        return checkpoint.page
+
+    def use_checkpoint(self, checkpoint):
+        """
+        Save the progress of the next run to a checkpoint, resuming from it if it holds
+        the progress of an interrupted run.
+
+        The files staged by the interrupted run are staged again. If its output file
+        no longer holds the checkpointed rows, e.g. an Excel file of a run that was
+        killed before closing it, the run starts over.
+
+        Args:
+            checkpoint (RunCheckpoint): The checkpoint, or None to stop checkpointing.
+        """
+        self.checkpoint = checkpoint
+        if checkpoint is None:
+            return
+        if checkpoint.resumable and not sink_type_of(self.output_format).can_resume(
+                self.output_path("news_data"), checkpoint.sink_state):
+            logging.warning(
+                f"The output file of the checkpoint {checkpoint.path} cannot be resumed, "
+                f"starting over.")
+            checkpoint.reset()
+        for path in checkpoint.files:
+            if os.path.exists(path):
+                self.stage_work_item_file(path, auto_flush=False)
+
+    def open_news_data_sink(self):
+        """
+        Open the sink of the extracted data file, resuming the file of the run the
+        checkpoint was saved for, see ``RowSink.resume``.
+
+        Returns:
+            RowSink: The sink.
+        """
+        resume_state = None
+        if self.checkpoint is not None and self.checkpoint.resumable:
+            resume_state = self.checkpoint.sink_state
+        return open_sink(self.output_format, self.output_path("news_data"), NEWS_DATA_HEADER,
+                         resume_state=resume_state)
+
+    def navigate_to_search_results(self, home_url, search_phrase, news_category):
+        """
+        Reach the sorted and filtered results by clicking through the site's UI.
+
+        Args:
+            home_url (str): The home page of the news website.
+            search_phrase (str): The phrase to search for.
+            news_category (str): The category to filter the results by.
+        """
+        self.open_site(url=home_url)
+        self.accept_cookies()  # Accept the cookies if present
+        self.click_search_button()
+        self.type_and_submit_search_query(search_phrase)
+        self.click_and_select_category(news_category)
+        self.select_sort_by_newest()
+
+    def build_search_url(self, home_url, search_phrase, news_category):
+        """
+        Build the URL of the results page sorted by newest and filtered by category.
+
+        Args:
+            home_url (str): The home page of the news website.
+            search_phrase (str): The phrase to search for.
+            news_category (str): The category to filter the results by.
+
+        Returns:
+            str: The results page URL.
+        """
+        query = urlencode({
+            "q": search_phrase,
+            SEARCH_CATEGORY_PARAM: self.get_category_value(news_category),
+            "s": SORT_NEWEST,
+        })
+        return f"{urljoin(home_url, 'search')}?{query}"
+
+    @keyword
+    def open_search_results(self, home_url, search_phrase, news_category):
+        """
+        Load the sorted and filtered results page directly from its URL.
+
+        This replaces the search button, search input, category dropdown and sort
+        dropdown interactions with a single navigation. The page is then checked in one
+        script call: it must list results, have the category checkbox checked and be
+        sorted by newest. Unless the category values are cached, the unfiltered results
+        are loaded first to discover them, see ``discover_categories``. If the category
+        checkbox is not checked, the cached values are dropped and discovered again from
+        the loaded page, and the page is loaded once more if the value changed.
+
+        Args:
+            home_url (str): The home page of the news website.
+            search_phrase (str): The phrase to search for.
+            news_category (str): The category to filter the results by.
+
+        Returns:
+            bool: True if the loaded page matches, False if the UI path is needed.
+
+        Raises:
+            ValueError: If the category is not offered by the search filter.
+        """
+        started = time.monotonic()
+        if not self.knows_category(news_category):
+            try:
+                self.discover_categories_from(home_url, search_phrase)
+            except Exception as e:
+                logging.warning(f"Failed to discover the categories: {e}")
+                return False
+        for attempt in range(2):
+            category_value = self.get_category_value(news_category)
+            url = self.build_search_url(home_url, search_phrase, news_category)
+            logging.info(f"Opening search results directly: {url}")
+            try:
+                if not self.has_open_browser():
+                    self.open_browser_for(url)
+                self.go_to(url=url)
+                self.wait_until_page_contains_element('css:.SearchResultsModule', timeout=10)
+                state = self.driver.execute_script(SEARCH_STATE_JS, category_value)
+            except Exception as e:
+                logging.warning(f"Failed to open search results directly: {e}")
+                return False
+            if state["category_checked"] or attempt:
+                break
+            logging.warning(
+                f"The cached value '{category_value}' of the {news_category} category "
+                f"was not applied, discovering the categories again")
+            self.forget_categories()
+            try:
+                self.discover_categories()
+            except Exception as e:
+                logging.warning(f"Failed to discover the categories: {e}")
+                return False
+            if self.get_category_value(news_category) == category_value:
+                break
+        if not state["results"] or not state["category_checked"] or state["sort"] != SORT_NEWEST:
+            logging.warning(
+                f"Direct search results do not match ({state}), using the UI instead.")
+            return False
+        logging.info(
+            f"Opened {state['results']} search results directly in "
+            f"{time.monotonic() - started:.1f}s")
+        self.save_screenshot_to_work_item(
+            filename=self.output_path("step_4_sort_by_newest.png"), key_step=True)
+        return True
+
+    @keyword
+    def extract_news_data_and_store(self, bulk=True, max_pages=1, since=None, keep_rows=False,
+                                    search_phrases=None, first_page=1):
+        """
+        Extract news data from the results pages and store it in the output file.
 
         This method collects the title, date, description, image filename, and other details
-        from each news article on the page, and writes them to an Excel file.
+        from each news article, following the pagination up to ``max_pages`` pages. With a
+        seen-article index only the articles not extracted by earlier runs are kept, see
+        ``filter_unseen_records``. Images are downloaded and rows for a page are built on a
+        worker thread while the browser loads the next page, and each finished page is
+        written to the output sink right away (see ``sinks.open_sink``), so rows are not
+        accumulated in memory. After an error the sink is closed with the pages written so
+        far; only the CSV format also keeps them if the process dies. The output file and
+        the images are staged for the work item, see ``flush_work_item_files``. With a
+        checkpoint, see ``use_checkpoint``, the progress is saved after every page written.
+
+        Args:
+            bulk (bool): Read all articles with a single script call. When False, or if
+                the script call fails, each article is read element by element.
+            max_pages (int): Maximum number of result pages to crawl.
+            since (datetime): Skip articles older than this. With the "Newest" ordering
+                the crawl stops at the first older article.
+            keep_rows (bool): Also keep the rows in memory and return them. Rows
+                written before a resumed checkpoint are not returned.
+            search_phrases (list): The phrases counted in each article.
+            first_page (int): The number of the loaded results page, above 1 when a
+                checkpointed run is resumed.
+
+        Returns:
+            list: The extracted rows if ``keep_rows`` is set, otherwise an empty list.
 
         Raises:
-            Exception: If there is an error during data extraction or file creation.
+            Exception: With a checkpoint, if there is an error during data extraction
+                or file creation, once the progress is saved. Otherwise the error is
+                logged and an empty list is returned.
         """
+        sink = None
         try:
-            excel = Files()
-            output_path = "output/news_data.xlsx"
-            os.makedirs(os.path.dirname(output_path), exist_ok=True)
-            excel.create_workbook(output_path)
-            excel.append_rows_to_worksheet([
-                ["Title", "Date", "Description", "Image Filename",
-                "Search Phrases Count", "Contains Money"]
-            ], header=True)
-
-            articles_container = self.get_webelement(
-                'css:.SearchResultsModule-results .PageList-items')
-            self.wait_until_element_is_visible(articles_container)
-            articles = articles_container.find_elements(
-                "css selector", ".PageList-items-item")
-            self.wait_until_element_is_visible(articles)
-            data = []
-            for i, article in enumerate(articles):
-                self.wait_until_element_is_visible(article, timeout=10)
-                self.scroll_element_into_view(article)
-                # Explicit wait for the element to be interactable
-
-                title, description, date, img_filename = "N/A", "N/A", "N/A", "N/A"
-                try:
-                    title_element = article.find_element(
-                        "css selector", ".PagePromo-title span")
-                    title = title_element.text if title_element else "N/A"
-                except Exception as e:
-                    logging.warning("Failed to extract title.")
+            sink = self.open_news_data_sink()
+            analyzer = TextAnalyzer(search_phrases or [], whole_words=self.phrase_whole_words)
+
+            newest_first = self.results_newest_first(since)
+            kept_rows, staged_images, seen_run = [], 0, 0
+            pending_pages = deque()
+            with ThreadPoolExecutor(max_workers=1) as page_processor:
+                for page in range(first_page, max_pages + 1):
+                    page_url = self.driver.current_url
+                    records, seen_run, stop_reason = self.read_results_page(
+                        bulk, since, seen_run, newest_first)
+                    pending_pages.append((records, page_processor.submit(
+                        self.process_page_records, records, analyzer), (page_url, page)))
+                    logging.info(f"Extracted {len(records)} articles from page {page}")
+
+                    # Write the pages the worker has finished without blocking the browser
+                    while pending_pages and pending_pages[0][1].done():
+                        staged_images += self._store_page(
+                            sink, *pending_pages.popleft(), kept_rows if keep_rows else None)
+
+                    if stop_reason:
+                        logging.info(f"{stop_reason}, stopping.")
+                        break
+                    if page == max_pages or not self.go_to_next_results_page():
+                        break
+                while pending_pages:
+                    staged_images += self._store_page(
+                        sink, *pending_pages.popleft(), kept_rows if keep_rows else None)
+
+            sink.close()
+            logging.info(f"Data extracted and stored in {sink.path}")
+            self.stage_work_item_file(sink.path)
+            logging.info(
+                f"Output file and {staged_images} images staged for the work item: {sink.path}")
+            if self.image_downloader.cache:
+                # Persist the index and log the cache hit/miss counts of this run
+                self.image_downloader.cache.save()
+            if self.seen_index:
+                self.seen_index.compact()
+            return kept_rows
 
+        except Exception as e:
+            logging.error(f"Failed to extract news data and store it: {e}")
+            self.save_screenshot_to_work_item(
+                filename=self.output_path("failure_extract_news_data.png"), failure=True)
+            if sink is not None:
+                # Keep the pages written so far
                 try:
-                    description_element = article.find_element(
-                        "css selector", ".PagePromo-description span")
-                    description = description_element.text if description_element else "N/A"
-                except Exception as e:
-                    logging.warning("Failed to extract description.")
+                    sink.close()
+                    self.stage_work_item_file(sink.path)
+                except Exception as close_error:
+                    logging.error(f"Failed to close {sink.path}: {close_error}")
+            if self.checkpoint is not None:
+                # Fail the run so that its retry resumes from the checkpoint
+                raise
+            return []
+
+    def _store_page(self, sink, records, rows, cursor, kept_rows=None):
+        """
+        Write a processed page to the sink, stage its downloaded images and record its
+        articles in the seen-article index.
 
-                try:
-                    date_element = article.find_element(
-                        "css selector", ".PagePromo-date span")
-                    date = date_element.text if date_element else "N/A"
-                except Exception as e:
-                    logging.warning("Failed to extract date.")
+        Args:
+            sink (RowSink): The output sink.
+            records (list): The article records of the page.
+            rows (Future): The page rows being built by ``process_page_records``.
+            cursor (tuple): The URL and number of the page, see ``checkpoint_page``.
+            kept_rows (list): Where to also keep the rows, if given.
 
-                try:
-                    img_element = article.find_element(
-                        "css selector", ".PagePromo-media img")
-                    img_filename = self.save_image_from_element(
-                        img_element, title) if img_element else "N/A"
-                except Exception as e:
-                    img_filename = "N/A"  # there is no image
-
-                # Count occurrences of search phrases
-                search_phrases_count = self.count_search_phrases(
-                    title, description, ["COVID"])
-
-                # Check for monetary values in title and description
-                contains_money = self.check_money_in_text(
-                    title + " " + description)
-
-                # Append data for this article
-                data.append([title, date, description, img_filename,
-                            search_phrases_count, contains_money])
-
-                # Scroll to the next article and wait for it to be interactable
-                if i < len(articles) - 1:
-                    next_article = articles[i + 1]
-                    self.scroll_element_into_view(next_article)
-                    self.wait_until_element_is_visible(next_article, timeout=10)
-            # Write data to the Excel sheet
-            excel.append_rows_to_worksheet(data, header=False)
-            excel.save_workbook(output_path)
-            excel.close_workbook()
-            logging.info(f"Data extracted and stored in {output_path}")
-
-            # Add the Excel file to the work item
-            self.work_item.add_work_item_file(path=output_path)
-            self.work_item.save_work_item()
-            logging.info(f"Excel file added to work item: {output_path}")
+        Returns:
+            int: The number of images staged.
+        """
+        page_rows = rows.result()
+        sink.write_rows(page_rows)
+        if kept_rows is not None:
+            kept_rows.extend(page_rows)
+        image_paths = self.downloaded_image_paths(records)
+        for path in image_paths:
+            self.stage_work_item_file(path)
+        self.mark_records_seen(records)
+        self.checkpoint_page(sink, records, page_rows, *cursor)
+        return len(image_paths)
+
+    def checkpoint_page(self, sink, records, rows, page_url, page):
+        """
+        Save a written results page to the checkpoint, if there is one.
 
+        Args:
+            sink (RowSink): The output sink the page was written to.
+            records (list): The article records of the page, with their ``seen_key``.
+            rows (list): The rows written for the page.
+            page_url (str): The URL of the page.
+            page (int): The page number.
+        """
+        if self.checkpoint is None:
+            return
+        try:
+            self.checkpoint.record_page(
+                page_url, page, len(rows), [record["seen_key"] for record in records],
+                sink.state())
         except Exception as e:
-            logging.error(f"Failed to extract news data and store in Excel: {e}")
+            logging.warning(f"Failed to save the checkpoint {self.checkpoint.path}: {e}")
+
+    def downloaded_image_paths(self, records):
+        """
+        List the images downloaded for a page of article records.
+
+        Images captured from the page elements are left out, they are staged as
+        soon as they are captured.
+
+        Args:
+            records (list): Article records with their ``image_filename`` set.
+
+        Returns:
+            list: The image paths.
+        """
+        return [self.output_path(record["image_filename"]) for record in records
+                if record["image_url"] and record["image_filename"] != "N/A"]
+
+    def mark_records_seen(self, records):
+        """
+        Record written article records in the seen-article index, if there is one.
+
+        Only done once the records are written, so articles lost to a crash are
+        extracted again by the next run.
+
+        Args:
+            records (list): Article records with their ``seen_key`` set.
+        """
+        if self.seen_index:
+            self.seen_index.mark_seen([record["seen_key"] for record in records])
+
+    def results_newest_first(self, since=None):
+        """
+        Check whether the loaded results are sorted by "Newest".
+
+        Args:
+            since (datetime): The date cutoff of the crawl, a warning is logged if it
+                cannot stop the crawl early.
 
+        Returns:
+            bool: True if the results are sorted by "Newest".
+        """
+        newest_first = f"s={SORT_NEWEST}" in self.driver.current_url
+        if since and not newest_first:
+            logging.warning(
+                "Results are not sorted by 'Newest', the date cutoff will only "
+                "filter articles and cannot stop the crawl early.")
+        return newest_first
+
+    def read_results_page(self, bulk=True, since=None, seen_run=0, newest_first=False):
+        """
+        Read the new article records of the loaded results page.
+
+        The records are filtered by date, against the checkpoint and against the
+        seen-article index, and their image URL is picked. Images without a usable URL
+        are captured from the page right away, since it is about to be left.
+
+        Args:
+            bulk (bool): Use the single script call extraction, see
+                ``extract_page_records``.
+            since (datetime): Skip articles older than this.
+            seen_run (int): Number of already seen articles in a row that ended the
+                previous page.
+            newest_first (bool): Whether the results are sorted by "Newest", which
+                lets the crawl stop at the date cutoff or at a run of seen articles.
+
+        Returns:
+            tuple: The records, the number of already seen articles in a row ending
+            this page, and the reason to stop the crawl after this page, or None.
+        """
+        records = self.extract_page_records(bulk)
+        records, reached_cutoff = self.filter_records_since(records, since)
+        for record in records:
+            record["seen_key"] = self.article_key(record)
+        records = self.filter_checkpointed_records(records)
+        records, seen_run, reached_seen = self.filter_unseen_records(records, seen_run)
+        for record in records:
+            img_element = record.pop("image_element", None)
+            record["image_url"] = ImageDownloader.pick_source(
+                record.get("image_src"), record.get("image_srcset"), record.get("base_url"))
+            # Without a usable URL the image can only be captured from the
+            # live element, so do it before leaving the page
+            if not record["image_url"]:
+                record["image_filename"] = self.save_image_from_element(
+                    img_element, record["title"]) if img_element else "N/A"
+        stop_reason = None
+        if reached_cutoff and newest_first:
+            stop_reason = f"Reached articles older than {since}"
+        elif reached_seen and newest_first:
+            stop_reason = f"Reached {self.seen_stop_after} already extracted articles in a row"
+        return records, seen_run, stop_reason
+
+    def go_to_next_results_page(self):
+        """
+        Open the next results page, in a fresh tab or browser if the browser uses too
+        much memory, see ``relieve_memory_pressure``.
+
+        Returns:
+            bool: False if there is no next page.
+        """
+        next_page_url = self.get_next_page_url()
+        if not next_page_url:
+            logging.info("No next results page, stopping.")
+            return False
+        if not self.relieve_memory_pressure(next_page_url):
+            self.go_to(next_page_url)
+        return True
+
+    def extract_page_records(self, bulk=True):
+        """
+        Extract the article records of the currently loaded results page.
+
+        The bulk path reads the results list in its one script call without waiting
+        for it first; the page load strategy returns once the DOM is ready, and a list
+        that is not there yet sends the page down the per-element path, which waits.
+
+        Args:
+            bulk (bool): Use the single script call path, falling back to the
+                per-element path if it fails.
+
+        Returns:
+            list: One dict per article, see ``extract_articles_bulk``.
+        """
+        if bulk:
+            try:
+                return self.extract_articles_bulk()
+            except Exception as e:
+                logging.warning(
+                    f"Bulk extraction failed, falling back to per-element path: {e}")
+        self.wait_until_element_is_visible(
+            'css:.SearchResultsModule-results .PageList-items', timeout=10)
+        articles_container = self.get_webelement(
+            'css:.SearchResultsModule-results .PageList-items')
+        return self.extract_articles_per_element(articles_container)
+
+    def get_next_page_url(self):
+        """
+        Get the URL of the next results page.
+
+        Returns:
+            str: The next page URL, or None on the last page.
+        """
+        return self.driver.execute_script(NEXT_PAGE_URL_JS)
+
+    def filter_records_since(self, records, since):
+        """
+        Drop the records whose date is older than the cutoff.
+
+        Records with a date that cannot be parsed are kept, and a date only precise
+        to the day ("Yesterday", "Mar 3") is older only if its whole day is, see
+        ``DateNormalizer.latest``.
+
+        Args:
+            records (list): Article records of one page.
+            since (datetime): The cutoff, or None to keep everything. A naive
+                datetime is taken as UTC.
+
+        Returns:
+            tuple: The kept records and whether an older article was found.
+        """
+        if since is None:
+            return records, False
+        since = as_utc(since)
+        kept, reached_cutoff = [], False
+        for record in records:
+            published = self.date_normalizer.latest(record["date"])
+            if published is not None and published < since:
+                reached_cutoff = True
+                continue
+            kept.append(record)
+        return kept, reached_cutoff
+
+    def article_key(self, record):
+        """
+        Build the key identifying an article record across runs.
+
+        Args:
+            record (dict): An article record.
+
+        Returns:
+            tuple: The URL and a hash of the title and publication day, see
+            ``SeenArticleIndex.article_key``.
+        """
+        published = self.date_normalizer.normalize(record["date"])
+        return SeenArticleIndex.article_key(
+            record.get("url"), record["title"],
+            published.date().isoformat() if published else record["date"])
+
+    def filter_checkpointed_records(self, records):
+        """
+        Drop the records already written by the run the checkpoint was saved for.
+
+        Args:
+            records (list): Article records of one page, with their ``seen_key`` set.
+
+        Returns:
+            list: The records not written yet.
+        """
+        if self.checkpoint is None or not self.checkpoint.article_keys:
+            return records
+        kept = [record for record in records
+                if record["seen_key"] not in self.checkpoint.article_keys]
+        if len(kept) < len(records):
+            logging.info(
+                f"Skipped {len(records) - len(kept)} articles written before the resume")
+        return kept
+
+    def filter_unseen_records(self, records, seen_run=0):
+        """
+        Drop the records already extracted by an earlier run.
+
+        Each record is looked up in the seen-article index by its ``seen_key``, see
+        ``article_key``. Does nothing without a seen-article index.
+
+        Args:
+            records (list): Article records of one page, with their ``seen_key`` set.
+            seen_run (int): Number of already seen articles in a row that ended the
+                previous page.
+
+        Returns:
+            tuple: The records not seen before, the number of already seen articles in
+            a row that ends this page, and whether a run of ``seen_stop_after`` already
+            seen articles was found.
+        """
+        if self.seen_index is None:
+            return records, 0, False
+        seen_keys = self.seen_index.seen_keys([record["seen_key"] for record in records])
+        # Keep the entries of articles still listed on the site from expiring
+        self.seen_index.mark_seen(list(seen_keys))
+
+        kept, reached_seen_run = [], False
+        for record in records:
+            if record["seen_key"] in seen_keys:
+                seen_run += 1
+                reached_seen_run = reached_seen_run or seen_run >= self.seen_stop_after
+            else:
+                seen_run = 0
+                kept.append(record)
+        if seen_keys:
+            logging.info(f"Skipped {len(records) - len(kept)} already extracted articles")
+        return kept, seen_run, reached_seen_run
+
+    def start_run(self, reference=None):
+        """
+        Resolve the relative article dates of the next search against a new reference
+        time, by default now.
+
+        Args:
+            reference (datetime): The start of the run.
+        """
+        self.date_normalizer.reset(reference)
+
+    def format_article_date(self, date_text):
+        """
+        Format the date text of an article promo for the output file.
+
+        Args:
+            date_text (str): The text of the ``.PagePromo-date`` element.
+
+        Returns:
+            str: The UTC date in ISO 8601, or the text itself if it cannot be parsed.
+        """
+        published = self.date_normalizer.normalize(date_text)
+        return published.isoformat(timespec="minutes") if published else date_text
+
+    def process_page_records(self, records, analyzer):
+        """
+        Download the images of a page of article records and build their rows.
+
+        Args:
+            records (list): Article records with their ``image_url`` set.
+            analyzer (TextAnalyzer): Counts the search phrases and detects money.
+
+        Returns:
+            list: One row per record, see ``build_rows``.
+        """
+        filenames = self.image_downloader.download_all(
+            [record["image_url"] for record in records if record["image_url"]])
+        for record in records:
+            if record["image_url"]:
+                record["image_filename"] = filenames.get(record["image_url"], "N/A")
+        return self.build_rows(records, analyzer)
+
+    def build_rows(self, records, analyzer):
+        """
+        Build the output rows for a page of article records.
+
+        The search phrase counts and money flags of the whole page are computed in one
+        batch, see ``TextAnalyzer``.
+
+        Args:
+            records (list): Article records with their ``image_filename`` set.
+            analyzer (TextAnalyzer): Counts the search phrases and detects money.
+
+        Returns:
+            list: One row per record.
+        """
+        analysis = analyzer.analyze(
+            [(record["title"], record["description"]) for record in records])
+        return [
+            [record["title"], self.format_article_date(record["date"]), record["description"],
+             record["image_filename"], search_phrases_count, contains_money]
+            for record, (search_phrases_count, contains_money) in zip(records, analysis)
+        ]
+
+    @contextmanager
+    def count_webdriver_commands(self):
+        """
+        Count the WebDriver commands sent to the driver inside the block.
+
+        Every element lookup, property read or script call ends up in
+        ``WebDriver.execute``, so wrapping it gives the number of HTTP round trips
+        made to chromedriver.
+
+        Yields:
+            dict: A counter whose ``count`` key is updated as commands are sent.
+        """
+        driver = self.driver
+        counter = {"count": 0}
+        previous_execute = driver.execute
+        had_instance_execute = "execute" in vars(driver)
+
+        def counting_execute(driver_command, params=None):
+            counter["count"] += 1
+            return previous_execute(driver_command, params)
+
+        driver.execute = counting_execute
+        try:
+            yield counter
+        finally:
+            if had_instance_execute:
+                driver.execute = previous_execute
+            else:
+                del driver.execute
+
+    def extract_articles_bulk(self):
+        """
+        Extract every article on the results page with a single script call.
+
+        Returns:
+            list: One dict per article with ``title``, ``date``, ``description``,
+            ``url``, ``image_src``, ``image_srcset``, ``image_element`` and
+            ``base_url`` keys.
+
+        Raises:
+            RuntimeError: If the page has no results list (yet).
+        """
+        with self.count_webdriver_commands() as commands:
+            raw_records = self.driver.execute_script(BULK_EXTRACT_ARTICLES_JS)
+        if raw_records is None:
+            raise RuntimeError(f"No results list found on {self.driver.current_url}")
+        records = []
+        for raw in raw_records:
+            records.append({
+                "title": raw.get("title") or "N/A",
+                "date": raw.get("date") or "N/A",
+                "description": raw.get("description") or "N/A",
+                "url": raw.get("url"),
+                "image_src": raw.get("image_src"),
+                "image_srcset": raw.get("image_srcset"),
+                "image_element": raw.get("image_element"),
+                "base_url": raw.get("base_url"),
+            })
+        logging.info(
+            f"Bulk extraction read {len(records)} articles in "
+            f"{commands['count']} WebDriver round trips")
+        return records
+
+    def extract_articles_per_element(self, articles_container):
+        """
+        Extract every article on the results page element by element.
+
+        This is the slower fallback for the bulk path: it scrolls to each article and
+        reads each field with its own WebDriver command. The article elements are
+        fetched ``ELEMENT_CHUNK_SIZE`` at a time, so the handles of a chunk are
+        released before the next one is fetched.
+
+        Args:
+            articles_container (WebElement): The results list element.
+
+        Returns:
+            list: One dict per article, with the same keys as ``extract_articles_bulk``.
+        """
+        with self.count_webdriver_commands() as commands:
+            base_url = self.driver.current_url
+            article_count = self.driver.execute_script(COUNT_ARTICLES_JS, articles_container)
+            records = []
+            for chunk_start in range(0, article_count, ELEMENT_CHUNK_SIZE):
+                articles = self.driver.execute_script(
+                    ARTICLE_CHUNK_JS, articles_container, chunk_start,
+                    chunk_start + ELEMENT_CHUNK_SIZE)
+                records.extend(self._extract_article_chunk(articles, base_url))
+        logging.info(
+            f"Per-element extraction read {len(records)} articles in "
+            f"{commands['count']} WebDriver round trips")
+        return records
+
+    def _extract_article_chunk(self, articles, base_url):
+        """
+        Extract a chunk of articles element by element.
+
+        Args:
+            articles (list): The article elements of the chunk.
+            base_url (str): The URL of the results page.
+
+        Returns:
+            list: One dict per article, see ``extract_articles_per_element``.
+        """
+        records = []
+        for i, article in enumerate(articles):
+            self.wait_until_element_is_visible(article, timeout=10)
+            self.scroll_element_into_view(article)
+            # Explicit wait for the element to be interactable
+
+            title, description, date = "N/A", "N/A", "N/A"
+            url, img_element, img_src, img_srcset = None, None, None, None
+            try:
+                title_element = article.find_element(
+                    "css selector", ".PagePromo-title span")
+                title = title_element.text if title_element else "N/A"
+            except Exception as e:
+                logging.warning("Failed to extract title.")
+
+            try:
+                description_element = article.find_element(
+                    "css selector", ".PagePromo-description span")
+                description = description_element.text if description_element else "N/A"
+            except Exception as e:
+                logging.warning("Failed to extract description.")
+
+            try:
+                date_element = article.find_element(
+                    "css selector", ".PagePromo-date span")
+                date = date_element.text if date_element else "N/A"
+            except Exception as e:
+                logging.warning("Failed to extract date.")
+
+            try:
+                link_element = article.find_element(
+                    "css selector", ".PagePromo-title a")
+                url = link_element.get_attribute("href")
+            except Exception as e:
+                url = None  # there is no link
+
+            try:
+                img_element = article.find_element(
+                    "css selector", ".PagePromo-media img")
+                img_src = img_element.get_attribute("src")
+                if not img_src or img_src.startswith("data:"):
+                    # Lazy-load placeholder, the real URL is in data-src
+                    img_src = img_element.get_attribute("data-src") or img_src
+                img_srcset = img_element.get_attribute("srcset")
+            except Exception as e:
+                img_element = None  # there is no image
+
+            records.append({
+                "title": title,
+                "date": date,
+                "description": description,
+                "url": url,
+                "image_src": img_src,
+                "image_srcset": img_srcset,
+                "image_element": img_element,
+                "base_url": base_url,
+            })
+
+            # Scroll to the next article and wait for it to be interactable
+            if i < len(articles) - 1:
+                next_article = articles[i + 1]
+                self.scroll_element_into_view(next_article)
+                self.wait_until_element_is_visible(next_article, timeout=10)
+        return records
 
     def save_image_from_element(self, img_element, title):
         """
@@ -401,12 +1820,11 @@ class ExtendedSelenium(Selenium):
         """
         try:
             filename = f"image-{title[:50]}.png"
-            filepath = os.path.join("output", filename)
+            filepath = self.output_path(filename)
             os.makedirs(os.path.dirname(filepath), exist_ok=True)
             img_element.screenshot(filepath)
-            self.work_item.add_work_item_file(path=filepath)
-            self.work_item.save_work_item()
-            logging.info(f"Image saved and added to work item: {filepath}")
+            self.stage_work_item_file(filepath)
+            logging.info(f"Image saved and staged for the work item: {filepath}")
             return filename
         except Exception as e:
             logging.error(f"Failed to save image: {e}")
@@ -424,10 +1842,11 @@ class ExtendedSelenium(Selenium):
         Returns:
             int: The total count of search phrases in the title and description.
         """
+        title, description = title.lower(), description.lower()
         count = 0
         for phrase in phrases:
-            count += title.lower().count(phrase.lower())
-            count += description.lower().count(phrase.lower())
+            phrase = phrase.lower()
+            count += title.count(phrase) + description.count(phrase)
         return count
 
     def check_money_in_text(self, text):
@@ -440,8 +1859,7 @@ class ExtendedSelenium(Selenium):
         Returns:
             bool: True if the text contains monetary values, False otherwise.
         """
-        money_pattern = r'\$\d+(?:,\d{3})*(?:\.\d{2})?|(?:\d+\s(?:dollars|USD))'
-        return bool(re.search(money_pattern, text, re.IGNORECASE))
+        return bool(MONEY_PATTERN.search(text))
 
     def print_webdriver_log(self, logtype):
         """
@@ -457,6 +1875,72 @@ class ExtendedSelenium(Selenium):
         for entry in logs:
             logging.info(entry)
 
+    @keyword
+    def discover_categories(self):
+        """
+        Read the category filter values of the loaded results page and cache them.
+
+        Every checkbox under the search filter is read with its label in one script
+        call, see ``CATEGORY_DISCOVERY_JS``.
+
+        Returns:
+            dict: The category values keyed by name.
+
+        Raises:
+            RuntimeError: If the page has no category filter.
+        """
+        categories = self.driver.execute_script(CATEGORY_DISCOVERY_JS)
+        if not categories:
+            raise RuntimeError(f"No category filter found on {self.driver.current_url}")
+        logging.info(f"Discovered {len(categories)} categories: {sorted(categories)}")
+        self.categories = categories
+        self.categories_discovered = time.time()
+        self.category_cache.save(categories, self.categories_discovered)
+        return categories
+
+    def forget_categories(self):
+        """
+        Drop the known category values, in memory and in the category cache.
+        """
+        self.categories = None
+        self.categories_discovered = None
+        self.category_cache.invalidate()
+
+    def discover_categories_from(self, home_url, search_phrase):
+        """
+        Load the unfiltered results of a search and discover the categories there.
+
+        Args:
+            home_url (str): The home page of the news website.
+            search_phrase (str): The phrase to search for.
+
+        Returns:
+            dict: The category values keyed by name.
+        """
+        url = f"{urljoin(home_url, 'search')}?{urlencode({'q': search_phrase})}"
+        if not self.has_open_browser():
+            self.open_browser_for(url)
+        self.go_to(url)
+        self.wait_until_page_contains_element('css:.SearchFilter', timeout=10)
+        return self.discover_categories()
+
+    def knows_category(self, category_name):
+        """
+        Check whether the value of a category is known without discovering it.
+
+        The categories are read from the category cache on first use, and again once
+        the known ones are past the cache TTL.
+
+        Args:
+            category_name (str): The name of the category.
+
+        Returns:
+            bool: True if the category is in the known categories.
+        """
+        if self.categories is None or self.category_cache.is_stale(self.categories_discovered):
+            self.categories, self.categories_discovered = self.category_cache.load()
+        return bool(self.categories) and category_name in self.categories
+
     def get_category_value(self, category_name):
         """
         Retrieve the value associated with a specific category name.
@@ -466,16 +1950,16 @@ class ExtendedSelenium(Selenium):
 
         Returns:
             str: The value associated with the category name.
-        """
-        category_mapping = {
-            "Live Blogs": "00000190-0dc5-d7b0-a1fa-dde7ec030000",
-            "Sections": "00000189-9323-dce2-ad8f-bbe74c770000",
-            "Stories": "00000188-f942-d221-a78c-f9570e360000",
-            "Subsections": "00000189-9323-db0a-a7f9-9b7fb64a0000",
-            "Videos": "00000188-d597-dc35-ab8d-d7bf1ce10000",
-        }
-        return category_mapping.get(category_name, "00000188-f942-d221-a78c-f9570e360000")
 
+        Raises:
+            ValueError: If the category is not one of the discovered categories, see
+                ``discover_categories``.
+        """
+        if not self.knows_category(category_name):
+            raise ValueError(
+                f"Unknown news category '{category_name}', expected one of "
+                f"{sorted(self.categories or [])}")
+        return self.categories[category_name]
 
     def wait_until_element_is_interactable(self, element, timeout=10):
         """
@@ -496,6 +1980,44 @@ class ExtendedSelenium(Selenium):
             logging.error(f"Element not interactable after {timeout} seconds: {e}")
             raise
 
+    @keyword
+    def reset_session(self, home_url):
+        """
+        Reset the browser state between work items and go back to the home page.
+
+        Cookies and web storage are cleared so the next work item starts like a fresh
+        browser, while the HTTP cache stays warm.
+
+        Args:
+            home_url (str): The page to navigate to after the reset.
+        """
+        try:
+            self.driver.execute_script(
+                "window.localStorage.clear(); window.sessionStorage.clear();")
+        except Exception as e:
+            logging.warning(f"Failed to clear web storage: {e}")
+        try:
+            self.driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        except Exception:
+            self.driver.delete_all_cookies()
+        self.go_to(url=home_url)
+        logging.info("Browser session reset.")
+
+    def browser_rss(self):
+        """
+        Get the memory used by the browser.
+
+        Returns:
+            int: The RSS in bytes of chromedriver and all the Chrome processes it
+            started, 0 if no browser is open or it cannot be read.
+        """
+        if not self.has_open_browser():
+            return 0
+        try:
+            return process_tree_rss(self.driver.service.process.pid)
+        except AttributeError:
+            return 0
+
     @keyword
     def quit_driver(self):
         """
@@ -0,0 +1,201 @@
+"""
+End-to-end benchmark: the full ``the_process`` flow against the local stand-in site.
+
+Every scenario serves the stand-in site with its own result count, page count,
+popups and latency, and runs ``tasks.py`` in a fresh process and working directory
+with a local input work item (the RPA ``FileAdapter``). The wall time, the WebDriver
+commands (from the run profile) and the peak memory of the whole process tree
+(Python, chromedriver and Chrome) are recorded for each scenario.
+
+Usage:
+    python benchmarks/bench_end_to_end.py [--runs 1] [--scenarios baseline popups]
+                                          [--json results.json]
+"""
+import argparse
+import csv
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from fixture_site import POPUPS, FixtureSite  # noqa: E402
+from resources import process_tree_rss  # noqa: E402
+
+# Stand-in site settings and env variables of each scenario
+SCENARIOS = {
+    "baseline": {"site": {}, "env": {}},
+    "click-navigation": {"site": {}, "env": {"SEARCH_NAVIGATION": "click"}},
+    "popups": {
+        "site": {"popups": tuple(POPUPS)},
+        "env": {"SEARCH_NAVIGATION": "click"},
+    },
+    "popups-polling": {
+        "site": {"popups": tuple(POPUPS)},
+        "env": {"SEARCH_NAVIGATION": "click", "POPUP_WATCHER": "false"},
+    },
+    "slow-site": {"site": {"latency": 0.3}, "env": {}},
+    "fast-profile": {
+        "site": {"asset_latency": 0.5},
+        "env": {"FAST_BROWSER_PROFILE": "true"},
+    },
+    "large": {"site": {"results_per_page": 50, "pages": 10}, "env": {}},
+    "large-async": {
+        "site": {"results_per_page": 50, "pages": 10, "latency": 0.1},
+        "env": {"ASYNC_PIPELINE": "true"},
+    },
+    "large-sync": {
+        "site": {"results_per_page": 50, "pages": 10, "latency": 0.1},
+        "env": {"ASYNC_PIPELINE": "false"},
+    },
+    "large-memory-limit": {
+        "site": {"results_per_page": 50, "pages": 10},
+        "env": {"BROWSER_MEMORY_LIMIT_MB": "300"},
+    },
+}
+
+SAMPLE_INTERVAL = 0.1
+
+
+def prepare_run(site, site_settings, run_dir, scenario_env, screenshot_policy):
+    """
+    Write the input work item of a run and build its environment.
+
+    Args:
+        site (FixtureSite): The running stand-in site.
+        site_settings (dict): The settings the site was started with.
+        run_dir (str): The working directory of the run.
+        scenario_env (dict): The env variables of the scenario.
+        screenshot_policy (str): The screenshot policy of the work item.
+
+    Returns:
+        dict: The environment of ``tasks.py``.
+    """
+    input_path = os.path.join(run_dir, "work-items-in", "items.json")
+    os.makedirs(os.path.dirname(input_path))
+    with open(input_path, "w", encoding="utf-8") as input_file:
+        json.dump([{"payload": {
+            "search_phrase": "covid",
+            "news_category": "Stories",
+            "max_pages": site_settings["pages"],
+            "screenshot_policy": screenshot_policy,
+        }, "files": {}}], input_file)
+    env = {
+        **os.environ,
+        **scenario_env,
+        "NEWS_SITE_URL": site.url,
+        "RPA_WORKITEMS_ADAPTER": "FileAdapter",
+        "RPA_INPUT_WORKITEM_PATH": input_path,
+        "RPA_OUTPUT_WORKITEM_PATH": os.path.join(run_dir, "work-items-out", "items.json"),
+        "IMAGE_CACHE_DIR": os.path.join(run_dir, "image-cache"),
+        "CATEGORY_CACHE_PATH": os.path.join(run_dir, "category-cache", "categories.json"),
+        "OUTPUT_FORMAT": "csv",
+        "PYTHONPATH": os.pathsep.join(filter(None, [REPO_ROOT, os.getenv("PYTHONPATH")])),
+    }
+    env.pop("SEEN_INDEX_PATH", None)
+    return env
+
+
+def read_titles(run_dir):
+    """
+    Read the titles of the extracted data file of a run.
+
+    Args:
+        run_dir (str): The working directory of the run.
+
+    Returns:
+        list: The titles, in file order.
+    """
+    try:
+        with open(os.path.join(run_dir, "output", "news_data.csv"),
+                  encoding="utf-8", newline="") as data_file:
+            return [row[0] for row in list(csv.reader(data_file))[1:]]
+    except OSError:
+        return []
+
+
+def run_once(name, scenario, screenshot_policy):
+    """
+    Run ``tasks.py`` once for a scenario.
+
+    Args:
+        name (str): The scenario name.
+        scenario (dict): The scenario, see ``SCENARIOS``.
+        screenshot_policy (str): The screenshot policy of the work item.
+
+    Returns:
+        dict: The wall time, WebDriver commands, peak memory, extracted rows and exit
+        code of the run.
+    """
+    site_settings = {"results_per_page": 20, "pages": 3, **scenario["site"]}
+    with FixtureSite(**site_settings) as site, tempfile.TemporaryDirectory() as run_dir:
+        env = prepare_run(site, site_settings, run_dir, scenario["env"], screenshot_policy)
+        log_path = os.path.join(run_dir, "run.log")
+        peak_rss = 0
+        started = time.perf_counter()
+        with open(log_path, "w", encoding="utf-8") as log_file:
+            process = subprocess.Popen(
+                [sys.executable, os.path.join(REPO_ROOT, "tasks.py")], cwd=run_dir, env=env,
+                stdout=log_file, stderr=subprocess.STDOUT)
+            while process.poll() is None:
+                peak_rss = max(peak_rss, process_tree_rss(process.pid))
+                time.sleep(SAMPLE_INTERVAL)
+        wall = time.perf_counter() - started
+
+        try:
+            with open(os.path.join(run_dir, "output", "run_profile.json"),
+                      encoding="utf-8") as profile_file:
+                commands = json.load(profile_file)["total_commands"]
+        except (OSError, ValueError, KeyError):
+            commands = None
+        rows = len(read_titles(run_dir))
+        if process.returncode or not rows:
+            with open(log_path, encoding="utf-8") as log_file:
+                print(f"--- {name} log ---\n{log_file.read()[-3000:]}")
+        return {
+            "wall_s": round(wall, 2),
+            "commands": commands,
+            "peak_rss_mb": round(peak_rss / 2 ** 20, 1),
+            "rows": rows,
+            "expected_rows": site_settings["results_per_page"] * site_settings["pages"],
+            "exit_code": process.returncode,
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=1)
+    parser.add_argument("--scenarios", nargs="+", choices=list(SCENARIOS),
+                        default=list(SCENARIOS))
+    parser.add_argument("--screenshot-policy", default="off")
+    parser.add_argument("--json", help="Write the results to this file.")
+    args = parser.parse_args()
+
+    results = {}
+    print(f"{'Scenario':<18}{'Wall (s)':>10}{'Commands':>10}{'Peak (MB)':>11}{'Rows':>11}")
+    for name in args.scenarios:
+        runs = [run_once(name, SCENARIOS[name], args.screenshot_policy)
+                for _ in range(args.runs)]
+        result = {
+            "wall_s": statistics.median(run["wall_s"] for run in runs),
+            "commands": runs[-1]["commands"],
+            "peak_rss_mb": max(run["peak_rss_mb"] for run in runs),
+            "rows": runs[-1]["rows"],
+            "expected_rows": runs[-1]["expected_rows"],
+            "runs": runs,
+        }
+        results[name] = result
+        print(f"{name:<18}{result['wall_s']:>10.2f}{str(result['commands']):>10}"
+              f"{result['peak_rss_mb']:>11.1f}{result['rows']:>6}/{result['expected_rows']:<4}")
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as json_file:
+            json.dump(results, json_file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
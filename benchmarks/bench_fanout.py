@@ -0,0 +1,57 @@
+"""
+Fan-out benchmark: search job throughput against the local stand-in site as the
+number of worker processes grows.
+
+Usage:
+    python benchmarks/bench_fanout.py [--jobs 8] [--workers 1 2 4] [--pages 2]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from fixture_site import CATEGORIES, FixtureSite  # noqa: E402
+from fanout import FanOutRunner  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--jobs", type=int, default=8)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--pages", type=int, default=2)
+    parser.add_argument("--results", type=int, default=20)
+    parser.add_argument("--latency", type=float, default=0.05)
+    args = parser.parse_args()
+
+    os.environ.setdefault("SCREENSHOT_POLICY", "off")
+    categories = list(CATEGORIES)
+    jobs = [{"search_phrase": f"phrase{index}", "news_category": categories[index % len(categories)]}
+            for index in range(args.jobs)]
+    with FixtureSite(results_per_page=args.results, pages=args.pages,
+                     latency=args.latency) as site:
+        baseline = None
+        for workers in args.workers:
+            with tempfile.TemporaryDirectory() as output_root:
+                # Keep the fixture categories out of the user's cache, and start every
+                # worker count with a cold one
+                os.environ["CATEGORY_CACHE_PATH"] = os.path.join(
+                    output_root, "category-cache", "categories.json")
+                with FanOutRunner(workers=workers, home_url=site.url,
+                                  output_root=output_root) as runner:
+                    # Warm the worker browsers up so only the jobs are timed
+                    runner.run(jobs[:workers], max_pages=1)
+                    started = time.perf_counter()
+                    rows, _ = runner.run(jobs, max_pages=args.pages)
+                    elapsed = time.perf_counter() - started
+            throughput = len(jobs) * 60 / elapsed
+            baseline = baseline or throughput
+            print(f"{workers} workers: {len(jobs)} jobs, {len(rows)} rows in {elapsed:.1f}s "
+                  f"({throughput:.1f} jobs/min, {throughput / baseline:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Fast profile benchmark: per-step timing of the search flow against the local
+stand-in site with the default browser profile and with the fast profile.
+
+The stand-in serves slow ads, analytics and web fonts; the fast profile blocks
+them, uses the "eager" page load strategy and, optionally, skips images.
+
+Usage:
+    python benchmarks/bench_fast_profile.py [--asset-latency 0.5] [--pages 2]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from fixture_site import FixtureSite  # noqa: E402
+from ExtendedSelenium import ExtendedSelenium  # noqa: E402
+
+LOCAL_BLOCKED_URL_PATTERNS = ["*/ads/*", "*/analytics/*", "*/fonts/*"]
+
+PROFILES = {
+    "default": {"fast_profile": False},
+    "fast": {"fast_profile": True, "blocked_url_patterns": LOCAL_BLOCKED_URL_PATTERNS},
+    "fast, no images": {"fast_profile": True, "skip_images": True,
+                        "blocked_url_patterns": LOCAL_BLOCKED_URL_PATTERNS},
+}
+
+
+def time_flow(browser, home_url, pages):
+    """
+    Run the search flow step by step and time each step.
+
+    Args:
+        browser (ExtendedSelenium): The browser to drive.
+        home_url (str): The home page of the stand-in site.
+        pages (int): Number of result pages to crawl.
+
+    Returns:
+        dict: The duration in seconds of each step.
+    """
+    steps = [
+        ("open_site", lambda: browser.open_site(url=home_url)),
+        ("accept_cookies", browser.accept_cookies),
+        ("click_search_button", browser.click_search_button),
+        ("type_and_submit_search_query", lambda: browser.type_and_submit_search_query("covid")),
+        ("click_and_select_category", lambda: browser.click_and_select_category("Stories")),
+        ("select_sort_by_newest", browser.select_sort_by_newest),
+        ("extract_news_data_and_store",
+         lambda: browser.extract_news_data_and_store(max_pages=pages)),
+    ]
+    timings = {}
+    for name, step in steps:
+        started = time.perf_counter()
+        step()
+        timings[name] = time.perf_counter() - started
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--asset-latency", type=float, default=0.5)
+    parser.add_argument("--pages", type=int, default=2)
+    parser.add_argument("--results", type=int, default=20)
+    args = parser.parse_args()
+
+    results = {}
+    with FixtureSite(results_per_page=args.results, pages=args.pages,
+                     asset_latency=args.asset_latency) as site:
+        for name, settings in PROFILES.items():
+            with tempfile.TemporaryDirectory() as output_dir:
+                browser = ExtendedSelenium(
+                    work_item=None, output_dir=output_dir, screenshot_policy="off",
+                    category_cache_path=os.path.join(
+                        output_dir, "category-cache", "categories.json"),
+                    **settings)
+                try:
+                    results[name] = time_flow(browser, site.url, args.pages)
+                finally:
+                    browser.close_all_browsers()
+
+    names = list(PROFILES)
+    print(f"{'step':<30}" + "".join(f"{name:>18}" for name in names))
+    for step in results[names[0]]:
+        print(f"{step:<30}" + "".join(f"{results[name][step]:>17.2f}s" for name in names))
+    print(f"{'total':<30}" + "".join(f"{sum(results[name].values()):>17.2f}s" for name in names))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+Navigation benchmark: time to reach the sorted and filtered results page through
+the UI click path and through the direct results URL, against the local stand-in site.
+
+Usage:
+    python benchmarks/bench_navigation.py [--runs 3] [--latency 0.2]
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from fixture_site import FixtureSite  # noqa: E402
+from ExtendedSelenium import ExtendedSelenium  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--latency", type=float, default=0.2)
+    args = parser.parse_args()
+
+    timings = {"click": [], "direct": []}
+    with FixtureSite(latency=args.latency) as site, tempfile.TemporaryDirectory() as output_dir:
+        browser = ExtendedSelenium(
+            work_item=None, output_dir=output_dir, screenshot_policy="off",
+            category_cache_path=os.path.join(output_dir, "category-cache", "categories.json"))
+        try:
+            for _ in range(args.runs):
+                if browser.has_open_browser():
+                    browser.reset_session(site.url)
+                started = time.perf_counter()
+                browser.navigate_to_search_results(site.url, "covid", "Stories")
+                timings["click"].append(time.perf_counter() - started)
+
+                browser.reset_session(site.url)
+                started = time.perf_counter()
+                if not browser.open_search_results(site.url, "covid", "Stories"):
+                    raise RuntimeError("The direct results page did not match")
+                timings["direct"].append(time.perf_counter() - started)
+        finally:
+            browser.close_all_browsers()
+
+    click, direct = statistics.median(timings["click"]), statistics.median(timings["direct"])
+    print(f"click path:  {click:.2f}s (median of {args.runs})")
+    print(f"direct URL:  {direct:.2f}s (median of {args.runs})")
+    print(f"saved per work item: {click - direct:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
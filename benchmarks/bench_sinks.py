@@ -0,0 +1,117 @@
+"""
+Output sink benchmark: rows per second and peak memory of writing 100k rows.
+
+Compares the previous approach, building all rows in memory and writing them with
+``RPA.Excel.Files`` at the end, with the streaming sinks of ``sinks.py`` fed one
+page of rows at a time. Each scenario runs in a fresh process so that its peak RSS
+is not hidden by an earlier one.
+
+Usage:
+    python benchmarks/bench_sinks.py [--rows 100000] [--page-size 20]
+"""
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SCENARIOS = ("rpa-files", "xlsx", "csv", "parquet")
+
+
+def synthetic_page(start, size):
+    """
+    Build a page of synthetic rows shaped like the extracted news rows.
+
+    Args:
+        start (int): The position of the first row.
+        size (int): Number of rows.
+
+    Returns:
+        list: The rows.
+    """
+    return [[
+        f"COVID story {position} after $1,{position % 1000:03d} grant",
+        f"March {position % 28 + 1}, 2024",
+        f"Coverage of COVID number {position}, with {position % 7} dollars at stake.",
+        f"{position:040x}.jpg",
+        position % 3,
+        position % 5 == 0,
+    ] for position in range(start, start + size)]
+
+
+def measure_once(scenario, rows, page_size, output_dir):
+    """
+    Write the rows with one scenario in the current process and print the result as JSON.
+
+    Args:
+        scenario (str): One of ``SCENARIOS``.
+        rows (int): Number of rows to write.
+        page_size (int): Number of rows per chunk.
+        output_dir (str): The directory of the output file.
+    """
+    sys.path.insert(0, REPO_ROOT)
+    from ExtendedSelenium import NEWS_DATA_HEADER
+
+    path = os.path.join(output_dir, f"news_data_{scenario}")
+    started = time.perf_counter()
+    if scenario == "rpa-files":
+        from RPA.Excel.Files import Files
+
+        data = []
+        for start in range(0, rows, page_size):
+            data.extend(synthetic_page(start, min(page_size, rows - start)))
+        path = f"{path}.xlsx"
+        excel = Files()
+        excel.create_workbook(path)
+        excel.append_rows_to_worksheet([NEWS_DATA_HEADER], header=True)
+        excel.append_rows_to_worksheet(data, header=False)
+        excel.save_workbook(path)
+        excel.close_workbook()
+    else:
+        from sinks import open_sink
+
+        with open_sink(scenario, path, NEWS_DATA_HEADER) as sink:
+            for start in range(0, rows, page_size):
+                sink.write_rows(synthetic_page(start, min(page_size, rows - start)))
+        path = sink.path
+    elapsed = time.perf_counter() - started
+    print(json.dumps({
+        "rows_per_s": round(rows / elapsed),
+        # ru_maxrss is in kilobytes on Linux
+        "peak_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+        "file_mb": round(os.path.getsize(path) / 2 ** 20, 2),
+    }))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--page-size", type=int, default=20)
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS))
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    parser.add_argument("--output-dir", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        measure_once(args.child, args.rows, args.page_size, args.output_dir)
+        return
+    with tempfile.TemporaryDirectory() as output_dir:
+        for scenario in args.scenarios.split(","):
+            result = subprocess.run(
+                [sys.executable, __file__, "--child", scenario, "--rows", str(args.rows),
+                 "--page-size", str(args.page_size), "--output-dir", output_dir],
+                cwd=REPO_ROOT, capture_output=True, text=True)
+            if result.returncode:
+                error = (result.stderr.strip().splitlines() or ["failed"])[-1]
+                print(f"{scenario:<9}: skipped ({error})")
+                continue
+            timings = json.loads(result.stdout.strip().splitlines()[-1])
+            print(f"{scenario:<9}: {timings['rows_per_s']:>8} rows/s, "
+                  f"peak RSS {timings['peak_rss_mb']:.1f} MB, file {timings['file_mb']:.2f} MB")
+
+
+if __name__ == "__main__":
+    main()
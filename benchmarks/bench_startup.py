@@ -0,0 +1,80 @@
+"""
+Startup benchmark: time from ``ExtendedSelenium()`` to the end of the first ``open_site``.
+
+Each run happens in a fresh process, so the per-process ``ChromeService`` memoization
+starts empty and only the on-disk caches differ between scenarios:
+
+- cold: an empty chromedriver manifest, the driver comes from webdriver_manager
+- warm: the manifest written by the cold run, no webdriver_manager lookup
+
+Usage:
+    python benchmarks/bench_startup.py [--runs 3]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BLANK_PAGE = "data:text/html,<html><body>startup</body></html>"
+
+
+def measure_once():
+    """
+    Measure one startup in the current process and print it as JSON.
+    """
+    sys.path.insert(0, REPO_ROOT)
+    started = time.perf_counter()
+    from ExtendedSelenium import ExtendedSelenium
+
+    browser = ExtendedSelenium(work_item=None, screenshot_policy="off")
+    constructed = time.perf_counter()
+    try:
+        browser.open_site(url=BLANK_PAGE)
+        opened = time.perf_counter()
+    finally:
+        browser.close_all_browsers()
+    print(json.dumps({
+        "construct_s": round(constructed - started, 3),
+        "first_open_site_s": round(opened - started, 3),
+    }))
+
+
+def run_scenario(name, cache_dir, runs):
+    """
+    Run the startup measurement in fresh processes and print the results.
+
+    Args:
+        name (str): The scenario name.
+        cache_dir (str): The chromedriver cache directory to use.
+        runs (int): Number of runs.
+    """
+    env = {**os.environ, "CHROMEDRIVER_CACHE_DIR": cache_dir}
+    env.pop("CHROMEDRIVER_PATH", None)
+    for run in range(1, runs + 1):
+        result = subprocess.run(
+            [sys.executable, __file__, "--child"], env=env, cwd=REPO_ROOT,
+            check=True, capture_output=True, text=True)
+        timings = json.loads(result.stdout.strip().splitlines()[-1])
+        print(f"{name:<5} run {run}: constructed in {timings['construct_s']:.3f}s, "
+              f"first open_site done in {timings['first_open_site_s']:.3f}s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        measure_once()
+        return
+    with tempfile.TemporaryDirectory() as cache_dir:
+        run_scenario("cold", cache_dir, 1)
+        run_scenario("warm", cache_dir, args.runs)
+
+
+if __name__ == "__main__":
+    main()
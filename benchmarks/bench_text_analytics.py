@@ -0,0 +1,109 @@
+"""
+Text analytics benchmark: per-row phrase counting and money detection vs. batches.
+
+The per-row functions are the ones ``ExtendedSelenium.build_rows`` used to call for
+every article, lowercasing the texts once per phrase and compiling the money pattern
+string on every call. They are compared with ``TextAnalyzer`` over the same synthetic
+headlines, processed in pages of ``--page-size`` articles like the extraction does.
+Both give the same results unless overlapping phrases are passed, which the per-row
+functions count more than once.
+
+Usage:
+    python benchmarks/bench_text_analytics.py [--articles 1000000] [--page-size 20]
+"""
+import argparse
+import os
+import random
+import re
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from text_analytics import TextAnalyzer  # noqa: E402
+
+WORDS = ["election", "market", "storm", "covid", "vaccine", "court", "school", "budget",
+         "council", "river", "team", "season", "hospital", "price", "mayor", "report"]
+
+
+def count_search_phrases(title, description, phrases):
+    count = 0
+    for phrase in phrases:
+        count += title.lower().count(phrase.lower())
+        count += description.lower().count(phrase.lower())
+    return count
+
+
+def check_money_in_text(text):
+    money_pattern = r'\$\d+(?:,\d{3})*(?:\.\d{2})?|(?:\d+\s(?:dollars|USD))'
+    return bool(re.search(money_pattern, text, re.IGNORECASE))
+
+
+def synthetic_articles(count, seed=7):
+    """
+    Build synthetic (title, description) pairs.
+
+    Args:
+        count (int): Number of articles.
+        seed (int): The random seed.
+
+    Returns:
+        list: The articles.
+    """
+    rng = random.Random(seed)
+    articles = []
+    for index in range(count):
+        title = " ".join(rng.choice(WORDS) for _ in range(8)).capitalize()
+        description = " ".join(rng.choice(WORDS) for _ in range(20))
+        if index % 5 == 0:
+            description += f" after a ${rng.randint(1, 999)},{rng.randint(100, 999)} grant"
+        elif index % 7 == 0:
+            description += f" worth {rng.randint(1, 99)} dollars"
+        if index % 3 == 0:
+            title = title.replace("covid", "COVID-19")
+        articles.append((title, description))
+    return articles
+
+
+def run_per_row(articles, phrases, page_size):
+    results = []
+    for start in range(0, len(articles), page_size):
+        for title, description in articles[start:start + page_size]:
+            results.append((count_search_phrases(title, description, phrases),
+                            check_money_in_text(title + " " + description)))
+    return results
+
+
+def run_batched(articles, phrases, page_size):
+    analyzer = TextAnalyzer(phrases)
+    results = []
+    for start in range(0, len(articles), page_size):
+        results.extend(analyzer.analyze(articles[start:start + page_size]))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--articles", type=int, default=1_000_000)
+    parser.add_argument("--page-size", type=int, default=20)
+    parser.add_argument("--phrases", default="covid")
+    args = parser.parse_args()
+    phrases = args.phrases.split(",")
+    articles = synthetic_articles(args.articles)
+
+    timings = {}
+    results = {}
+    for name, run in (("per-row", run_per_row), ("batched", run_batched)):
+        started = time.perf_counter()
+        results[name] = run(articles, phrases, args.page_size)
+        timings[name] = time.perf_counter() - started
+        print(f"{name:<8}: {timings[name]:.2f}s "
+              f"({args.articles / timings[name]:,.0f} articles/s)")
+    print(f"speedup : {timings['per-row'] / timings['batched']:.1f}x")
+    mismatches = sum(a != b for a, b in zip(results["per-row"], results["batched"]))
+    print(f"rows with different results: {mismatches}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,235 @@
+"""
+Check that a run killed midway and started again extracts the same rows as a clean run.
+
+A clean run of ``tasks.py`` against the local stand-in site gives the expected rows.
+Then, for every case, a run is killed (SIGKILL, with its chromedriver and Chrome)
+once its checkpoint holds a few pages and started again in the same working
+directory. The cases cover each output format, with and without the output file of
+an earlier completed run left in ``output/``. A case passes if the data file of the
+second run holds exactly the rows of the clean run, in the same order, and, for the
+CSV format whose file survives the kill, if the second run loaded the checkpointed
+results page first instead of the home page. Excel files are only written on close,
+so a killed Excel run starts over.
+
+The rows are compared by title, as the dates and image files depend on the time of
+the run. The script exits with status 1 if any case fails.
+
+Usage:
+    python benchmarks/check_kill_resume.py [--pages 6] [--kill-after 2]
+                                           [--formats csv xlsx]
+"""
+import argparse
+import json
+import os
+import signal
+import subprocess
+import sys
+import tempfile
+import time
+
+from bench_end_to_end import REPO_ROOT, prepare_run
+from fixture_site import FixtureSite
+from sinks import open_sink, sink_type_of
+
+POLL_INTERVAL = 0.05
+RUN_TIMEOUT = 300
+
+# Rows of the output file left behind by an earlier completed run
+STALE_ROWS = [[f"Stale article {index}"] for index in range(50)]
+
+
+def read_json(path):
+    """
+    Read a JSON file that may be missing or being written.
+
+    Args:
+        path (str): The path of the JSON file.
+
+    Returns:
+        dict: The content, or None if the file cannot be read yet.
+    """
+    try:
+        with open(path, encoding="utf-8") as json_file:
+            return json.load(json_file)
+    except (OSError, ValueError):
+        return None
+
+
+def read_output_titles(run_dir, output_format):
+    """
+    Read the titles of the data file of a run.
+
+    Args:
+        run_dir (str): The working directory of the run.
+        output_format (str): The output format of the run.
+
+    Returns:
+        list: The titles, in file order, or None if the file cannot be read.
+    """
+    sink_type = sink_type_of(output_format)
+    try:
+        return [row[0] for row in sink_type.read_rows(
+            os.path.join(run_dir, "output", f"news_data.{sink_type.extension}"))]
+    except Exception:
+        return None
+
+
+def start_run(run_dir, env, log_file):
+    """
+    Start ``tasks.py`` in its own process group, so it can be killed with its browser.
+
+    Args:
+        run_dir (str): The working directory of the run.
+        env (dict): The environment of the run.
+        log_file (file): The file the output of the run is written to.
+
+    Returns:
+        subprocess.Popen: The run.
+    """
+    return subprocess.Popen(
+        [sys.executable, os.path.join(REPO_ROOT, "tasks.py")], cwd=run_dir, env=env,
+        stdout=log_file, stderr=subprocess.STDOUT, start_new_session=True)
+
+
+def wait_run(process):
+    """
+    Wait for a run, killing it after ``RUN_TIMEOUT`` seconds.
+
+    Args:
+        process (subprocess.Popen): The run.
+    """
+    try:
+        process.wait(timeout=RUN_TIMEOUT)
+    except subprocess.TimeoutExpired:
+        os.killpg(process.pid, signal.SIGKILL)
+        process.wait()
+
+
+def kill_at_checkpoint(run_dir, env, log_file, kill_after):
+    """
+    Run ``tasks.py`` and kill it once its checkpoint holds enough pages.
+
+    Args:
+        run_dir (str): The working directory of the run.
+        env (dict): The environment of the run.
+        log_file (file): The file the output of the run is written to.
+        kill_after (int): The number of checkpointed pages to wait for.
+
+    Returns:
+        dict: The checkpoint the run was killed at, or None if the run ended first.
+    """
+    checkpoint_path = os.path.join(run_dir, "output", "checkpoint.json")
+    process = start_run(run_dir, env, log_file)
+    deadline = time.monotonic() + RUN_TIMEOUT
+    try:
+        while process.poll() is None and time.monotonic() < deadline:
+            checkpoint = read_json(checkpoint_path)
+            if checkpoint and checkpoint["page"] >= kill_after:
+                os.killpg(process.pid, signal.SIGKILL)
+                process.wait()
+                return checkpoint
+            time.sleep(POLL_INTERVAL)
+        return None
+    finally:
+        if process.poll() is None:
+            os.killpg(process.pid, signal.SIGKILL)
+            process.wait()
+
+
+def run_clean(site, site_settings, output_format):
+    """
+    Run ``tasks.py`` once without interruption.
+
+    Args:
+        site (FixtureSite): The running stand-in site.
+        site_settings (dict): The settings the site was started with.
+        output_format (str): The output format of the run.
+
+    Returns:
+        list: The titles of the data file, or None if it cannot be read.
+    """
+    with tempfile.TemporaryDirectory() as run_dir:
+        env = {**prepare_run(site, site_settings, run_dir, {}, "off"),
+               "OUTPUT_FORMAT": output_format}
+        with open(os.path.join(run_dir, "run.log"), "w", encoding="utf-8") as log_file:
+            wait_run(start_run(run_dir, env, log_file))
+        return read_output_titles(run_dir, output_format)
+
+
+def run_case(site, site_settings, output_format, stale_output, kill_after, expected):
+    """
+    Kill a run at its checkpoint, start it again and check its rows.
+
+    Args:
+        site (FixtureSite): The running stand-in site.
+        site_settings (dict): The settings the site was started with.
+        output_format (str): The output format of the run.
+        stale_output (bool): Leave the output file of an earlier run in ``output/``.
+        kill_after (int): The number of checkpointed pages to wait for.
+        expected (list): The titles of the clean run.
+
+    Returns:
+        bool: True if every check of the case passed.
+    """
+    name = f"{output_format}{', stale output file' if stale_output else ''}"
+    with tempfile.TemporaryDirectory() as run_dir:
+        env = {**prepare_run(site, site_settings, run_dir, {}, "off"),
+               "OUTPUT_FORMAT": output_format}
+        if stale_output:
+            with open_sink(output_format, os.path.join(run_dir, "output", "news_data"),
+                           ["title"]) as sink:
+                sink.write_rows(STALE_ROWS)
+        log_path = os.path.join(run_dir, "run.log")
+        with open(log_path, "w", encoding="utf-8") as log_file:
+            checkpoint = kill_at_checkpoint(run_dir, env, log_file, kill_after)
+            if checkpoint is None:
+                print(f"FAIL [{name}]: the run ended before checkpointing {kill_after} pages")
+                return False
+            wait_run(start_run(run_dir, env, log_file))
+
+        profile = read_json(os.path.join(run_dir, "output", "run_profile.json")) or {}
+        loads = [load["url"] for load in profile.get("page_loads", [])]
+        titles = read_output_titles(run_dir, output_format)
+        checks = {
+            "same rows as the clean run": titles == expected,
+        }
+        if output_format == "csv":
+            checks["first page loaded is the checkpointed page"] = (
+                bool(loads) and loads[0] == checkpoint["page_url"])
+        print(f"[{name}] killed after page {checkpoint['page']}, second run loaded "
+              f"{len(loads)} pages and left {len(titles or [])}/{len(expected)} rows")
+        for check, passed in checks.items():
+            print(f"{'PASS' if passed else 'FAIL'} [{name}]: {check}")
+        if not all(checks.values()):
+            with open(log_path, encoding="utf-8") as log_file:
+                print(f"--- {name} log ---\n{log_file.read()[-3000:]}")
+            return False
+        return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--pages", type=int, default=6)
+    parser.add_argument("--results-per-page", type=int, default=20)
+    parser.add_argument("--kill-after", type=int, default=2,
+                        help="Number of checkpointed pages before the run is killed.")
+    parser.add_argument("--formats", nargs="+", choices=["csv", "xlsx"],
+                        default=["csv", "xlsx"])
+    args = parser.parse_args()
+
+    site_settings = {"results_per_page": args.results_per_page, "pages": args.pages}
+    with FixtureSite(**site_settings) as site:
+        expected = run_clean(site, site_settings, "csv")
+        if not expected or len(expected) != args.results_per_page * args.pages:
+            print(f"FAIL: the clean run extracted {len(expected or [])} rows, "
+                  f"expected {args.results_per_page * args.pages}")
+            sys.exit(1)
+        passed = [run_case(site, site_settings, output_format, stale_output,
+                           args.kill_after, expected)
+                  for output_format in args.formats for stale_output in (False, True)]
+    if not all(passed):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,385 @@
+"""
+Local stand-in of the news search site used by the benchmarks.
+
+Serves synthetic pages that copy the markup the automation depends on: the search
+overlay, the search filter with its "See All" toggle and category checkboxes, the
+sort dropdown, the result promos and the pagination. Dates go back in time from the
+first result so the "Newest" ordering holds across pages. Popups matching the ones
+``ExtendedSelenium.close_all_popups`` dismisses can be injected into every page.
+
+Usage:
+    python benchmarks/fixture_site.py [--port 8000] [--results 20] [--pages 5]
+                                      [--popups close lightbox fancybox aria]
+"""
+import argparse
+import html
+import json
+import struct
+import threading
+import time
+import zlib
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlencode, urlparse
+
+CATEGORIES = {
+    "Live Blogs": "00000190-0dc5-d7b0-a1fa-dde7ec030000",
+    "Sections": "00000189-9323-dce2-ad8f-bbe74c770000",
+    "Stories": "00000188-f942-d221-a78c-f9570e360000",
+    "Subsections": "00000189-9323-db0a-a7f9-9b7fb64a0000",
+    "Videos": "00000188-d597-dc35-ab8d-d7bf1ce10000",
+}
+
+CATEGORY_PARAM = "f2"
+
+
+def _png(width, height, rgb):
+    """
+    Build a solid color PNG image.
+
+    Args:
+        width (int): The image width.
+        height (int): The image height.
+        rgb (tuple): The red, green and blue values.
+
+    Returns:
+        bytes: The PNG file.
+    """
+    def chunk(kind, data):
+        return (struct.pack(">I", len(data)) + kind + data
+                + struct.pack(">I", zlib.crc32(kind + data) & 0xFFFFFFFF))
+    raw = b"".join(b"\x00" + bytes(rgb) * width for _ in range(height))
+    return (b"\x89PNG\r\n\x1a\n"
+            + chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0))
+            + chunk(b"IDAT", zlib.compress(raw))
+            + chunk(b"IEND", b""))
+
+
+# Stand-ins for the ads, analytics and web fonts of the real site, served with
+# ``asset_latency`` so that blocking them makes a measurable difference
+THIRD_PARTY_ASSETS = """<script async src="/ads/loader.js"></script>
+<link rel="stylesheet" href="/fonts/site.css">
+<img src="/analytics/pixel.gif" width="1" height="1" alt="">"""
+
+# Overlays covering the page until closed, like the newsletter and promo popups of the
+# real site. Each is injected ``popup_delay`` seconds after the page is loaded.
+POPUPS = {
+    "close": """<div class="Popup" style="position:fixed;inset:0;background:#0008">
+  <button id="Close" onclick="this.parentNode.remove()">Close</button></div>""",
+    "lightbox": """<div id="lightbox" style="position:fixed;inset:0;background:#0008">
+  <a href="#" onclick="closeLightbox(); return false;">Close</a></div>""",
+    "fancybox": """<div class="fancybox-overlay fancybox-overlay-fixed"
+     style="position:fixed;inset:0;background:#0008">
+  <a class="fancybox-close" href="#" onclick="this.parentNode.remove(); return false;">Close</a>
+</div>""",
+    "aria": """<div class="Modal" style="position:fixed;inset:0;background:#0008">
+  <button aria-label="Close" onclick="this.parentNode.remove()">x</button></div>""",
+}
+
+POPUP_SCRIPT = """<script>
+function closeLightbox() {{ document.getElementById('lightbox').remove(); }}
+setTimeout(function () {{
+  document.body.insertAdjacentHTML('beforeend', {markup});
+}}, {delay_ms});
+</script>"""
+
+HOME_PAGE = """<!DOCTYPE html>
+<html><head><title>News</title>{assets}</head><body>
+<div id="cookie-banner"><button onclick="this.parentNode.remove()">I Accept</button></div>
+<button class="SearchOverlay-search-button"
+        onclick="document.getElementById('search-overlay').style.display='block'">Search</button>
+<div id="search-overlay" style="display:none">
+  <form action="/search" method="get">
+    <input class="SearchOverlay-search-input" name="q" type="text">
+  </form>
+</div>
+<main><h1>Top stories</h1></main>
+{popups}
+</body></html>
+"""
+
+RESULTS_PAGE = """<!DOCTYPE html>
+<html><head><title>Search results</title>{assets}
+<script>
+function navigateWith(name, value) {{
+  var url = new URL(window.location.href);
+  url.searchParams.set(name, value);
+  url.searchParams.delete('p');
+  window.location.href = url.toString();
+}}
+</script>
+</head><body>
+<div class="SearchResultsModule">
+  <div class="SearchFilter">
+    <bsp-toggler data-toggle-in="search-filter">
+      <div class="SearchFilter-heading"
+           onclick="document.getElementById('filter-content').style.display='block'">Filter</div>
+    </bsp-toggler>
+    <div id="filter-content" class="SearchFilter-content" style="display:none">
+      <button class="SearchFilter-seeAll-button"
+              onclick="document.getElementById('filter-items').style.display='block'">See All</button>
+      <div id="filter-items" class="SearchFilter-items" style="display:none">
+        {checkboxes}
+      </div>
+    </div>
+  </div>
+  <label>Sort by
+    <select name="s" onchange="navigateWith('s', this.value)">
+      <option value="0"{relevance_selected}>Relevance</option>
+      <option value="3"{newest_selected}>Newest</option>
+      <option value="1">Oldest</option>
+    </select>
+  </label>
+  <div class="SearchResultsModule-count">{total} results</div>
+  <div class="SearchResultsModule-results">
+    <div class="PageList-items">
+      {items}
+    </div>
+  </div>
+  <div class="Pagination">{pagination}</div>
+</div>
+{popups}
+</body></html>
+"""
+
+CHECKBOX = """<label class="SearchFilter-items-item">
+  <input type="checkbox" name="{param}" value="{value}"{checked}
+         onchange="navigateWith('{param}', this.value)">
+  <span>{name}</span>
+</label>"""
+
+RESULT_ITEM = """<div class="PageList-items-item">
+  <div class="PagePromo">
+    <div class="PagePromo-media"><a href="{url}">
+      <img src="{image}" srcset="{image}?w=320 320w, {image}?w=640 640w" alt=""></a></div>
+    <div class="PagePromo-title"><a href="{url}"><span>{title}</span></a></div>
+    <div class="PagePromo-description"><span>{description}</span></div>
+    <div class="PagePromo-date"><span>{date}</span></div>
+  </div>
+</div>"""
+
+
+class FixtureSite:
+    """
+    A local HTTP server serving the stand-in news site.
+
+    Example:
+        with FixtureSite(results_per_page=20, pages=3) as site:
+            run_the_flow(home_url=site.url)
+    """
+
+    def __init__(self, results_per_page=20, pages=3, latency=0.0, asset_latency=0.0, port=0,
+                 popups=(), popup_delay=0.0):
+        """
+        Initialize the FixtureSite instance.
+
+        Args:
+            results_per_page (int): Number of results on each results page.
+            pages (int): Number of results pages.
+            latency (float): Delay in seconds added before every HTML response.
+            asset_latency (float): Delay in seconds added before every third-party
+                asset (ads, analytics, fonts) response.
+            port (int): The port to listen on, 0 picks a free one.
+            popups (tuple): The ``POPUPS`` shown on every page.
+            popup_delay (float): Delay in seconds between the page load and the
+                popups showing up.
+        """
+        self.results_per_page = results_per_page
+        self.pages = pages
+        self.latency = latency
+        self.asset_latency = asset_latency
+        self.popups = tuple(popups)
+        self.popup_delay = popup_delay
+        self.started_at = datetime.now()
+        self.requests = 0
+        site = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(this):
+                site.requests += 1
+                site.handle(this)
+
+            def log_message(this, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", port), Handler)
+        self._thread = None
+
+    @property
+    def url(self):
+        """
+        str: The home page URL of the site.
+        """
+        return f"http://127.0.0.1:{self.server.server_address[1]}/"
+
+    def start(self):
+        """
+        Start serving on a background thread.
+        """
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """
+        Stop the server.
+        """
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def handle(self, request):
+        """
+        Route a GET request.
+
+        Args:
+            request (BaseHTTPRequestHandler): The request being handled.
+        """
+        parsed = urlparse(request.path)
+        query = {name: values[0] for name, values in parse_qs(parsed.query).items()}
+        if parsed.path.startswith("/images/"):
+            index = int(parsed.path.rsplit("/", 1)[1].split(".")[0])
+            self._respond(request, _png(64, 40, (index * 37 % 256, 90, 160)), "image/png")
+            return
+        if parsed.path.startswith(("/ads/", "/analytics/", "/fonts/")):
+            time.sleep(self.asset_latency)
+            if parsed.path.endswith(".css"):
+                body = b"@font-face { font-family: Site; src: url(/fonts/site.woff2); }"
+                self._respond(request, body, "text/css")
+            elif parsed.path.endswith(".gif"):
+                self._respond(request, _png(1, 1, (0, 0, 0)), "image/png")
+            else:
+                self._respond(request, b"/* ad loader */", "application/javascript")
+            return
+        if self.latency:
+            time.sleep(self.latency)
+        if parsed.path == "/":
+            self._respond(request, self.render_home().encode(), "text/html; charset=utf-8")
+        elif parsed.path == "/search":
+            self._respond(request, self.render_results(query).encode(), "text/html; charset=utf-8")
+        else:
+            request.send_error(404)
+
+    @staticmethod
+    def _respond(request, body, content_type):
+        request.send_response(200)
+        request.send_header("Content-Type", content_type)
+        request.send_header("Content-Length", str(len(body)))
+        request.end_headers()
+        request.wfile.write(body)
+
+    def render_home(self):
+        """
+        Render the home page.
+
+        Returns:
+            str: The HTML of the home page.
+        """
+        return HOME_PAGE.format(assets=THIRD_PARTY_ASSETS, popups=self.render_popups())
+
+    def render_popups(self):
+        """
+        Render the script injecting the popups.
+
+        Returns:
+            str: The script, empty without popups.
+        """
+        if not self.popups:
+            return ""
+        markup = "".join(POPUPS[name] for name in self.popups)
+        return POPUP_SCRIPT.format(markup=json.dumps(markup),
+                                   delay_ms=int(self.popup_delay * 1000))
+
+    def article_date(self, position):
+        """
+        Render the promo date of the article at a position in the "Newest" ordering.
+
+        Args:
+            position (int): The position of the article across all pages.
+
+        Returns:
+            str: The date as the site shows it, e.g. "17 mins ago" or "March 3, 2024".
+        """
+        age = timedelta(minutes=37 * (position + 1))
+        if age < timedelta(hours=1):
+            return f"{age.seconds // 60} mins ago"
+        if age < timedelta(hours=24):
+            return f"{age.seconds // 3600} hours ago"
+        published = self.started_at - age
+        return f"{published:%B} {published.day}, {published.year}"
+
+    def render_results(self, query):
+        """
+        Render a results page.
+
+        Args:
+            query (dict): The query string parameters.
+
+        Returns:
+            str: The HTML of the results page.
+        """
+        phrase = query.get("q", "")
+        page = int(query.get("p", "1"))
+        sort = query.get("s", "0")
+        selected_category = query.get(CATEGORY_PARAM)
+        checkboxes = "\n".join(
+            CHECKBOX.format(param=CATEGORY_PARAM, value=value, name=html.escape(name),
+                            checked=" checked" if value == selected_category else "")
+            for name, value in CATEGORIES.items())
+
+        items = []
+        for index in range(self.results_per_page):
+            position = (page - 1) * self.results_per_page + index
+            money = f" after $1,{position:03d} grant" if position % 5 == 0 else ""
+            items.append(RESULT_ITEM.format(
+                url=f"/article/{position}",
+                image=f"/images/{position}.png",
+                title=html.escape(f"{phrase} story {position}{money}"),
+                description=html.escape(
+                    f"Coverage of {phrase} number {position}, with {position % 7} dollars at stake."),
+                date=self.article_date(position)))
+
+        pagination = ""
+        if page < self.pages:
+            next_query = urlencode({**query, "p": page + 1})
+            pagination = (f'<div class="Pagination-nextPage">'
+                          f'<a href="/search?{html.escape(next_query)}">Next</a></div>')
+
+        return RESULTS_PAGE.format(
+            assets=THIRD_PARTY_ASSETS,
+            checkboxes=checkboxes,
+            relevance_selected=" selected" if sort != "3" else "",
+            newest_selected=" selected" if sort == "3" else "",
+            total=self.results_per_page * self.pages,
+            items="\n".join(items),
+            pagination=pagination,
+            popups=self.render_popups())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve the stand-in news site.")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--results", type=int, default=20)
+    parser.add_argument("--pages", type=int, default=5)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--asset-latency", type=float, default=0.0)
+    parser.add_argument("--popups", nargs="*", choices=sorted(POPUPS), default=[])
+    parser.add_argument("--popup-delay", type=float, default=0.0)
+    args = parser.parse_args()
+    site = FixtureSite(results_per_page=args.results, pages=args.pages,
+                       latency=args.latency, asset_latency=args.asset_latency,
+                       port=args.port, popups=args.popups, popup_delay=args.popup_delay)
+    print(f"Serving the stand-in news site on {site.url}")
+    try:
+        site.server.serve_forever()
+    except KeyboardInterrupt:
+        site.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+import logging
+import queue
+import threading
+from contextlib import contextmanager
+
+
+class BrowserSessionPool:
+    """
+    A small pool of warm browser sessions reused across work items.
+
+    Each session is an ``ExtendedSelenium`` instance whose Chrome stays open between
+    work items. When a session is returned, its cookies and storage are cleared and
+    it goes back to the home page. Chrome is recycled (closed, then started again on
+    the next ``open_site``) after a number of work items or when its process tree
+    uses more memory than the limit.
+    """
+
+    def __init__(self, factory, max_items_per_browser=50, memory_limit_mb=1024,
+                 home_url="https://apnews.com/"):
+        """
+        Initialize the BrowserSessionPool instance.
+
+        Args:
+            factory (callable): Creates a new ``ExtendedSelenium`` instance.
+            max_items_per_browser (int): Work items after which Chrome is recycled.
+            memory_limit_mb (int): Chrome memory use, in MB, above which it is recycled.
+            home_url (str): The page sessions are reset to between work items.
+        """
+        self.factory = factory
+        self.max_items_per_browser = max_items_per_browser
+        self.memory_limit_bytes = memory_limit_mb * 1024 * 1024
+        self.home_url = home_url
+        self.sessions = []
+        self._items_served = {}
+        self._idle = queue.LifoQueue()
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def session(self):
+        """
+        Borrow a session for the duration of the block.
+
+        Yields:
+            ExtendedSelenium: A warm session, or a new one if none is idle.
+        """
+        browser = self._acquire()
+        try:
+            yield browser
+        finally:
+            self._release(browser)
+
+    def _acquire(self):
+        """
+        Take an idle session, creating one if none is idle.
+
+        Returns:
+            ExtendedSelenium: The session.
+        """
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            browser = self.factory()
+            self.sessions.append(browser)
+            self._items_served[id(browser)] = 0
+            return browser
+
+    def _release(self, browser):
+        """
+        Reset or recycle a session and put it back in the pool.
+
+        Args:
+            browser (ExtendedSelenium): The session to return.
+        """
+        self._items_served[id(browser)] += 1
+        items_served = self._items_served[id(browser)]
+        try:
+            memory_used = browser.browser_rss()
+            if items_served >= self.max_items_per_browser or memory_used > self.memory_limit_bytes:
+                logging.info(
+                    f"Recycling browser after {items_served} work items "
+                    f"using {memory_used / 1024 / 1024:.0f} MB")
+                browser.close_all_browsers()
+                self._items_served[id(browser)] = 0
+            else:
+                browser.reset_session(self.home_url)
+        except Exception as e:
+            logging.warning(f"Failed to reset browser session, recycling it: {e}")
+            browser.close_all_browsers()
+            self._items_served[id(browser)] = 0
+        self._idle.put(browser)
+
+    def close(self):
+        """
+        Close the browsers of every session in the pool.
+        """
+        for browser in self.sessions:
+            try:
+                browser.close_all_browsers()
+            except Exception as e:
+                logging.error(f"Failed to close browser: {e}")
@@ -0,0 +1,93 @@
+import json
+import logging
+import os
+import time
+
+
+class CategoryCache:
+    """
+    On-disk cache of the category filter values discovered on the search page.
+
+    The mapping of category names to checkbox values is stored in one JSON file with
+    the time it was discovered, and is considered stale after ``ttl_hours``. Every
+    browser and worker process pointing at the same file shares it, so the categories
+    are discovered once per TTL rather than once per run. The file is replaced
+    atomically, so a reader never sees a partial write.
+    """
+
+    def __init__(self, path, ttl_hours=24):
+        """
+        Initialize the CategoryCache instance.
+
+        Args:
+            path (str): The path of the JSON file.
+            ttl_hours (float): Hours after which the discovered categories are stale.
+        """
+        self.path = path
+        self.ttl_seconds = ttl_hours * 3600
+
+    def load(self):
+        """
+        Read the cached categories.
+
+        Returns:
+            tuple: The category values keyed by name and the time they were discovered
+            (seconds since the epoch), or (None, None) if the cache is missing,
+            unreadable or stale.
+        """
+        try:
+            with open(self.path, encoding="utf-8") as cache_file:
+                entry = json.load(cache_file)
+        except FileNotFoundError:
+            return None, None
+        except Exception as e:
+            logging.warning(f"Ignoring unreadable category cache {self.path}: {e}")
+            return None, None
+        discovered = entry.get("discovered", 0)
+        if self.is_stale(discovered):
+            logging.info(f"The category cache {self.path} is stale")
+            return None, None
+        return entry.get("categories") or None, discovered
+
+    def is_stale(self, discovered):
+        """
+        Check whether categories discovered at a given time are past the TTL.
+
+        Args:
+            discovered (float): The time the categories were discovered, in seconds
+                since the epoch.
+
+        Returns:
+            bool: True if the categories should be discovered again.
+        """
+        return time.time() - discovered > self.ttl_seconds
+
+    def save(self, categories, discovered):
+        """
+        Store newly discovered categories.
+
+        Args:
+            categories (dict): The category values keyed by name.
+            discovered (float): The time they were discovered, in seconds since the
+                epoch.
+        """
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        temporary_path = f"{self.path}.{os.getpid()}.tmp"
+        try:
+            with open(temporary_path, "w", encoding="utf-8") as cache_file:
+                json.dump({"discovered": discovered, "categories": categories},
+                          cache_file, indent=2)
+            os.replace(temporary_path, self.path)
+        except Exception as e:
+            logging.warning(f"Failed to write the category cache {self.path}: {e}")
+
+    def invalidate(self):
+        """
+        Delete the cached categories, e.g. once the site rejected one of their values.
+        """
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logging.warning(f"Failed to delete the category cache {self.path}: {e}")
@@ -0,0 +1,160 @@
+import json
+import logging
+import os
+import time
+
+
+class RunCheckpoint:
+    """
+    Progress of a search run, saved so that a retried run resumes where it stopped.
+
+    The checkpoint holds the URL and number of the last results page written, how many
+    articles of that page were written, the number of rows written so far with the
+    state of the output sink (see ``RowSink.state``), the keys of the articles written
+    and the files staged for the work item. The rows themselves stay in the output
+    file, which a resumed run reopens with ``RowSink.resume``. The checkpoint is
+    rewritten atomically after every page, so a run killed at any point leaves the
+    state of its last written page behind. A checkpoint only resumes the run it was
+    saved for, identified by its ``run_key`` (e.g. the work item id and the search
+    settings).
+
+    Example:
+        checkpoint = RunCheckpoint.load("output/checkpoint.json", run_key)
+        if checkpoint.resumable:
+            ...  # go to checkpoint.page_url and skip checkpoint.article_keys
+        checkpoint.record_page(page_url, page, len(rows), keys, sink.state())
+    """
+
+    FILENAME = "checkpoint.json"
+
+    def __init__(self, path, run_key):
+        """
+        Initialize an empty RunCheckpoint instance.
+
+        Args:
+            path (str): The JSON file the checkpoint is saved to.
+            run_key (dict): JSON serializable identity of the run.
+        """
+        self.path = path
+        self.run_key = run_key
+        self.page_url = None
+        self.page = 0
+        self.article = 0
+        self.rows_written = 0
+        self.sink_state = None
+        self.article_keys = set()
+        self.files = []
+
+    @classmethod
+    def load(cls, path, run_key):
+        """
+        Load the checkpoint of a run, or start an empty one.
+
+        A missing or unreadable file, or one saved for another run, gives an empty
+        checkpoint.
+
+        Args:
+            path (str): The JSON file the checkpoint is saved to.
+            run_key (dict): JSON serializable identity of the run.
+
+        Returns:
+            RunCheckpoint: The checkpoint.
+        """
+        checkpoint = cls(path, run_key)
+        try:
+            with open(path, encoding="utf-8") as checkpoint_file:
+                state = json.load(checkpoint_file)
+        except FileNotFoundError:
+            return checkpoint
+        except Exception as e:
+            logging.warning(f"Ignoring unreadable checkpoint {path}: {e}")
+            return checkpoint
+        if state.get("run_key") != run_key:
+            logging.info(f"Ignoring the checkpoint {path} of another run")
+            return checkpoint
+        checkpoint.page_url = state["page_url"]
+        checkpoint.page = state["page"]
+        checkpoint.article = state["article"]
+        checkpoint.rows_written = state["rows_written"]
+        checkpoint.sink_state = state["sink_state"]
+        checkpoint.article_keys = {tuple(key) for key in state["article_keys"]}
+        checkpoint.files = state["files"]
+        logging.info(
+            f"Loaded the checkpoint {path}: page {checkpoint.page}, "
+            f"{checkpoint.rows_written} rows, {len(checkpoint.files)} files")
+        return checkpoint
+
+    @property
+    def resumable(self):
+        """
+        bool: Whether a results page was written, so the run can resume from it.
+        """
+        return self.page_url is not None
+
+    def record_page(self, page_url, page, row_count, article_keys, sink_state):
+        """
+        Record a written results page and save the checkpoint.
+
+        Args:
+            page_url (str): The URL of the results page.
+            page (int): The page number, starting at 1.
+            row_count (int): The number of rows written for the page.
+            article_keys (list): The keys of the page's articles, see
+                ``SeenArticleIndex.article_key``.
+            sink_state (dict): The state of the output sink once the page is written.
+        """
+        if page != self.page:
+            self.article = 0
+        self.page_url = page_url
+        self.page = page
+        self.article += row_count
+        self.rows_written = sink_state["rows_written"]
+        self.sink_state = sink_state
+        self.article_keys.update(article_keys)
+        self.save()
+
+    def reset(self):
+        """
+        Forget the progress, e.g. when the output file it refers to is lost.
+        """
+        self.__init__(self.path, self.run_key)
+
+    def record_file(self, path):
+        """
+        Record a file staged for the work item. It is saved with the next page.
+
+        Args:
+            path (str): The path of the file.
+        """
+        if path not in self.files:
+            self.files.append(path)
+
+    def save(self):
+        """
+        Write the checkpoint atomically.
+        """
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        state = {
+            "run_key": self.run_key,
+            "saved": time.time(),
+            "page_url": self.page_url,
+            "page": self.page,
+            "article": self.article,
+            "rows_written": self.rows_written,
+            "sink_state": self.sink_state,
+            "article_keys": sorted(self.article_keys),
+            "files": self.files,
+        }
+        temporary_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(temporary_path, "w", encoding="utf-8") as checkpoint_file:
+            json.dump(state, checkpoint_file)
+        os.replace(temporary_path, self.path)
+
+    def discard(self):
+        """
+        Delete the saved checkpoint, once the run is complete.
+        """
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,216 @@
+import functools
+import re
+from datetime import datetime, timedelta, timezone
+
+from dateutil import parser as date_parser
+
+RELATIVE_DATE_PATTERN = re.compile(
+    r'\b(\d+|an?|one)\s*(secs?|seconds?|mins?|minutes?|hrs?|hours?|days?|weeks?)\s+ago\b',
+    re.IGNORECASE)
+
+RELATIVE_UNITS = {
+    "s": timedelta(seconds=1),
+    "m": timedelta(minutes=1),
+    "h": timedelta(hours=1),
+    "d": timedelta(days=1),
+    "w": timedelta(weeks=1),
+}
+
+# Relative units only precise to the day, their dates are truncated to midnight
+DAY_UNITS = {"d", "w"}
+
+# Texts meaning a whole number of days before the reference
+RELATIVE_DAYS = {"today": 0, "yesterday": 1}
+
+# Texts meaning the reference time itself
+RELATIVE_NOW = {"just now", "now"}
+
+# Two leap years used as defaults when parsing absolute dates: a field taking a
+# different value with each default is missing from the text, and February 29
+# exists in both
+DEFAULT_YEARS = (2000, 2004)
+
+# Years looked back to find the last February 29 when a date text has no year
+MAX_YEARS_BACK = 8
+
+
+class DateNormalizer:
+    """
+    Turn the date texts shown on article promos into UTC timestamps.
+
+    Relative dates ("5 mins ago", "Yesterday") are resolved against a fixed reference
+    time, the start of the run, so every article of a run is dated consistently no
+    matter how long the crawl takes. Texts only precise to the day ("Yesterday",
+    "2 days ago", "Mar 3") are dated at midnight UTC rather than at the run's time of
+    day, and ``latest`` gives the end of their day for comparisons against a cutoff.
+    Absolute dates ("March 3", "Mar 3, 2024") without a time zone are taken as UTC,
+    and dates without a year are assumed to be in the past. The same texts repeat
+    across the articles and pages of a run, so parsed texts are kept in an LRU cache.
+
+    Example:
+        normalizer = DateNormalizer(datetime(2024, 3, 5, 12, tzinfo=timezone.utc))
+        normalizer.normalize("2 hours ago")  # 2024-03-05 10:00 UTC
+        normalizer.normalize("Mar 3")        # 2024-03-03 00:00 UTC
+        normalizer.latest("Mar 3")           # 2024-03-03 23:59:59.999999 UTC
+    """
+
+    def __init__(self, reference=None, cache_size=1024):
+        """
+        Initialize the DateNormalizer instance.
+
+        Args:
+            reference (datetime): The time relative dates are resolved against,
+                defaults to now. A naive datetime is taken as UTC.
+            cache_size (int): Number of parsed texts kept in the cache.
+        """
+        self.cache_size = cache_size
+        self.reset(reference)
+
+    def reset(self, reference=None):
+        """
+        Move the reference time, e.g. to the start of a new run, and clear the cache.
+
+        Args:
+            reference (datetime): The new reference time, defaults to now.
+        """
+        self.reference = as_utc(reference) if reference else datetime.now(timezone.utc)
+        self._cached_parse = functools.lru_cache(maxsize=self.cache_size)(self._parse)
+
+    def normalize(self, date_text):
+        """
+        Parse the date text shown on an article promo.
+
+        Args:
+            date_text (str): The text of the ``.PagePromo-date`` element.
+
+        Returns:
+            datetime: The date as an aware UTC datetime, or None if it cannot be parsed.
+        """
+        return self._parse_text(date_text)[0]
+
+    def latest(self, date_text):
+        """
+        Get the latest time a date text can mean, to compare it against a cutoff.
+
+        Args:
+            date_text (str): The text of the ``.PagePromo-date`` element.
+
+        Returns:
+            datetime: The end of the day for texts only precise to the day, otherwise
+            the same as ``normalize``, or None if it cannot be parsed.
+        """
+        parsed, day_precise = self._parse_text(date_text)
+        if parsed is not None and day_precise:
+            return parsed + timedelta(days=1, microseconds=-1)
+        return parsed
+
+    def _parse_text(self, date_text):
+        """
+        Parse a date text through the cache.
+
+        Returns:
+            tuple: The date as an aware UTC datetime, or None, and whether the text
+            is only precise to the day.
+        """
+        text = " ".join((date_text or "").split()).lower()
+        if not text or text == "n/a":
+            return None, False
+        return self._cached_parse(text)
+
+    def _parse(self, text):
+        """
+        Parse a stripped, lowercased date text, see ``_parse_text``.
+        """
+        midnight = self.reference.replace(hour=0, minute=0, second=0, microsecond=0)
+        if text in RELATIVE_NOW:
+            return self.reference, False
+        if text in RELATIVE_DAYS:
+            return midnight - timedelta(days=RELATIVE_DAYS[text]), True
+        match = RELATIVE_DATE_PATTERN.search(text)
+        if match:
+            amount = match.group(1)
+            amount = int(amount) if amount.isdigit() else 1
+            unit = match.group(2)[0]
+            start = midnight if unit in DAY_UNITS else self.reference
+            return start - amount * RELATIVE_UNITS[unit], unit in DAY_UNITS
+        # The reference's month and day exist in both leap years
+        first_default, second_default = (
+            midnight.replace(tzinfo=None, year=year) for year in DEFAULT_YEARS)
+        try:
+            parsed = date_parser.parse(text, default=first_default)
+            other = date_parser.parse(text, default=second_default.replace(hour=23))
+        except (ValueError, OverflowError):
+            return None, False
+        day_precise = parsed.hour != other.hour
+        if parsed.year == other.year:
+            return as_utc(parsed), day_precise
+        return self._latest_past(parsed), day_precise
+
+    def _latest_past(self, parsed):
+        """
+        Give a date parsed without a year the latest year not after the reference.
+
+        Args:
+            parsed (datetime): The parsed date, in a leap year.
+
+        Returns:
+            datetime: The dated UTC datetime, or None if no such year is found.
+        """
+        for year in range(self.reference.year, self.reference.year - MAX_YEARS_BACK, -1):
+            try:
+                candidate = as_utc(parsed.replace(year=year))
+            except ValueError:
+                # February 29 of a year that is not a leap year
+                continue
+            if candidate <= self.reference:
+                return candidate
+        return None
+
+    def cache_info(self):
+        """
+        Get the hit and miss counts of the parse cache.
+
+        Returns:
+            CacheInfo: See ``functools.lru_cache``.
+        """
+        return self._cached_parse.cache_info()
+
+    def window_start(self, months=None, since=None):
+        """
+        Get the oldest publication date to extract.
+
+        Args:
+            months (int): Number of calendar months to extract, the current one
+                included: 0 or 1 for the current month only, 2 for the current and
+                previous month, and so on.
+            since (datetime or str): An explicit cutoff, as a datetime or ISO 8601
+                text (e.g. "2024-03-01T00:00:00Z"). A naive value is taken as UTC.
+
+        Returns:
+            datetime: The later of both cutoffs in UTC, or None if neither is given.
+        """
+        cutoffs = []
+        if months not in (None, ""):
+            months_back = max(int(months), 1) - 1
+            year, month = divmod(
+                self.reference.year * 12 + self.reference.month - 1 - months_back, 12)
+            cutoffs.append(datetime(year, month + 1, 1, tzinfo=timezone.utc))
+        if since:
+            cutoffs.append(as_utc(
+                date_parser.isoparse(since) if isinstance(since, str) else since))
+        return max(cutoffs, default=None)
+
+
+def as_utc(value):
+    """
+    Convert a datetime to UTC.
+
+    Args:
+        value (datetime): The datetime, taken as UTC if it is naive.
+
+    Returns:
+        datetime: The aware UTC datetime.
+    """
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
@@ -0,0 +1,144 @@
+import functools
+import json
+import logging
+import os
+import re
+import shutil
+import subprocess
+
+from selenium.webdriver.chrome.service import Service as ChromeService
+
+CHROME_BINARIES = ("google-chrome", "google-chrome-stable", "chromium", "chromium-browser", "chrome")
+
+CHROME_VERSION_PATTERN = re.compile(r'(\d+)\.\d+\.\d+')
+
+
+def installed_chrome_major_version():
+    """
+    Find the major version of the installed Chrome.
+
+    The binary from the ``CHROME_BINARY`` env variable is tried first, then the usual
+    Chrome and Chromium binary names on the PATH.
+
+    Returns:
+        str: The major version, e.g. "128", or None if no Chrome was found.
+    """
+    candidates = [os.getenv("CHROME_BINARY")] + [shutil.which(name) for name in CHROME_BINARIES]
+    for binary in filter(None, candidates):
+        try:
+            result = subprocess.run(
+                [binary, "--version"], check=True, capture_output=True, text=True, timeout=10)
+        except Exception as e:
+            logging.debug(f"Could not read the version of {binary}: {e}")
+            continue
+        match = CHROME_VERSION_PATTERN.search(result.stdout)
+        if match:
+            return match.group(1)
+    return None
+
+
+def _manifest_path():
+    """
+    Get the path of the local chromedriver manifest.
+
+    Returns:
+        str: The manifest path, inside the ``CHROMEDRIVER_CACHE_DIR`` directory.
+    """
+    cache_dir = os.path.expanduser(os.getenv("CHROMEDRIVER_CACHE_DIR", "~/.cache/chromedriver"))
+    return os.path.join(cache_dir, "manifest.json")
+
+
+def _load_manifest():
+    """
+    Load the local chromedriver manifest.
+
+    Returns:
+        dict: The chromedriver path for each Chrome major version.
+    """
+    try:
+        with open(_manifest_path(), encoding="utf-8") as manifest_file:
+            return json.load(manifest_file)
+    except FileNotFoundError:
+        return {}
+    except Exception as e:
+        logging.warning(f"Ignoring unreadable chromedriver manifest: {e}")
+        return {}
+
+
+def _record_in_manifest(major_version, driver_path):
+    """
+    Record the chromedriver matching a Chrome major version.
+
+    Args:
+        major_version (str): The Chrome major version.
+        driver_path (str): The path of the matching chromedriver.
+    """
+    manifest = _load_manifest()
+    manifest[major_version] = driver_path
+    manifest_path = _manifest_path()
+    try:
+        os.makedirs(os.path.dirname(manifest_path), exist_ok=True)
+        temp_path = f"{manifest_path}.{os.getpid()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as manifest_file:
+            json.dump(manifest, manifest_file, indent=2)
+        os.replace(temp_path, manifest_path)
+    except OSError as e:
+        logging.warning(f"Failed to update chromedriver manifest: {e}")
+
+
+def resolve_chromedriver_path():
+    """
+    Resolve the chromedriver executable without touching the network when possible.
+
+    The sources are checked in order:
+
+    1. The ``CHROMEDRIVER_PATH`` env variable.
+    2. The local manifest entry for the installed Chrome major version.
+    3. ``webdriver_manager``, whose result is then recorded in the manifest.
+
+    Returns:
+        str: The chromedriver path.
+
+    Raises:
+        Exception: If no source can provide a chromedriver.
+    """
+    explicit_path = os.getenv("CHROMEDRIVER_PATH")
+    if explicit_path and os.path.isfile(explicit_path):
+        logging.info(f"Using chromedriver from CHROMEDRIVER_PATH: {explicit_path}")
+        return explicit_path
+    if explicit_path:
+        logging.warning(f"CHROMEDRIVER_PATH {explicit_path} does not exist, ignoring it.")
+
+    major_version = installed_chrome_major_version()
+    cached_path = _load_manifest().get(major_version) if major_version else None
+    if cached_path and os.path.isfile(cached_path):
+        logging.info(f"Using cached chromedriver for Chrome {major_version}: {cached_path}")
+        return cached_path
+
+    # Imported lazily, it is only needed when nothing is cached yet
+    from webdriver_manager.chrome import ChromeDriverManager
+
+    driver_path = ChromeDriverManager().install()
+    logging.info(f"Installed chromedriver with webdriver_manager: {driver_path}")
+    if major_version:
+        _record_in_manifest(major_version, driver_path)
+    return driver_path
+
+
+@functools.lru_cache(maxsize=None)
+def get_chrome_service():
+    """
+    Get the ChromeService for the resolved chromedriver, memoized per process.
+
+    The chromedriver directory is also put first on the PATH, so browsers opened
+    through ``RPA.Browser.Selenium`` pick the same executable instead of
+    downloading one.
+
+    Returns:
+        ChromeService: The service for the resolved chromedriver.
+    """
+    driver_path = resolve_chromedriver_path()
+    driver_dir = os.path.dirname(os.path.abspath(driver_path))
+    if driver_dir not in os.environ.get("PATH", "").split(os.pathsep):
+        os.environ["PATH"] = driver_dir + os.pathsep + os.environ.get("PATH", "")
+    return ChromeService(driver_path)
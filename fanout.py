@@ -0,0 +1,182 @@
+import logging
+import multiprocessing
+import os
+from multiprocessing.util import Finalize
+
+from ExtendedSelenium import ExtendedSelenium, NEWS_DATA_HEADER
+from sinks import XlsxSink
+
+# The browser owned by the current worker process, see ``_start_worker``
+_worker_browser = None
+_worker_output_dir = None
+
+
+def jobs_from_work_item(work_item):
+    """
+    Read the search jobs of the current input work item.
+
+    A work item either carries a ``jobs`` variable, a list of
+    ``{"search_phrase": ..., "news_category": ...}`` objects or
+    ``[search_phrase, news_category]`` pairs, or a single job in its
+    ``search_phrase`` and ``news_category`` variables.
+
+    Args:
+        work_item (WorkItems): The work items library with an active input work item.
+
+    Returns:
+        list: The jobs as dicts with ``search_phrase`` and ``news_category`` keys.
+    """
+    jobs = work_item.get_work_item_variable("jobs", None)
+    if not jobs:
+        return [{
+            "search_phrase": work_item.get_work_item_variable("search_phrase", "COVID"),
+            "news_category": work_item.get_work_item_variable("news_category", "Stories"),
+        }]
+    return [
+        job if isinstance(job, dict) else {"search_phrase": job[0], "news_category": job[1]}
+        for job in jobs
+    ]
+
+
+def _start_worker(worker_ids, output_root):
+    """
+    Create the browser owned by a worker process.
+
+    Args:
+        worker_ids (Queue): Hands out a distinct id to each worker process.
+        output_root (str): The directory holding the worker output directories.
+    """
+    global _worker_browser, _worker_output_dir
+    _worker_output_dir = os.path.join(output_root, f"worker-{worker_ids.get()}")
+    # The worker has no work item, its files are handed back to the parent process
+    _worker_browser = ExtendedSelenium(
+        work_item=None, output_dir=_worker_output_dir, attachment_flush_threshold=0)
+    # Close Chrome when the worker process exits
+    Finalize(_worker_browser, _worker_browser.close_all_browsers, exitpriority=10)
+
+
+def _run_job(job_id, job, home_url, max_pages, since):
+    """
+    Run one search job with the browser of the current worker process.
+
+    Every job writes into its own directory inside the worker output directory, so
+    no two jobs ever write the same file.
+
+    Args:
+        job_id (int): The id of the job, unique within the runner.
+        job (dict): The job, see ``jobs_from_work_item``.
+        home_url (str): The home page of the news website.
+        max_pages (int): Maximum number of result pages to crawl.
+        since (datetime): Skip articles older than this.
+
+    Returns:
+        tuple: The job id, the extracted rows and the files produced by the job.
+    """
+    browser = _worker_browser
+    browser.set_output_dir(os.path.join(_worker_output_dir, f"job-{job_id}"))
+    browser.start_run()
+    rows = browser.run_news_search(
+        home_url, job["search_phrase"], job["news_category"], max_pages=max_pages, since=since,
+        keep_rows=True)
+    browser.wait_for_screenshots()
+    files, browser.pending_attachments = browser.pending_attachments, []
+    return job_id, rows, files
+
+
+class FanOutRunner:
+    """
+    Spread search jobs over a pool of worker processes, each owning one browser.
+
+    The worker processes and their browsers stay up for the lifetime of the runner,
+    so several batches of jobs (e.g. one per work item) reuse the same warm browsers.
+
+    Example:
+        with FanOutRunner(workers=4, home_url="https://apnews.com/") as runner:
+            rows, files = runner.run(jobs)
+    """
+
+    def __init__(self, workers=2, home_url="https://apnews.com/", output_root="output/fanout"):
+        """
+        Initialize the FanOutRunner instance.
+
+        Args:
+            workers (int): Number of worker processes.
+            home_url (str): The home page of the news website.
+            output_root (str): The directory holding the worker output directories.
+        """
+        self.workers = workers
+        self.home_url = home_url
+        self.output_root = output_root
+        self.pool = None
+        self._next_job_id = 0
+
+    def __enter__(self):
+        # Chrome and the driver threads do not survive a fork, so always spawn
+        context = multiprocessing.get_context("spawn")
+        worker_ids = context.Queue()
+        for worker_id in range(self.workers):
+            worker_ids.put(worker_id)
+        self.pool = context.Pool(
+            processes=self.workers, initializer=_start_worker,
+            initargs=(worker_ids, self.output_root))
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.pool.close()
+        else:
+            self.pool.terminate()
+        self.pool.join()
+
+    def run(self, jobs, max_pages=1, since=None):
+        """
+        Run the jobs on the worker processes and merge their results.
+
+        Args:
+            jobs (list): The jobs, see ``jobs_from_work_item``.
+            max_pages (int): Maximum number of result pages to crawl per job.
+            since (datetime): Skip articles older than this.
+
+        Returns:
+            tuple: The merged rows, in job order and prefixed with the job's search
+            phrase and category, and the files produced by all jobs.
+        """
+        numbered_jobs = {}
+        for job in jobs:
+            numbered_jobs[self._next_job_id] = job
+            self._next_job_id += 1
+        results = {}
+        pending = [
+            self.pool.apply_async(_run_job, (job_id, job, self.home_url, max_pages, since))
+            for job_id, job in numbered_jobs.items()
+        ]
+        for result in pending:
+            job_id, rows, files = result.get()
+            results[job_id] = (rows, files)
+            logging.info(f"Job {job_id} {numbered_jobs[job_id]} extracted {len(rows)} rows")
+
+        merged_rows, merged_files = [], []
+        for job_id, job in numbered_jobs.items():
+            rows, files = results[job_id]
+            merged_rows.extend(
+                [job["search_phrase"], job["news_category"], *row] for row in rows)
+            merged_files.extend(files)
+        return merged_rows, merged_files
+
+
+def write_merged_rows(rows, output_path):
+    """
+    Write the merged rows of a fan-out run to an Excel file.
+
+    Args:
+        rows (list): The rows returned by ``FanOutRunner.run``.
+        output_path (str): The path of the Excel file.
+
+    Returns:
+        str: The path of the Excel file.
+    """
+    with XlsxSink(os.path.splitext(output_path)[0],
+                  ["Search Phrase", "News Category", *NEWS_DATA_HEADER]) as sink:
+        sink.write_rows(rows)
+    logging.info(f"Merged {len(rows)} rows into {sink.path}")
+    return sink.path
@@ -0,0 +1,199 @@
+import hashlib
+import json
+import logging
+import os
+import shutil
+import threading
+import time
+
+try:
+    import fcntl
+except ImportError:  # Windows, the index is then merged without a file lock
+    fcntl = None
+
+
+class ImageCache:
+    """
+    On-disk, content-addressed image cache shared across runs.
+
+    Image bytes are stored once per content hash, and a small JSON index maps each
+    image URL to its content hash, size, content type and last use time. When the
+    cache grows past its size cap, the least recently used entries are evicted.
+    """
+
+    INDEX_FILENAME = "index.json"
+    LOCK_FILENAME = "index.lock"
+
+    def __init__(self, cache_dir, max_bytes=200 * 1024 * 1024):
+        """
+        Initialize the ImageCache instance and load its index.
+
+        Args:
+            cache_dir (str): The directory holding the cached images and the index.
+            max_bytes (int): The size cap of the cache in bytes.
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.index_path = os.path.join(cache_dir, self.INDEX_FILENAME)
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        # URLs evicted since the last save, so merging does not bring them back
+        self._evicted = set()
+        os.makedirs(cache_dir, exist_ok=True)
+        self.entries = self._load_index()
+
+    def _load_index(self):
+        """
+        Load the index file, dropping entries whose image file is missing.
+
+        Returns:
+            dict: The index entries keyed by URL.
+        """
+        try:
+            with open(self.index_path, encoding="utf-8") as index_file:
+                entries = json.load(index_file)
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logging.warning(f"Ignoring unreadable image cache index {self.index_path}: {e}")
+            return {}
+        return {
+            url: entry for url, entry in entries.items()
+            if os.path.exists(self._blob_path(entry["sha256"]))
+        }
+
+    def _blob_path(self, sha256):
+        """
+        Get the path where the image with the given content hash is stored.
+
+        Args:
+            sha256 (str): The content hash.
+
+        Returns:
+            str: The path of the cached image.
+        """
+        return os.path.join(self.cache_dir, sha256[:2], sha256)
+
+    def get(self, url):
+        """
+        Look up an image by URL and mark it as recently used.
+
+        Args:
+            url (str): The image URL.
+
+        Returns:
+            dict: The index entry (with ``path`` and ``content_type``), or None on a miss.
+        """
+        with self._lock:
+            entry = self.entries.get(url)
+            if entry is None or not os.path.exists(self._blob_path(entry["sha256"])):
+                self.entries.pop(url, None)
+                self.misses += 1
+                return None
+            entry["last_used"] = time.time()
+            self.hits += 1
+            return {**entry, "path": self._blob_path(entry["sha256"])}
+
+    def put(self, url, content, content_type=None):
+        """
+        Store an image in the cache, evicting old entries if needed.
+
+        Args:
+            url (str): The image URL.
+            content (bytes): The image bytes.
+            content_type (str): The response content type.
+
+        Returns:
+            str: The path of the cached image.
+        """
+        sha256 = hashlib.sha256(content).hexdigest()
+        blob_path = self._blob_path(sha256)
+        with self._lock:
+            if not os.path.exists(blob_path):
+                os.makedirs(os.path.dirname(blob_path), exist_ok=True)
+                temp_path = f"{blob_path}.{threading.get_ident()}.tmp"
+                with open(temp_path, "wb") as blob_file:
+                    blob_file.write(content)
+                os.replace(temp_path, blob_path)
+            self.entries[url] = {
+                "sha256": sha256,
+                "size": len(content),
+                "content_type": content_type,
+                "last_used": time.time(),
+            }
+            self._evict()
+        return blob_path
+
+    def _evict(self):
+        """
+        Evict least recently used entries until the cache fits its size cap.
+
+        Several URLs can share one image file, so a file is only deleted once no
+        remaining entry refers to it. Must be called with the lock held.
+        """
+        blob_sizes = {entry["sha256"]: entry["size"] for entry in self.entries.values()}
+        total = sum(blob_sizes.values())
+        if total <= self.max_bytes:
+            return
+        for url, entry in sorted(self.entries.items(), key=lambda item: item[1]["last_used"]):
+            if total <= self.max_bytes:
+                break
+            del self.entries[url]
+            self._evicted.add(url)
+            sha256 = entry["sha256"]
+            if any(other["sha256"] == sha256 for other in self.entries.values()):
+                continue
+            total -= blob_sizes[sha256]
+            try:
+                os.remove(self._blob_path(sha256))
+            except FileNotFoundError:
+                pass
+            logging.info(f"Evicted cached image {url}")
+
+    @staticmethod
+    def materialize(cached_path, destination):
+        """
+        Place a cached image at the destination path.
+
+        A hard link is used when possible, falling back to a copy when the cache and
+        the destination are on different file systems.
+
+        Args:
+            cached_path (str): The path of the cached image.
+            destination (str): The path where the image is needed.
+        """
+        os.makedirs(os.path.dirname(destination) or ".", exist_ok=True)
+        if os.path.exists(destination):
+            os.remove(destination)
+        try:
+            os.link(cached_path, destination)
+        except OSError:
+            shutil.copyfile(cached_path, destination)
+
+    def save(self):
+        """
+        Merge the index with the one on disk and write it atomically.
+
+        Other processes sharing the cache may have saved entries since the index was
+        loaded. Under an exclusive lock on the lock file, the index on disk is read
+        again, merged with this one (the most recent use of an entry wins, entries
+        evicted here stay evicted), trimmed to the size cap and replaced.
+        """
+        with self._lock, open(os.path.join(self.cache_dir, self.LOCK_FILENAME), "a") as lock_file:
+            if fcntl:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            merged = {url: entry for url, entry in self._load_index().items()
+                      if url not in self._evicted}
+            for url, entry in self.entries.items():
+                if url not in merged or merged[url]["last_used"] < entry["last_used"]:
+                    merged[url] = entry
+            self.entries = merged
+            self._evict()
+            self._evicted.clear()
+            temp_path = f"{self.index_path}.{os.getpid()}.tmp"
+            with open(temp_path, "w", encoding="utf-8") as index_file:
+                json.dump(self.entries, index_file)
+            os.replace(temp_path, self.index_path)
+        logging.info(f"Image cache: {self.hits} hits, {self.misses} misses, "
+                     f"{len(self.entries)} entries")
@@ -0,0 +1,170 @@
+import hashlib
+import logging
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urljoin, urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".gif", ".webp", ".avif")
+
+CONTENT_TYPE_EXTENSIONS = {
+    "image/jpeg": ".jpg",
+    "image/png": ".png",
+    "image/gif": ".gif",
+    "image/webp": ".webp",
+    "image/avif": ".avif",
+}
+
+# srcset candidates are separated by a comma followed by whitespace; a bare comma
+# can be part of the URL itself (image CDNs use them in resize parameters).
+SRCSET_CANDIDATE_SEPARATOR = re.compile(r',\s+')
+
+
+class ImageDownloader:
+    """
+    Download article images in parallel over a pooled HTTP session.
+
+    Images are fetched directly from their ``src``/``srcset`` URLs instead of being
+    captured from the page, so the browser is not involved at all. Files are named
+    after a hash of their URL, which makes the names deterministic across runs.
+    Images found in the optional ``ImageCache`` are placed in the output directory
+    without any network request.
+    """
+
+    def __init__(self, output_dir="output", max_workers=8, timeout=15, cache=None):
+        """
+        Initialize the ImageDownloader instance.
+
+        Args:
+            output_dir (str): The directory where the images are saved.
+            max_workers (int): Maximum number of concurrent downloads, which is also
+                the size of the HTTP connection pool.
+            timeout (int): Timeout in seconds for each request.
+            cache (ImageCache): The image cache to read from and fill, if any.
+        """
+        self.output_dir = output_dir
+        self.cache = cache
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=max_workers,
+            pool_maxsize=max_workers,
+            max_retries=Retry(total=2, backoff_factor=0.3,
+                              status_forcelist=[429, 500, 502, 503, 504]),
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    @staticmethod
+    def pick_source(src, srcset=None, base_url=None):
+        """
+        Pick the URL of the largest image candidate.
+
+        Args:
+            src (str): The ``src`` attribute of the image.
+            srcset (str): The ``srcset`` attribute of the image, if any.
+            base_url (str): The page URL used to resolve relative URLs.
+
+        Returns:
+            str: The absolute image URL, or None if there is no usable source.
+        """
+        best_url, best_width = src, 0
+        for candidate in SRCSET_CANDIDATE_SEPARATOR.split((srcset or "").strip()):
+            parts = candidate.split()
+            if not parts:
+                continue
+            width = 1
+            if len(parts) > 1 and parts[-1][:-1].replace(".", "", 1).isdigit():
+                width = float(parts[-1][:-1])
+            if width > best_width:
+                best_url, best_width = parts[0], width
+        if not best_url or best_url.startswith("data:"):
+            return None
+        return urljoin(base_url, best_url) if base_url else best_url
+
+    @staticmethod
+    def image_filename(url, content_type=None):
+        """
+        Build the deterministic filename of an image URL.
+
+        Args:
+            url (str): The image URL.
+            content_type (str): The response content type, used when the URL has no
+                recognizable extension.
+
+        Returns:
+            str: The filename, e.g. ``image-3f2a9c0d1b7e4a55.jpg``.
+        """
+        extension = os.path.splitext(urlparse(url).path)[1].lower()
+        if extension not in IMAGE_EXTENSIONS:
+            media_type = (content_type or "").split(";")[0].strip().lower()
+            extension = CONTENT_TYPE_EXTENSIONS.get(media_type, ".jpg")
+        digest = hashlib.sha1(url.encode("utf-8")).hexdigest()[:16]
+        return f"image-{digest}{extension}"
+
+    def download(self, url):
+        """
+        Download a single image into the output directory.
+
+        Args:
+            url (str): The image URL.
+
+        Returns:
+            str: The filename where the image was saved, or "N/A" on failure.
+        """
+        try:
+            cached = self.cache.get(url) if self.cache else None
+            if cached:
+                filename = self.image_filename(url, cached["content_type"])
+                filepath = os.path.join(self.output_dir, filename)
+                self.cache.materialize(cached["path"], filepath)
+                logging.info(f"Image taken from cache: {filepath}")
+                return filename
+
+            response = self.session.get(url, timeout=self.timeout)
+            response.raise_for_status()
+            content_type = response.headers.get("Content-Type")
+            filename = self.image_filename(url, content_type)
+            filepath = os.path.join(self.output_dir, filename)
+            os.makedirs(self.output_dir, exist_ok=True)
+            with open(filepath, "wb") as image_file:
+                image_file.write(response.content)
+            if self.cache:
+                self.cache.put(url, response.content, content_type)
+            logging.info(f"Image downloaded: {filepath}")
+            return filename
+        except Exception as e:
+            logging.error(f"Failed to download image {url}: {e}")
+            return "N/A"
+
+    def download_all(self, urls):
+        """
+        Download several images concurrently.
+
+        Duplicate URLs are only fetched once.
+
+        Args:
+            urls (list): The image URLs.
+
+        Returns:
+            dict: The saved filename (or "N/A") for each URL.
+        """
+        unique_urls = list(dict.fromkeys(url for url in urls if url))
+        if not unique_urls:
+            return {}
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            filenames = pool.map(self.download, unique_urls)
+            return dict(zip(unique_urls, filenames))
+
+    def close(self):
+        """
+        Close the pooled HTTP session and persist the cache index.
+        """
+        self.session.close()
+        if self.cache:
+            self.cache.save()
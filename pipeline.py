@@ -0,0 +1,233 @@
+import asyncio
+import functools
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+from text_analytics import TextAnalyzer
+
+# Marks the end of the stream of items in a pipeline queue
+END = object()
+
+
+class SearchPipeline:
+    """
+    Run a news search as an asyncio pipeline around the browser.
+
+    The browser is the single producer: it loads the results and reads one page after
+    another. Each page then flows through concurrent consumers joined by bounded
+    queues:
+
+    browser -> image download -> text analysis -> sink writing -> work item uploads
+
+    A full queue makes the stage before it wait, so the browser never runs more than
+    ``queue_size`` pages ahead of the slowest consumer. Blocking calls run on
+    dedicated threads: one for the browser, since Selenium must not be used
+    concurrently, one for the text analysis, one for the sink and one for the work
+    item, while image downloads use the ``ImageDownloader`` pool. If any stage fails, the other stages are
+    cancelled and the browser is closed.
+
+    Example:
+        pipeline = SearchPipeline(browser)
+        try:
+            asyncio.run(pipeline.run(home_url, "COVID", "Stories", max_pages=3))
+        finally:
+            pipeline.close()
+    """
+
+    def __init__(self, browser, queue_size=2):
+        """
+        Initialize the SearchPipeline instance.
+
+        Args:
+            browser (ExtendedSelenium): The browser, also used to stage the files for
+                its work item.
+            queue_size (int): Number of pages each queue holds before the stage
+                feeding it waits.
+        """
+        self.browser = browser
+        self.queue_size = queue_size
+        self._browser_thread = ThreadPoolExecutor(max_workers=1, thread_name_prefix="browser")
+        self._sink_thread = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sink")
+        self._analysis_thread = ThreadPoolExecutor(max_workers=1, thread_name_prefix="analysis")
+        self._work_item_thread = ThreadPoolExecutor(max_workers=1, thread_name_prefix="work-item")
+        self._download_threads = ThreadPoolExecutor(max_workers=2, thread_name_prefix="images")
+
+    @staticmethod
+    def _run_on(executor, function, *args, **kwargs):
+        return asyncio.get_running_loop().run_in_executor(
+            executor, functools.partial(function, *args, **kwargs))
+
+    def on_browser(self, function, *args, **kwargs):
+        """
+        Run a blocking call on the browser thread.
+
+        Args:
+            function (callable): The function to call.
+
+        Returns:
+            Future: Awaitable result of the call.
+        """
+        return self._run_on(self._browser_thread, function, *args, **kwargs)
+
+    def on_work_item(self, function, *args, **kwargs):
+        """
+        Run a blocking call on the work item thread.
+
+        Args:
+            function (callable): The function to call.
+
+        Returns:
+            Future: Awaitable result of the call.
+        """
+        return self._run_on(self._work_item_thread, function, *args, **kwargs)
+
+    async def run(self, home_url, search_phrase, news_category, max_pages=1, since=None,
+                  navigation=None, bulk=True):
+        """
+        Search the news and extract the results into the output file.
+
+        The output file and the images are staged and flushed to the work item while
+        the browser keeps crawling. With a checkpoint (see
+        ``ExtendedSelenium.use_checkpoint``) the progress is saved after every page
+        written, and a resumed run starts at the page the checkpoint stopped at.
+
+        Args:
+            home_url (str): The home page of the news website.
+            search_phrase (str): The phrase to search for.
+            news_category (str): The category to filter the results by.
+            max_pages (int): Maximum number of result pages to crawl.
+            since (datetime): Skip articles older than this.
+            navigation (str): "direct" or "click", see ``ExtendedSelenium.run_news_search``.
+            bulk (bool): Read the articles with a single script call per page.
+
+        Returns:
+            int: The number of rows written.
+
+        Raises:
+            Exception: The error of the first failing stage, after the browser is closed.
+        """
+        browser = self.browser
+        sink = browser.open_news_data_sink()
+        analyzer = TextAnalyzer([search_phrase], whole_words=browser.phrase_whole_words)
+        pages, downloaded, analysed, uploads = (
+            asyncio.Queue(self.queue_size) for _ in range(4))
+        stages = [
+            asyncio.create_task(self._read_pages(
+                pages, home_url, search_phrase, news_category, max_pages, since,
+                navigation, bulk)),
+            asyncio.create_task(self._download_images(pages, downloaded)),
+            asyncio.create_task(self._analyse(downloaded, analysed, analyzer)),
+            asyncio.create_task(self._write(analysed, uploads, sink)),
+            asyncio.create_task(self._upload(uploads)),
+        ]
+        try:
+            await asyncio.gather(*stages)
+        except BaseException as e:
+            logging.error(f"Search pipeline failed, cancelling its stages: {e!r}")
+            for stage in stages:
+                stage.cancel()
+            await asyncio.gather(*stages, return_exceptions=True)
+            await self.on_browser(browser.close_all_browsers)
+            # Keep the pages written so far, the caller flushes them to the work item
+            try:
+                await self._run_on(self._sink_thread, sink.close)
+                browser.stage_work_item_file(sink.path, auto_flush=False)
+            except Exception as close_error:
+                logging.error(f"Failed to close {sink.path}: {close_error}")
+            raise
+        if browser.image_downloader.cache:
+            browser.image_downloader.cache.save()
+        if browser.seen_index:
+            await self.on_browser(browser.seen_index.compact)
+        if browser.popup_watcher:
+            browser.log_popup_stats()
+        return sink.rows_written
+
+    async def _read_pages(self, pages, home_url, search_phrase, news_category, max_pages,
+                          since, navigation, bulk):
+        """
+        Producer: reach the results and read the records of every page.
+        """
+        browser = self.browser
+        first_page = await self.on_browser(
+            browser.reach_search_results, home_url, search_phrase, news_category, navigation)
+        newest_first = await self.on_browser(browser.results_newest_first, since)
+        seen_run = 0
+        for page in range(first_page, max_pages + 1):
+            page_url = await self.on_browser(lambda: browser.driver.current_url)
+            records, seen_run, stop_reason = await self.on_browser(
+                browser.read_results_page, bulk, since, seen_run, newest_first)
+            logging.info(f"Extracted {len(records)} articles from page {page}")
+            await pages.put((records, (page_url, page)))
+            if stop_reason:
+                logging.info(f"{stop_reason}, stopping.")
+                break
+            if page == max_pages or not await self.on_browser(browser.go_to_next_results_page):
+                break
+        await pages.put(END)
+
+    async def _download_images(self, pages, downloaded):
+        """
+        Consumer: download the images of each page.
+        """
+        downloader = self.browser.image_downloader
+        while (item := await pages.get()) is not END:
+            records, _ = item
+            filenames = await self._run_on(
+                self._download_threads, downloader.download_all,
+                [record["image_url"] for record in records if record["image_url"]])
+            for record in records:
+                if record["image_url"]:
+                    record["image_filename"] = filenames.get(record["image_url"], "N/A")
+            await downloaded.put(item)
+        await downloaded.put(END)
+
+    async def _analyse(self, downloaded, analysed, analyzer):
+        """
+        Consumer: count the search phrases and detect money, building the rows on the
+        analysis thread so the event loop keeps serving the other stages.
+        """
+        while (item := await downloaded.get()) is not END:
+            records, cursor = item
+            rows = await self._run_on(
+                self._analysis_thread, self.browser.build_rows, records, analyzer)
+            await analysed.put((records, rows, cursor))
+        await analysed.put(END)
+
+    async def _write(self, analysed, uploads, sink):
+        """
+        Consumer: write the rows of each page to the sink and save it to the
+        checkpoint, then hand its files over for upload.
+        """
+        browser = self.browser
+        while (item := await analysed.get()) is not END:
+            records, rows, cursor = item
+            await self._run_on(self._sink_thread, sink.write_rows, rows)
+            await self._run_on(self._sink_thread, browser.mark_records_seen, records)
+            await self._run_on(
+                self._sink_thread, browser.checkpoint_page, sink, records, rows, *cursor)
+            await uploads.put(browser.downloaded_image_paths(records))
+        await self._run_on(self._sink_thread, sink.close)
+        logging.info(f"Data extracted and stored in {sink.path}")
+        await uploads.put([sink.path])
+        await uploads.put(END)
+
+    async def _upload(self, uploads):
+        """
+        Consumer: stage the files and flush them to the work item whenever no more
+        files are waiting, so uploads go out while the browser keeps crawling.
+        """
+        browser = self.browser
+        while (paths := await uploads.get()) is not END:
+            for path in paths:
+                browser.stage_work_item_file(path, auto_flush=False)
+            if uploads.empty() and browser.work_item:
+                await self.on_work_item(browser.flush_work_item_files)
+
+    def close(self):
+        """
+        Shut the pipeline threads down.
+        """
+        for executor in (self._browser_thread, self._sink_thread, self._analysis_thread,
+                         self._work_item_thread, self._download_threads):
+            executor.shutdown(wait=True)
@@ -0,0 +1,337 @@
+import functools
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+from selenium.webdriver.remote.command import Command
+
+# Reads the Navigation Timing entry of the current document, in milliseconds from
+# the start of the navigation
+NAVIGATION_TIMING_JS = """
+var entry = performance.getEntriesByType('navigation')[0];
+if (!entry) { return null; }
+return {
+    url: entry.name,
+    response_end: entry.responseEnd,
+    dom_interactive: entry.domInteractive,
+    dom_content_loaded: entry.domContentLoadedEventEnd,
+    load: entry.loadEventEnd,
+    transfer_size: entry.transferSize
+};
+"""
+
+
+class RunProfiler:
+    """
+    Collect where the time of a run goes.
+
+    Records, for a run:
+
+    - steps: calls, wall time and WebDriver commands of each wrapped keyword, nested
+      steps included in their caller
+    - commands: count and latency of each WebDriver command type
+    - page loads: the Navigation Timing of every page opened with ``go_to``
+    - waits: time spent in explicit waits and failed click attempts
+    - memory: with a ``memory_sampler``, the peak memory of the run and of each step,
+      sampled on a background thread
+
+    Example:
+        profiler = RunProfiler()
+        profiler.instrument_driver(driver)
+        with profiler.step("extract"):
+            ...
+        profiler.write("output/run_profile.json")
+    """
+
+    def __init__(self, memory_sampler=None, sample_interval=0.5):
+        """
+        Initialize the RunProfiler instance.
+
+        Args:
+            memory_sampler (callable): Returns the memory in use, in bytes, e.g. the
+                RSS of the process tree running the browser. No memory is recorded
+                without it.
+            sample_interval (float): Seconds between two memory samples.
+        """
+        self.started = time.time()
+        self.steps = {}
+        self.commands = {}
+        self.page_loads = []
+        self.waits = {}
+        self.total_commands = 0
+        self.peak_rss = 0
+        self._lock = threading.Lock()
+        self.memory_sampler = memory_sampler
+        # Running peak memory of each step in progress, keyed by a token per call
+        self._step_peaks = {}
+        self._stop_sampling = threading.Event()
+        if memory_sampler:
+            threading.Thread(
+                target=self._sample_memory, args=(sample_interval,), daemon=True,
+                name="memory-sampler").start()
+
+    def _sample_memory(self, interval):
+        while not self._stop_sampling.wait(interval):
+            self.record_memory()
+
+    def record_memory(self):
+        """
+        Take a memory sample now.
+
+        Returns:
+            int: The memory in use, in bytes.
+        """
+        try:
+            value = self.memory_sampler()
+        except Exception as e:
+            logging.debug(f"Could not sample the memory use: {e}")
+            return 0
+        with self._lock:
+            self.peak_rss = max(self.peak_rss, value)
+            for token, peak in self._step_peaks.items():
+                self._step_peaks[token] = max(peak, value)
+        return value
+
+    def stop_sampling(self):
+        """
+        Stop the background memory sampling.
+        """
+        self._stop_sampling.set()
+
+    @contextmanager
+    def step(self, name):
+        """
+        Time a step and count the WebDriver commands sent during it.
+
+        Args:
+            name (str): The step name.
+        """
+        commands_before = self.total_commands
+        started = time.perf_counter()
+        failed = False
+        token = object()
+        if self.memory_sampler:
+            with self._lock:
+                self._step_peaks[token] = 0
+        try:
+            yield
+        except Exception:
+            failed = True
+            raise
+        finally:
+            elapsed = time.perf_counter() - started
+            peak = 0
+            if self.memory_sampler:
+                self.record_memory()
+                with self._lock:
+                    peak = self._step_peaks.pop(token)
+                logging.info(f"Step {name} took {elapsed:.2f}s, peak memory "
+                             f"{peak / 2 ** 20:.0f} MB")
+            with self._lock:
+                step = self.steps.setdefault(
+                    name, {"calls": 0, "errors": 0, "seconds": 0.0, "commands": 0,
+                           "peak_rss_mb": 0.0})
+                step["calls"] += 1
+                step["errors"] += failed
+                step["seconds"] += elapsed
+                step["commands"] += self.total_commands - commands_before
+                step["peak_rss_mb"] = max(step["peak_rss_mb"], round(peak / 2 ** 20, 1))
+
+    def profiled(self, name, function):
+        """
+        Wrap a function so every call is recorded as a step.
+
+        Args:
+            name (str): The step name.
+            function (callable): The function to wrap.
+
+        Returns:
+            callable: The wrapped function.
+        """
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            with self.step(name):
+                return function(*args, **kwargs)
+        return wrapper
+
+    def profiled_wait(self, kind, function):
+        """
+        Wrap a function so every call is recorded as a wait.
+
+        Args:
+            kind (str): What the function waits for.
+            function (callable): The function to wrap.
+
+        Returns:
+            callable: The wrapped function.
+        """
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            with self.wait(kind):
+                return function(*args, **kwargs)
+        return wrapper
+
+    @contextmanager
+    def wait(self, kind):
+        """
+        Time a wait.
+
+        Args:
+            kind (str): What is waited for, e.g. the wait keyword name.
+        """
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record_wait(kind, time.perf_counter() - started)
+
+    def record_wait(self, kind, seconds, retry=False):
+        """
+        Record time spent waiting or in a failed attempt that is retried.
+
+        Args:
+            kind (str): What was waited for.
+            seconds (float): The time spent.
+            retry (bool): Whether the time was lost in a failed attempt.
+        """
+        with self._lock:
+            wait = self.waits.setdefault(kind, {"count": 0, "retries": 0, "seconds": 0.0})
+            wait["count"] += 1
+            wait["retries"] += retry
+            wait["seconds"] += seconds
+
+    def instrument_driver(self, driver):
+        """
+        Time every WebDriver command the driver sends, and read the Navigation Timing
+        after every ``get``.
+
+        Instrumenting a driver twice is a no-op.
+
+        Args:
+            driver (WebDriver): The driver to instrument.
+        """
+        if getattr(driver, "_run_profiler", None) is self:
+            return
+        execute = driver.execute
+
+        def profiled_execute(driver_command, params=None):
+            started = time.perf_counter()
+            try:
+                return execute(driver_command, params)
+            finally:
+                self.record_command(driver_command, time.perf_counter() - started)
+                if driver_command == Command.GET:
+                    self._record_page_load(execute)
+
+        driver.execute = profiled_execute
+        driver._run_profiler = self
+
+    def record_command(self, command, seconds):
+        """
+        Record one WebDriver command.
+
+        Args:
+            command (str): The command name, e.g. "findElement".
+            seconds (float): Its latency.
+        """
+        with self._lock:
+            self.total_commands += 1
+            entry = self.commands.setdefault(command, {"count": 0, "seconds": 0.0})
+            entry["count"] += 1
+            entry["seconds"] += seconds
+
+    def _record_page_load(self, execute):
+        """
+        Read the Navigation Timing of the page just opened.
+
+        The script is sent with the uninstrumented ``execute`` so it is not counted as
+        a command of the run.
+
+        Args:
+            execute (callable): The original ``WebDriver.execute``.
+        """
+        try:
+            timing = execute(
+                Command.W3C_EXECUTE_SCRIPT, {"script": NAVIGATION_TIMING_JS, "args": []})["value"]
+        except Exception as e:
+            logging.debug(f"Could not read the Navigation Timing: {e}")
+            return
+        if timing:
+            with self._lock:
+                self.page_loads.append(timing)
+
+    def to_dict(self):
+        """
+        Build the profile.
+
+        Returns:
+            dict: The profile, ready to be serialized to JSON.
+        """
+        with self._lock:
+            return {
+                "started": self.started,
+                "wall_seconds": time.time() - self.started,
+                "total_commands": self.total_commands,
+                "peak_rss_mb": round(self.peak_rss / 2 ** 20, 1),
+                "steps": {name: dict(step) for name, step in self.steps.items()},
+                "commands": {name: dict(entry) for name, entry in self.commands.items()},
+                "page_loads": list(self.page_loads),
+                "waits": {kind: dict(wait) for kind, wait in self.waits.items()},
+            }
+
+    def write(self, path):
+        """
+        Write the profile as JSON.
+
+        Args:
+            path (str): The path of the JSON file.
+
+        Returns:
+            str: The path of the JSON file.
+        """
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w", encoding="utf-8") as profile_file:
+            json.dump(self.to_dict(), profile_file, indent=2)
+        return path
+
+    def summary(self):
+        """
+        Format the profile as a short table.
+
+        Returns:
+            str: The summary, one line per step, command type and wait.
+        """
+        profile = self.to_dict()
+        lines = [f"Run profile: {profile['wall_seconds']:.1f}s, "
+                 f"{profile['total_commands']} WebDriver commands, "
+                 f"peak memory {profile['peak_rss_mb']:.0f} MB",
+                 f"{'Step':<36}{'Calls':>7}{'Errors':>8}{'Time (s)':>10}{'Commands':>10}"
+                 f"{'Peak MB':>9}"]
+        for name, step in sorted(
+                profile["steps"].items(), key=lambda item: -item[1]["seconds"]):
+            lines.append(f"{name:<36}{step['calls']:>7}{step['errors']:>8}"
+                         f"{step['seconds']:>10.2f}{step['commands']:>10}"
+                         f"{step['peak_rss_mb']:>9.0f}")
+        lines.append(
+            f"{'WebDriver command':<36}{'Count':>7}{'':>8}{'Time (s)':>10}{'Avg (ms)':>10}")
+        for name, entry in sorted(
+                profile["commands"].items(), key=lambda item: -item[1]["seconds"]):
+            lines.append(f"{name:<36}{entry['count']:>7}{'':>8}{entry['seconds']:>10.2f}"
+                         f"{entry['seconds'] * 1000 / entry['count']:>10.1f}")
+        lines.append(f"{'Wait':<36}{'Count':>7}{'Retries':>8}{'Time (s)':>10}")
+        for kind, wait in sorted(profile["waits"].items(), key=lambda item: -item[1]["seconds"]):
+            lines.append(f"{kind:<36}{wait['count']:>7}{wait['retries']:>8}"
+                         f"{wait['seconds']:>10.2f}")
+        if profile["page_loads"]:
+            loads = profile["page_loads"]
+            average = {key: sum(load.get(key) or 0 for load in loads) / len(loads)
+                       for key in ("response_end", "dom_content_loaded", "load")}
+            lines.append(
+                f"{len(loads)} page loads, average response end "
+                f"{average['response_end']:.0f}ms, "
+                f"DOMContentLoaded {average['dom_content_loaded']:.0f}ms, "
+                f"load {average['load']:.0f}ms")
+        return "\n".join(lines)
@@ -0,0 +1,74 @@
+import logging
+import os
+
+
+def child_pids(pid):
+    """
+    List the direct children of a process.
+
+    Args:
+        pid (int): The parent process id.
+
+    Returns:
+        list: The child process ids, empty if they cannot be read.
+    """
+    children = []
+    task_dir = f"/proc/{pid}/task"
+    try:
+        thread_ids = os.listdir(task_dir)
+    except OSError:
+        return children
+    for thread_id in thread_ids:
+        try:
+            with open(os.path.join(task_dir, thread_id, "children")) as children_file:
+                children.extend(int(child) for child in children_file.read().split())
+        except OSError:
+            continue
+    return children
+
+
+def process_rss(pid):
+    """
+    Read the resident set size of a single process.
+
+    Args:
+        pid (int): The process id.
+
+    Returns:
+        int: The RSS in bytes, 0 if it cannot be read.
+    """
+    try:
+        with open(f"/proc/{pid}/status") as status_file:
+            for line in status_file:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return 0
+
+
+def process_tree_rss(pid):
+    """
+    Sum the resident set size of a process and all its descendants.
+
+    Chrome runs as a tree of processes under chromedriver (browser, renderers, GPU
+    and utility processes), so the tree total is what counts against the runner's
+    memory. Only Linux is supported; elsewhere this returns 0.
+
+    Args:
+        pid (int): The root process id, e.g. the chromedriver process.
+
+    Returns:
+        int: The total RSS in bytes.
+    """
+    total, pending, seen = 0, [pid], set()
+    while pending:
+        current = pending.pop()
+        if current in seen:
+            continue
+        seen.add(current)
+        total += process_rss(current)
+        pending.extend(child_pids(current))
+    if not total:
+        logging.debug(f"Could not read the memory usage of process tree {pid}")
+    return total
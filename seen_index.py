@@ -0,0 +1,137 @@
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+
+
+class SeenArticleIndex:
+    """
+    Persistent index of the articles extracted by earlier runs, backed by SQLite.
+
+    An article is identified by its URL together with a hash of its title and
+    publication date, so an article whose headline changes is extracted again. Entries
+    expire ``ttl_days`` after they were last seen on a results page. The index can be
+    shared by several processes, SQLite serializes their writes, and used from any
+    thread of a process.
+    """
+
+    def __init__(self, path, ttl_days=30):
+        """
+        Initialize the SeenArticleIndex instance, creating the database if needed.
+
+        Args:
+            path (str): The path of the SQLite database.
+            ttl_days (float): Days after which an entry that was not seen again expires.
+        """
+        self.path = path
+        self.ttl_seconds = ttl_days * 24 * 3600
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.connection = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self.connection:
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS seen_articles ("
+                " url TEXT NOT NULL,"
+                " content_hash TEXT NOT NULL,"
+                " first_seen REAL NOT NULL,"
+                " last_seen REAL NOT NULL,"
+                " PRIMARY KEY (url, content_hash))")
+            self.connection.execute(
+                "CREATE INDEX IF NOT EXISTS seen_articles_last_seen"
+                " ON seen_articles (last_seen)")
+
+    @staticmethod
+    def article_key(url, title, published):
+        """
+        Build the key of an article.
+
+        Args:
+            url (str): The article URL, or None.
+            title (str): The article title.
+            published (str): The publication date, normalized so that it does not
+                change between runs.
+
+        Returns:
+            tuple: The URL and the hash of the title and date.
+        """
+        content = f"{title}\x00{published}".encode("utf-8")
+        return url or "", hashlib.sha1(content).hexdigest()
+
+    def seen_keys(self, keys):
+        """
+        Find which of the keys are in the index.
+
+        Args:
+            keys (list): Article keys, see ``article_key``.
+
+        Returns:
+            set: The keys that were already seen.
+        """
+        urls = sorted({url for url, _ in keys})
+        if not urls:
+            return set()
+        placeholders = ",".join("?" * len(urls))
+        with self._lock:
+            rows = self.connection.execute(
+                f"SELECT url, content_hash FROM seen_articles WHERE url IN ({placeholders})",
+                urls).fetchall()
+        return set(rows) & set(keys)
+
+    def mark_seen(self, keys):
+        """
+        Add the keys to the index, or refresh their last seen time.
+
+        Args:
+            keys (list): Article keys, see ``article_key``.
+        """
+        if not keys:
+            return
+        now = time.time()
+        with self._lock, self.connection:
+            self.connection.executemany(
+                "INSERT INTO seen_articles (url, content_hash, first_seen, last_seen)"
+                " VALUES (?, ?, ?, ?)"
+                " ON CONFLICT (url, content_hash) DO UPDATE SET last_seen = excluded.last_seen",
+                [(url, content_hash, now, now) for url, content_hash in keys])
+
+    def expire(self):
+        """
+        Remove the entries that were not seen within the TTL.
+
+        Returns:
+            int: The number of removed entries.
+        """
+        with self._lock, self.connection:
+            removed = self.connection.execute(
+                "DELETE FROM seen_articles WHERE last_seen < ?",
+                (time.time() - self.ttl_seconds,)).rowcount
+        if removed:
+            logging.info(f"Expired {removed} entries from the seen-article index")
+        return removed
+
+    def compact(self):
+        """
+        Expire old entries and give the space they used back to the file system.
+
+        The database is only rewritten once at least a quarter of its pages are free,
+        so calling this after every run stays cheap.
+        """
+        self.expire()
+        with self._lock:
+            page_count = self.connection.execute("PRAGMA page_count").fetchone()[0]
+            free_pages = self.connection.execute("PRAGMA freelist_count").fetchone()[0]
+            if page_count and free_pages * 4 >= page_count:
+                try:
+                    self.connection.execute("VACUUM")
+                    logging.info(f"Compacted the seen-article index, {free_pages} pages freed")
+                except sqlite3.OperationalError as e:
+                    # Another process is using the index, the next run will compact it
+                    logging.warning(f"Could not compact the seen-article index: {e}")
+
+    def close(self):
+        """
+        Close the database.
+        """
+        self.connection.close()
@@ -0,0 +1,354 @@
+import csv
+import logging
+import os
+from itertools import islice
+
+from openpyxl import Workbook, load_workbook
+
+# Rows copied at a time when a sink is resumed by rewriting its file
+RESUME_CHUNK_SIZE = 1000
+
+
+class RowSink:
+    """
+    Base class of the row sinks, which write rows to a file as they arrive.
+
+    Rows are written chunk by chunk with ``write_rows`` so that the extracted data
+    never has to be held in memory as a whole. Sinks are context managers that close
+    the file on exit. Only ``CsvSink`` leaves a readable file behind when the process
+    dies before ``close``: Excel and Parquet files are only valid once closed.
+    """
+
+    extension = None
+
+    def __init__(self, path, header):
+        """
+        Initialize the sink and create its file.
+
+        Args:
+            path (str): The path of the file, without extension.
+            header (list): The column names.
+        """
+        self.path = f"{path}.{self.extension}"
+        self.header = header
+        self.rows_written = 0
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+
+    def write_rows(self, rows):
+        """
+        Write a chunk of rows.
+
+        Args:
+            rows (list): The rows, each a list matching the header.
+        """
+        if not rows:
+            return
+        self._write(rows)
+        self.rows_written += len(rows)
+
+    def _write(self, rows):
+        raise NotImplementedError
+
+    def state(self):
+        """
+        Describe what was written, for a checkpoint to resume the file from.
+
+        Returns:
+            dict: The ``rows_written``, see ``resume``.
+        """
+        return {"rows_written": self.rows_written}
+
+    @classmethod
+    def read_rows(cls, path):
+        """
+        Read the rows of a finished file, header excluded.
+
+        Args:
+            path (str): The path of the file, with extension.
+
+        Returns:
+            iterator: The rows, each a list.
+        """
+        raise NotImplementedError
+
+    @classmethod
+    def can_resume(cls, path, state):
+        """
+        Check whether the file of an interrupted run still holds the rows described by
+        a checkpointed ``state``, see ``resume``.
+
+        Args:
+            path (str): The path of the file, without extension.
+            state (dict): The ``state`` of the sink when it was checkpointed.
+
+        Returns:
+            bool: True if the file can be resumed.
+        """
+        try:
+            rows = islice(cls.read_rows(f"{path}.{cls.extension}"), state["rows_written"])
+            return sum(1 for _ in rows) == state["rows_written"]
+        except Exception:
+            return False
+
+    @classmethod
+    def resume(cls, path, header, state):
+        """
+        Reopen the file of an interrupted run, keeping the rows described by a
+        checkpointed ``state`` and dropping any written after it.
+
+        The old file must be finished (closed): its first ``rows_written`` rows are
+        streamed into a new file at the same path, which stays open for more rows.
+
+        Args:
+            path (str): The path of the file, without extension.
+            header (list): The column names.
+            state (dict): The ``state`` of the sink when it was checkpointed.
+
+        Returns:
+            RowSink: The opened sink.
+
+        Raises:
+            OSError: If the old file is missing.
+            ValueError: If it holds fewer rows than the state.
+        """
+        old_path = f"{path}.{cls.extension}"
+        partial_path = f"{path}.partial.{cls.extension}"
+        os.replace(old_path, partial_path)
+        sink = cls(path, header)
+        try:
+            rows = islice(cls.read_rows(partial_path), state["rows_written"])
+            while chunk := list(islice(rows, RESUME_CHUNK_SIZE)):
+                sink.write_rows(chunk)
+            if sink.rows_written < state["rows_written"]:
+                raise ValueError(f"{old_path} holds {sink.rows_written} rows, the checkpoint "
+                                 f"expects {state['rows_written']}")
+        except Exception:
+            sink.close()
+            os.replace(partial_path, old_path)
+            raise
+        os.remove(partial_path)
+        logging.info(f"Resumed {sink.path} with {sink.rows_written} rows")
+        return sink
+
+    def close(self):
+        """
+        Finish the file.
+        """
+        logging.info(f"Wrote {self.rows_written} rows to {self.path}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class XlsxSink(RowSink):
+    """
+    Write rows to an Excel file with openpyxl's write-only mode.
+
+    Write-only workbooks stream rows to a temporary file instead of keeping a cell
+    object per value in memory, so memory use stays flat for large sheets. The file is
+    only written by ``close``.
+    """
+
+    extension = "xlsx"
+
+    def __init__(self, path, header):
+        super().__init__(path, header)
+        self.workbook = Workbook(write_only=True)
+        self.worksheet = self.workbook.create_sheet("Sheet")
+        self.worksheet.append(header)
+
+    def _write(self, rows):
+        for row in rows:
+            self.worksheet.append(row)
+
+    def close(self):
+        self.workbook.save(self.path)
+        super().close()
+
+    @classmethod
+    def read_rows(cls, path):
+        workbook = load_workbook(path, read_only=True)
+        try:
+            rows = workbook.worksheets[0].iter_rows(values_only=True)
+            next(rows, None)
+            for row in rows:
+                yield list(row)
+        finally:
+            workbook.close()
+
+
+class CsvSink(RowSink):
+    """
+    Write rows to a CSV file, flushed after every chunk.
+    """
+
+    extension = "csv"
+
+    def __init__(self, path, header):
+        super().__init__(path, header)
+        self.file = open(self.path, "w", newline="", encoding="utf-8")
+        self.writer = csv.writer(self.file)
+        self.writer.writerow(header)
+
+    def _write(self, rows):
+        self.writer.writerows(rows)
+        self.file.flush()
+
+    def state(self):
+        """
+        Describe what was written, for a checkpoint to resume the file from.
+
+        Returns:
+            dict: The ``rows_written`` and the ``offset`` of the end of the file.
+        """
+        return {**super().state(), "offset": self.file.tell()}
+
+    @classmethod
+    def read_rows(cls, path):
+        with open(path, newline="", encoding="utf-8") as csv_file:
+            rows = csv.reader(csv_file)
+            next(rows, None)
+            yield from rows
+
+    @classmethod
+    def can_resume(cls, path, state):
+        full_path = f"{path}.{cls.extension}"
+        if "offset" in state and os.path.exists(full_path):
+            return os.path.getsize(full_path) >= state["offset"]
+        return super().can_resume(path, state)
+
+    @classmethod
+    def resume(cls, path, header, state):
+        """
+        Reopen the file of an interrupted run, see ``RowSink.resume``.
+
+        Every chunk is flushed, so the file of a run that died is complete up to the
+        checkpointed offset: it is cut there and appended to in place.
+        """
+        sink = cls.__new__(cls)
+        RowSink.__init__(sink, path, header)
+        if "offset" not in state or os.path.getsize(sink.path) < state["offset"]:
+            return super().resume(path, header, state)
+        sink.file = open(sink.path, "r+", newline="", encoding="utf-8")
+        sink.file.seek(state["offset"])
+        sink.file.truncate()
+        sink.writer = csv.writer(sink.file)
+        sink.rows_written = state["rows_written"]
+        logging.info(f"Resumed {sink.path} with {sink.rows_written} rows")
+        return sink
+
+    def close(self):
+        self.file.close()
+        super().close()
+
+
+class ParquetSink(RowSink):
+    """
+    Write rows to a Parquet file, one row group per chunk.
+
+    Needs the optional ``pyarrow`` package. The column types are taken from the first
+    chunk and every later chunk is cast to them. The file footer is only written by
+    ``close``, so an unclosed file cannot be read.
+    """
+
+    extension = "parquet"
+
+    def __init__(self, path, header):
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError as e:
+            raise ImportError(
+                "The parquet output format needs the 'pyarrow' package to be installed") from e
+        super().__init__(path, header)
+        self.pyarrow = pyarrow
+        self.writer_class = pyarrow.parquet.ParquetWriter
+        self.writer = None
+
+    def _write(self, rows):
+        columns = {name: [row[index] for row in rows] for index, name in enumerate(self.header)}
+        table = self.pyarrow.table(columns)
+        if self.writer is None:
+            self.writer = self.writer_class(self.path, table.schema)
+        else:
+            table = table.cast(self.writer.schema)
+        self.writer.write_table(table)
+
+    def close(self):
+        if self.writer is None:
+            # No rows were written, still leave a valid file with the header columns
+            table = self.pyarrow.table({name: self.pyarrow.array([], self.pyarrow.string())
+                                        for name in self.header})
+            self.writer = self.writer_class(self.path, table.schema)
+        self.writer.close()
+        super().close()
+
+    @classmethod
+    def read_rows(cls, path):
+        import pyarrow.parquet
+        for batch in pyarrow.parquet.ParquetFile(path).iter_batches(RESUME_CHUNK_SIZE):
+            columns = batch.to_pydict()
+            yield from (list(row) for row in zip(*columns.values()))
+
+
+SINK_TYPES = {
+    "xlsx": XlsxSink,
+    "csv": CsvSink,
+    "parquet": ParquetSink,
+}
+
+
+def sink_type_of(output_format):
+    """
+    Get the row sink class of an output format.
+
+    Args:
+        output_format (str): "xlsx", "csv" or "parquet".
+
+    Returns:
+        type: The ``RowSink`` subclass.
+
+    Raises:
+        ValueError: If the output format is unknown.
+    """
+    try:
+        return SINK_TYPES[output_format]
+    except KeyError:
+        raise ValueError(
+            f"Unknown output format '{output_format}', expected one of {tuple(SINK_TYPES)}")
+
+
+def open_sink(output_format, path, header, resume_state=None):
+    """
+    Open the row sink of an output format.
+
+    A new sink first removes the file left at its path by an earlier run: Excel and
+    Parquet sinks only write their file on close, and until then a stale file of
+    another run could pass for this one's when a checkpoint is resumed.
+
+    Args:
+        output_format (str): "xlsx", "csv" or "parquet".
+        path (str): The path of the file, without extension.
+        header (list): The column names.
+        resume_state (dict): The checkpointed ``state`` of the sink of an interrupted
+            run, to resume its file instead of starting a new one, see
+            ``RowSink.resume``.
+
+    Returns:
+        RowSink: The opened sink.
+
+    Raises:
+        ValueError: If the output format is unknown.
+    """
+    sink_type = sink_type_of(output_format)
+    if resume_state:
+        return sink_type.resume(path, header, resume_state)
+    try:
+        os.remove(f"{path}.{sink_type.extension}")
+        logging.info(f"Removed the output file of an earlier run: {path}.{sink_type.extension}")
+    except FileNotFoundError:
+        pass
+    return sink_type(path, header)
@@ -1,54 +1,340 @@
+import asyncio
 import logging
+import os
+import sys
+import time
 from dotenv import load_dotenv
 from RPA.Robocorp.WorkItems import WorkItems, State
 from ExtendedSelenium import ExtendedSelenium
+from browser_pool import BrowserSessionPool
+from checkpoint import RunCheckpoint
+from sinks import sink_type_of
+from dates import DateNormalizer
+from fanout import FanOutRunner, jobs_from_work_item, write_merged_rows
+from pipeline import SearchPipeline
 
 load_dotenv()
-logging.basicConfig(format='%(asctime)s - %(levelname)s - %(message)s')
+logging.basicConfig(format='%(asctime)s - %(levelname)s - %(message)s', level=logging.INFO)
+
+# The news website, overridable to run against a local stand-in (see benchmarks/)
+HOME_URL = os.getenv("NEWS_SITE_URL", "https://apnews.com/")
+
+
+def read_search_settings(work_item, browser):
+    """
+    Read the search settings of the current input work item.
+
+    Also applies the work item's screenshot policy to the browser, and starts its run
+    clock, which the relative article dates and the ``months`` window are resolved
+    against.
+
+    Args:
+        work_item (WorkItems): The work items library with an active input work item.
+        browser (ExtendedSelenium): The browser used for the flow.
+
+    Returns:
+        dict: The ``search_phrase``, ``news_category``, ``max_pages`` and ``since``
+        arguments of the search. ``since`` is the later of the ``since`` (ISO 8601)
+        and ``months`` (calendar months, the current one included) work item
+        variables.
+    """
+    browser.start_run()
+    browser.set_screenshot_policy(work_item.get_work_item_variable(
+        "screenshot_policy", os.getenv("SCREENSHOT_POLICY", "all")))
+    return {
+        "search_phrase": work_item.get_work_item_variable("search_phrase", "COVID"),
+        "news_category": work_item.get_work_item_variable("news_category", "Stories"),
+        "max_pages": int(work_item.get_work_item_variable("max_pages", 1)),
+        "since": browser.date_normalizer.window_start(
+            months=work_item.get_work_item_variable("months", None),
+            since=work_item.get_work_item_variable("since", None)),
+    }
+
+
+def download_work_item_file(work_item, path):
+    """
+    Download a file of the current input work item, named after the path's basename.
+
+    Args:
+        work_item (WorkItems): The work items library with an active input work item.
+        path (str): Where to save the file.
+
+    Returns:
+        bool: True if the work item has the file and it was downloaded.
+    """
+    name = os.path.basename(path)
+    try:
+        if name not in work_item.list_work_item_files():
+            return False
+        work_item.get_work_item_file(name, path)
+        return True
+    except Exception as e:
+        logging.warning(f"Failed to download {name} from the work item: {e}")
+        return False
+
+
+def open_checkpoint(work_item, browser, settings):
+    """
+    Give the browser the checkpoint of the current input work item.
+
+    The checkpoint is saved in the output directory after every results page, and
+    attached to the work item with the output file when it fails, so a retry resumes
+    from them even on another machine. Local files, e.g. of a killed run, are
+    preferred over the attached ones. Does nothing when the ``RUN_CHECKPOINTS`` env
+    variable is "false".
+
+    Args:
+        work_item (WorkItems): The work items library with an active input work item.
+        browser (ExtendedSelenium): The browser used for the flow.
+        settings (dict): The search settings, see ``read_search_settings``.
+    """
+    if os.getenv("RUN_CHECKPOINTS", "true").lower() != "true":
+        browser.use_checkpoint(None)
+        return
+    path = browser.output_path(RunCheckpoint.FILENAME)
+    if not os.path.exists(path) and download_work_item_file(work_item, path):
+        # The output file the checkpoint resumes was attached along with it
+        download_work_item_file(work_item, browser.output_path(
+            f"news_data.{sink_type_of(browser.output_format).extension}"))
+    since = settings["since"]
+    browser.use_checkpoint(RunCheckpoint.load(path, {
+        "work_item_id": work_item.current.id,
+        "output_format": browser.output_format,
+        "search_phrase": settings["search_phrase"],
+        "news_category": settings["news_category"],
+        "since": since.isoformat() if since else None,
+    }))
+
+
+def complete_checkpoint(work_item, browser):
+    """
+    Delete the checkpoint of a completed work item, locally and from the work item.
+
+    Args:
+        work_item (WorkItems): The work items library with an active input work item.
+        browser (ExtendedSelenium): The browser used for the flow.
+    """
+    if browser.checkpoint is None:
+        return
+    browser.checkpoint.discard()
+    browser.use_checkpoint(None)
+    try:
+        if RunCheckpoint.FILENAME in work_item.list_work_item_files():
+            work_item.remove_work_item_file(RunCheckpoint.FILENAME)
+    except Exception as e:
+        logging.warning(f"Failed to remove the work item checkpoint: {e}")
+
+
+def release_failed_work_item(work_item, browser):
+    """
+    Release the current input work item as 'FAILED', keeping the artifacts gathered
+    so far and the checkpoint to resume from.
+
+    Args:
+        work_item (WorkItems): The work items library.
+        browser (ExtendedSelenium): The browser used for the flow.
+    """
+    if work_item.current:
+        browser.save_screenshot_to_work_item(
+            filename=browser.output_path("failure_the_process.png"), failure=True)
+        if browser.checkpoint is not None and os.path.exists(browser.checkpoint.path):
+            browser.stage_work_item_file(browser.checkpoint.path, auto_flush=False)
+        try:
+            browser.flush_work_item_files()
+        except Exception as flush_error:
+            logging.error(f"Failed to flush staged files: {flush_error}")
+            browser.discard_work_item_files()
+        work_item.release_input_work_item(State.FAILED)
+
+
+def process_work_item(work_item, browser):
+    """
+    Run the news extraction flow for the current input work item.
+
+    Searches for the work item's phrase on the news website, selects the category,
+    sorts the results and extracts the data. The work item is marked as 'DONE' upon
+    successful completion or 'FAILED' in case of errors, keeping the artifacts
+    gathered so far. A retried work item resumes from the checkpoint of its failed
+    run, see ``open_checkpoint``.
+
+    Args:
+        work_item (WorkItems): The work items library with an active input work item.
+        browser (ExtendedSelenium): The browser used for the flow.
+    """
+    try:
+        settings = read_search_settings(work_item, browser)
+        open_checkpoint(work_item, browser, settings)
+        browser.run_news_search(HOME_URL, **settings)
+        browser.save_screenshot_to_work_item(
+            filename=browser.output_path("step_5_final_screenshot.png"), key_step=True)
+        complete_checkpoint(work_item, browser)
+        browser.flush_work_item_files()
+        work_item.release_input_work_item(State.DONE)
+    except Exception as e:
+        logging.error(f"An error occurred: {e}", exc_info=True)
+        release_failed_work_item(work_item, browser)
+
+
+async def process_input_work_item_async(work_item, browser):
+    """
+    Load the input work item and run the news extraction flow as a ``SearchPipeline``.
+
+    Chrome is started while the input work item is loaded, and the output file and
+    images are uploaded while the browser keeps crawling. The work item is released
+    as in ``process_work_item``.
+
+    Args:
+        work_item (WorkItems): The work items library.
+        browser (ExtendedSelenium): The browser used for the flow.
+
+    Returns:
+        bool: False if there was no input work item to process.
+    """
+    pipeline = SearchPipeline(browser, queue_size=int(os.getenv("PIPELINE_QUEUE_SIZE", "2")))
+    try:
+        loaded, _ = await asyncio.gather(
+            pipeline.on_work_item(work_item.get_input_work_item),
+            pipeline.on_browser(browser.open_browser_for, HOME_URL))
+        if not loaded or not work_item.current:
+            logging.error("No valid input work item or no active work item. Exiting process.")
+            return False
+        settings = read_search_settings(work_item, browser)
+        await pipeline.on_work_item(open_checkpoint, work_item, browser, settings)
+        await pipeline.run(HOME_URL, **settings)
+        await pipeline.on_browser(
+            browser.save_screenshot_to_work_item,
+            filename=browser.output_path("step_5_final_screenshot.png"), key_step=True)
+        await pipeline.on_work_item(complete_checkpoint, work_item, browser)
+        await pipeline.on_work_item(browser.flush_work_item_files)
+        work_item.release_input_work_item(State.DONE)
+    except Exception as e:
+        logging.error(f"An error occurred: {e}", exc_info=True)
+        release_failed_work_item(work_item, browser)
+    finally:
+        pipeline.close()
+    return True
 
 
 def the_process():
     """
     Main function to perform the web automation process.
 
-    This function retrieves input work items, uses a custom Selenium browser to perform
-    web interactions such as searching for a term on a news website, selecting a category,
-    sorting results, and extracting data. It also handles exceptions and ensures that the
-    browser is properly closed after execution. The work item is marked as 'DONE' upon
-    successful completion or 'FAILED' in case of errors.
+    This function retrieves one input work item and processes it with a custom Selenium
+    browser, see ``process_work_item``. It ensures that the browser is properly closed
+    after execution, and writes the run profile (see ``RunProfiler``) and its summary.
+    With the ``ASYNC_PIPELINE`` env variable, the work item is processed with
+    ``process_input_work_item_async`` instead.
 
     Raises:
         Exception: If an error occurs during the process, it is logged, and the work item is
                    marked as 'FAILED'.
     """
+    started = time.monotonic()
     work_item = WorkItems()
     browser = ExtendedSelenium(work_item=work_item)
+    processed = False
     try:
+        if os.getenv("ASYNC_PIPELINE", "false").lower() == "true":
+            processed = asyncio.run(process_input_work_item_async(work_item, browser))
+            return
         if not work_item.get_input_work_item() or not work_item.current:
             logging.error(
                 "No valid input work item or no active work item. Exiting process.")
             return
-        search_phrase = work_item.get_work_item_variable(
-            "search_phrase", "COVID")
-        news_category = work_item.get_work_item_variable(
-            "news_category", "Stories")
-        browser.open_site(url="https://apnews.com/")
-        browser.accept_cookies()  # Accept the cookies if present
-        browser.click_search_button()
-        browser.type_and_submit_search_query(search_phrase)
-        browser.click_and_select_category(news_category)
-        browser.select_sort_by_newest()
-        browser.extract_news_data_and_store()
-        browser.save_screenshot_to_work_item(
-            filename="output/step_5_final_screenshot.png")
-        work_item.release_input_work_item(State.DONE)
-    except Exception as e:
-        logging.error(f"An error occurred: {e}", exc_info=True)
-        if work_item.current:
-            work_item.release_input_work_item(State.FAILED)
+        process_work_item(work_item, browser)
+        processed = True
     finally:
         browser.close_all_browsers()
+        if processed:
+            elapsed = time.monotonic() - started
+            logging.info(f"One-shot mode processed 1 work item in {elapsed:.1f}s "
+                         f"({60 / elapsed:.2f} items/minute)")
+        browser.profiler.stop_sampling()
+        profile_path = browser.profiler.write(browser.output_path("run_profile.json"))
+        logging.info(f"Run profile written to {profile_path}\n{browser.profiler.summary()}")
+
+
+def the_worker():
+    """
+    Long-running worker that processes every input work item in one process.
+
+    Work items are processed one after another, the work items library holding a
+    single current item, with a warm browser taken from a ``BrowserSessionPool``, so
+    Chrome and the driver are not started again for every work item. The browser is
+    recycled according to the ``WORKER_MAX_ITEMS_PER_BROWSER`` and
+    ``WORKER_BROWSER_MEMORY_LIMIT_MB`` env variables.
+    """
+    started = time.monotonic()
+    work_item = WorkItems()
+    pool = BrowserSessionPool(
+        factory=lambda: ExtendedSelenium(work_item=work_item),
+        max_items_per_browser=int(os.getenv("WORKER_MAX_ITEMS_PER_BROWSER", "50")),
+        memory_limit_mb=int(os.getenv("WORKER_BROWSER_MEMORY_LIMIT_MB", "1024")),
+        home_url=HOME_URL)
+
+    def process_next_work_item():
+        with pool.session() as browser:
+            process_work_item(work_item, browser)
+
+    processed = 0
+    try:
+        processed = len(work_item.for_each_input_work_item(process_next_work_item))
+    finally:
+        pool.close()
+        elapsed = time.monotonic() - started
+        logging.info(f"Worker mode processed {processed} work items in {elapsed:.1f}s "
+                     f"({processed * 60 / elapsed:.2f} items/minute)")
+
+
+def the_fanout():
+    """
+    Run the search jobs of every input work item over a pool of browser processes.
+
+    Each work item carries one or more (search phrase, news category) jobs, see
+    ``jobs_from_work_item``. The jobs are spread over ``FANOUT_WORKERS`` worker
+    processes, each owning one browser for the whole run, and their rows are merged
+    into one Excel file attached to the work item together with the jobs' files.
+    """
+    work_item = WorkItems()
+    output_root = os.path.join("output", "fanout")
+    runner = FanOutRunner(
+        workers=int(os.getenv("FANOUT_WORKERS", "2")), home_url=HOME_URL,
+        output_root=output_root)
+    merged_count = 0
+
+    def process_next_work_item():
+        nonlocal merged_count
+        try:
+            jobs = jobs_from_work_item(work_item)
+            max_pages = int(work_item.get_work_item_variable("max_pages", 1))
+            since = DateNormalizer().window_start(
+                months=work_item.get_work_item_variable("months", None),
+                since=work_item.get_work_item_variable("since", None))
+            rows, files = runner.run(jobs, max_pages=max_pages, since=since)
+            merged_count += 1
+            merged_path = write_merged_rows(
+                rows, os.path.join("output", f"news_data_merged_{merged_count}.xlsx"))
+            # Work item files are keyed by name, and every job writes the same file
+            # names, so the jobs' files are named after their worker and job directory
+            for path in files:
+                work_item.add_work_item_file(
+                    path=path, name=os.path.relpath(path, output_root).replace(os.sep, "_"))
+            work_item.add_work_item_file(path=merged_path)
+            work_item.save_work_item()
+            work_item.release_input_work_item(State.DONE)
+        except Exception as e:
+            logging.error(f"An error occurred: {e}", exc_info=True)
+            if work_item.current:
+                work_item.release_input_work_item(State.FAILED)
+
+    with runner:
+        work_item.for_each_input_work_item(process_next_work_item, return_results=False)
 
 
 if __name__ == "__main__":
-    the_process()
+    if len(sys.argv) > 1 and sys.argv[1] == "worker":
+        the_worker()
+    elif len(sys.argv) > 1 and sys.argv[1] == "fanout":
+        the_fanout()
+    else:
+        the_process()
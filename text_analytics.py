@@ -0,0 +1,87 @@
+import bisect
+import re
+from itertools import accumulate
+
+MONEY_PATTERN = re.compile(r'\$\d+(?:,\d{3})*(?:\.\d{2})?|(?:\d+\s(?:dollars|USD))', re.IGNORECASE)
+
+# Whether a lowercased text matches ``MONEY_PATTERN`` only depends on "$" followed by a
+# digit, or a digit and a space followed by "dollars" or "usd". The batch scan finds
+# these literals with ``str.find`` and only runs this pattern where one occurs.
+MONEY_LITERALS = {"$": 0, "dollars": 2, "usd": 2}
+MONEY_AT_LITERAL = re.compile(r'\$\d|\d\s(?:dollars|usd)')
+
+# Joins the texts of a batch; neither a word nor a space character, so no phrase,
+# word boundary or money amount can run across two texts
+TEXT_SEPARATOR = "\x00"
+
+
+class TextAnalyzer:
+    """
+    Count search phrases and detect money in whole batches of articles.
+
+    The phrases are compiled once into a single alternation, longest phrase first, and
+    every batch is lowercased and scanned as one joined string, so the regex engine runs
+    once per batch instead of once per phrase and article. Occurrences are counted
+    without overlap, like ``str.count``, so where phrases overlap (e.g. "covid" and
+    "covid-19") only the longest one counts.
+
+    Example:
+        analyzer = TextAnalyzer(["covid"], whole_words=True)
+        analyzer.analyze([("COVID cases", "Covid-19 costs $1,000")])  # [(2, True)]
+    """
+
+    def __init__(self, phrases, whole_words=False):
+        """
+        Initialize the TextAnalyzer instance and compile its phrase matcher.
+
+        Args:
+            phrases (list): The search phrases, matched ignoring case.
+            whole_words (bool): Only count phrases that are not part of a longer word,
+                e.g. "covid" in "Covid-19" but not in "covidiot". Otherwise every
+                substring occurrence is counted.
+        """
+        self.phrases = sorted(
+            {phrase.lower() for phrase in phrases if phrase}, key=len, reverse=True)
+        self.whole_words = whole_words
+        self.phrase_pattern = None
+        if self.phrases:
+            alternation = "|".join(re.escape(phrase) for phrase in self.phrases)
+            if whole_words:
+                # Lookarounds instead of \b, so phrases starting or ending with
+                # punctuation (e.g. "$5", "U.S.") get correct boundaries too
+                alternation = rf"(?<!\w)(?:{alternation})(?!\w)"
+            self.phrase_pattern = re.compile(alternation)
+
+    def analyze(self, articles):
+        """
+        Count the phrases and detect money for a batch of articles.
+
+        Args:
+            articles (list): (title, description) pairs.
+
+        Returns:
+            list: A (phrase count, contains money) tuple per article.
+        """
+        if not articles:
+            return []
+        joined = TEXT_SEPARATOR.join(text for article in articles for text in article).lower()
+        # Offset where the text after each lowercased text starts
+        ends = list(accumulate(len(text) + 1 for text in joined.split(TEXT_SEPARATOR)))
+
+        counts = [0] * len(articles)
+        if self.phrase_pattern:
+            text_index = 0
+            for match in self.phrase_pattern.finditer(joined):
+                # Matches come in order, so the owning text is found by walking forward
+                while ends[text_index] <= match.start():
+                    text_index += 1
+                counts[text_index // 2] += 1
+
+        contains_money = [False] * len(articles)
+        for literal, offset in MONEY_LITERALS.items():
+            position = joined.find(literal)
+            while position != -1:
+                if position >= offset and MONEY_AT_LITERAL.match(joined, position - offset):
+                    contains_money[bisect.bisect_right(ends, position) // 2] = True
+                position = joined.find(literal, position + 1)
+        return list(zip(counts, contains_money))